@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Decoder throughput microbenchmark.
+
+Times InstructionDecoder.decode and decode_many over a batch of random
+32-bit words (expanded to bit arrays up front, so only decoding is timed).
+Run it before and after touching the decode hot path:
+
+    python bench_decoder.py            # 100,000 words, best of 5
+    python bench_decoder.py -n 1000000 -r 3
+"""
+
+import argparse
+import random
+import timeit
+
+from riscsim.cpu.decoder import InstructionDecoder
+from riscsim.utils.bit_utils import int_to_bits_unsigned
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('-n', '--count', type=int, default=100_000,
+                        help='number of instruction words to decode per run')
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help='number of timed runs (best is reported)')
+    parser.add_argument('--seed', type=int, default=440,
+                        help='random seed for the instruction words')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    words = [int_to_bits_unsigned(rng.getrandbits(32), 32) for _ in range(args.count)]
+    decoder = InstructionDecoder()
+
+    cases = {
+        'decode': lambda: [decoder.decode(word) for word in words],
+        'decode_many': lambda: decoder.decode_many(words),
+    }
+
+    print(f"Decoding {args.count:,} random words, best of {args.repeat}")
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        rate = args.count / best
+        print(f"   {name:<12} {best:8.3f} s   {rate:12,.0f} instr/s   "
+              f"{1e6 / rate:6.2f} us/instr")
+
+
+if __name__ == '__main__':
+    main()
@@ -137,7 +137,7 @@ from riscsim.cpu.registers import RegisterFile
 from riscsim.cpu.alu import alu
 from riscsim.cpu.shifter import shifter
 from riscsim.cpu.mdu import mdu_mul, mdu_div
-from riscsim.cpu.fpu import fadd_f32, fmul_f32
+from riscsim.cpu.fpu import FPResult, fadd_f32_into, fmul_f32_into
 
 
 class ControlUnit:
@@ -195,6 +195,9 @@ class ControlUnit:
         self.fpu_result = [0] * 32
         self.writeback_data = [0] * 32  # Final result to write back
         
+        # FPU output packet, refilled in place by every FP operation
+        self._fpu_packet = FPResult.empty()
+        
         # Performance counters
         self.total_cycles = 0           # Total clock cycles executed
         self.instruction_count = 0      # Total instructions completed
@@ -651,21 +654,22 @@ class ControlUnit:
                 op_b = self._select_operand_b()
                 
                 # Call appropriate FPU function based on operation
+                fpu_result = self._fpu_packet
                 if self.current_op in ['FADD', 'FSUB']:
                     # For FSUB, negate operand B
                     if self.current_op == 'FSUB':
                         # Flip sign bit of B
                         op_b = [1 - op_b[0]] + op_b[1:]
-                    fpu_result = fadd_f32(op_a, op_b, self.signals.round_mode)
+                    fadd_f32_into(op_a, op_b, fpu_result, self.signals.round_mode)
                 elif self.current_op in ['FMUL']:
-                    fpu_result = fmul_f32(op_a, op_b, self.signals.round_mode)
+                    fmul_f32_into(op_a, op_b, fpu_result, self.signals.round_mode)
                 else:
                     # Default to add for unsupported ops
-                    fpu_result = fadd_f32(op_a, op_b, self.signals.round_mode)
+                    fadd_f32_into(op_a, op_b, fpu_result, self.signals.round_mode)
                 
-                # Store result
-                self.fpu_result = fpu_result['result']
-                self.operation_data['fpu_result_dict'] = fpu_result
+                # Store result and flags (copied out: the packet is reused next op)
+                self.fpu_result = fpu_result.result.copy()
+                self.operation_data['fpu_flags'] = dict(fpu_result.flags)
                 self.operation_data['fpu_computed'] = True
                 
                 self._add_trace(f"FPU {self.current_op}: Computation complete in ALIGN stage")
@@ -1047,12 +1051,14 @@ class ControlUnit:
         if complete and self.is_idle():
             self.instruction_count += 1
         
+        fpu_flags = self.operation_data.get('fpu_flags')
+        
         return {
             'result': self.writeback_data.copy(),
             'cycles': cycles,
             'trace': self.get_trace(),
             'success': complete and self.is_idle(),
-            'flags': self.operation_data.get('fpu_result_dict', {}).get('flags', None)
+            'flags': dict(fpu_flags) if fpu_flags is not None else None
         }
     
     # ========== Phase 6: Unified Instruction Execution ==========
@@ -27,6 +27,7 @@ from typing import Dict, List, Optional
 from riscsim.cpu.memory import Memory
 from riscsim.cpu.registers import RegisterFile
 from riscsim.cpu.datapath import Datapath, CycleResult
+from riscsim.cpu.decoder import InstrType, Op
 from riscsim.utils.bit_utils import (
     bits_to_int_unsigned,
     int_to_bits_unsigned
@@ -158,7 +159,8 @@ class CPU:
         Load program from .hex file into instruction memory.
         
         The .hex file should contain 32-bit instructions in hexadecimal format,
-        one instruction per line (8 hex digits per line).
+        one instruction per line (8 hex digits per line). The loaded words
+        are decoded once up front so the run loop does not re-decode them.
         
         Args:
             hex_file_path: Path to .hex file to load
@@ -168,6 +170,7 @@ class CPU:
             ValueError: If hex file format is invalid
         """
         self.memory.load_program(hex_file_path)
+        self.datapath.predecode()
         
     def reset(self) -> None:
         """
@@ -182,7 +185,8 @@ class CPU:
         
         Does NOT clear memory (program remains loaded).
         """
-        # Reset PC
+        # Reset datapath (cycle count, halted), then PC to the program start
+        self.datapath.reset()
         pc_bits = int_to_bits_unsigned(self.pc_start, 32)
         self.datapath.fetch_unit.set_pc(pc_bits)
         
@@ -193,9 +197,6 @@ class CPU:
                 self.register_file.write_int_reg(i, zero_bits)
                 self.register_file.write_fp_reg(i, zero_bits)
         
-        # Reset datapath cycle count
-        self.datapath.cycle_count = 0
-        
         # Reset statistics
         self._instruction_mix = {}
         self._branch_taken_count = 0
@@ -226,7 +227,7 @@ class CPU:
             self._instruction_mix[mnemonic] = self._instruction_mix.get(mnemonic, 0) + 1
             
             # Track branch statistics
-            if result.decoded.instr_type == 'B':
+            if result.decoded.instr_type is InstrType.B:
                 if result.branch_taken:
                     self._branch_taken_count += 1
                 else:
@@ -284,7 +285,7 @@ class CPU:
             
             # Detect JAL x0, 0 (jump to same address, infinite loop)
             if next_pc == current_pc and cycle_result.decoded:
-                if cycle_result.decoded.mnemonic in ["JAL", "JALR"]:
+                if cycle_result.decoded.op in (Op.JAL, Op.JALR):
                     # JAL/JALR with rd=x0 (no return address) jumping to same PC = infinite loop
                     if cycle_result.decoded.rd == 0:
                         result.cycles = cycle_num + 1
@@ -352,7 +353,7 @@ class CPU:
             next_pc = bits_to_int_unsigned(next_pc_bits)
             
             if next_pc == current_pc:
-                if cycle_result.decoded and cycle_result.decoded.mnemonic == "JAL":
+                if cycle_result.decoded and cycle_result.decoded.op is Op.JAL:
                     if cycle_result.decoded.rd == 0:
                         result.cycles = cycle_num + 1
                         result.final_pc = current_pc
@@ -384,8 +385,7 @@ class CPU:
         if not (0 <= reg_num < 32):
             raise ValueError(f"Register number must be 0-31, got {reg_num}")
         
-        reg_bits = self.register_file.read_int_reg(reg_num)
-        return bits_to_int_unsigned(reg_bits)
+        return self.register_file.read_int_reg_int(reg_num)
         
     def set_register(self, reg_num: int, value: int) -> None:
         """
@@ -398,13 +398,15 @@ class CPU:
             value: 32-bit unsigned value to write
             
         Raises:
-            ValueError: If register number is out of range
+            ValueError: If register number is out of range or value is
+                negative
         """
         if not (0 <= reg_num < 32):
             raise ValueError(f"Register number must be 0-31, got {reg_num}")
+        if value < 0:
+            raise ValueError("Value must be non-negative")
         
-        value_bits = int_to_bits_unsigned(value, 32)
-        self.register_file.write_int_reg(reg_num, value_bits)
+        self.register_file.write_int_reg_int(reg_num, value)
         
     def get_memory_word(self, addr: int) -> int:
         """
@@ -546,11 +548,8 @@ class CPU:
         Returns:
             Dictionary mapping register number to unsigned value
         """
-        state = {}
-        for i in range(32):
-            reg_bits = self.register_file.read_int_reg(i)
-            state[i] = bits_to_int_unsigned(reg_bits)
-        return state
+        read = self.register_file.read_int_reg_int
+        return {i: read(i) for i in range(32)}
         
     def get_pc(self) -> int:
         """
@@ -16,11 +16,12 @@ completing within a single clock cycle.
 Convention: All bit arrays use MSB-at-index-0 convention.
 """
 
+from functools import lru_cache
 from typing import Optional, List
 from riscsim.cpu.memory import Memory
 from riscsim.cpu.registers import RegisterFile
-from riscsim.cpu.fetch import FetchUnit
-from riscsim.cpu.decoder import InstructionDecoder, DecodedInstruction
+from riscsim.cpu.fetch import FetchUnit, pc_plus_four
+from riscsim.cpu.decoder import InstructionDecoder, DecodedInstruction, Op
 from riscsim.cpu.control_signals import ControlSignals, ALU_OP_ADD, ALU_OP_SUB, ALU_OP_AND, ALU_OP_OR, ALU_OP_XOR, SH_OP_SLL, SH_OP_SRL, SH_OP_SRA
 from riscsim.cpu.alu import alu
 from riscsim.cpu.shifter import shifter
@@ -31,6 +32,96 @@ from riscsim.utils.bit_utils import (
 )
 
 
+# Reset PC, built once at import
+_PC_RESET = int_to_bits_unsigned(0x00000000, 32)
+
+# Op -> ALU opcode for instructions executed as one ALU operation.
+# Loads/stores/jumps use ADD for their address/target computation.
+_ALU_OPS = {
+    Op.ADD: ALU_OP_ADD, Op.ADDI: ALU_OP_ADD, Op.LW: ALU_OP_ADD, Op.SW: ALU_OP_ADD,
+    Op.AUIPC: ALU_OP_ADD, Op.JAL: ALU_OP_ADD, Op.JALR: ALU_OP_ADD,
+    Op.SUB: ALU_OP_SUB,
+    Op.AND: ALU_OP_AND, Op.ANDI: ALU_OP_AND,
+    Op.OR: ALU_OP_OR, Op.ORI: ALU_OP_OR,
+    Op.XOR: ALU_OP_XOR, Op.XORI: ALU_OP_XOR,
+}
+
+# Op -> shifter control [direction, arithmetic]
+_SHIFT_OPS = {
+    Op.SLL: [0, 0], Op.SLLI: [0, 0],
+    Op.SRL: [0, 1], Op.SRLI: [0, 1],
+    Op.SRA: [1, 1], Op.SRAI: [1, 1],
+}
+
+# Branch Op -> value of the ALU Z flag that takes the branch
+_BRANCH_TAKEN_ON_Z = {Op.BEQ: 1, Op.BNE: 0}
+
+# Op -> (alu_src_a, alu_src_b, mem_read, mem_write, branch, jump,
+#        rf_we, result_src). Unknown instructions get all zeros.
+_R_SIGNALS = (0, 0, 0, 0, 0, 0, 1, 0)      # rs2 operand, ALU writeback
+_I_SIGNALS = (0, 1, 0, 0, 0, 0, 1, 0)      # immediate operand, ALU writeback
+_JUMP_SIGNALS = (0, 1, 0, 0, 0, 1, 1, 2)   # link PC+4
+_NO_SIGNALS = (0, 0, 0, 0, 0, 0, 0, 0)
+_CONTROL_TABLE = {
+    **dict.fromkeys([Op.ADD, Op.SUB, Op.AND, Op.OR, Op.XOR,
+                     Op.SLL, Op.SRL, Op.SRA], _R_SIGNALS),
+    **dict.fromkeys([Op.ADDI, Op.ANDI, Op.ORI, Op.XORI,
+                     Op.SLLI, Op.SRLI, Op.SRAI], _I_SIGNALS),
+    Op.LW: (0, 1, 1, 0, 0, 0, 1, 1),
+    Op.SW: (0, 1, 0, 1, 0, 0, 0, 0),
+    Op.BEQ: (0, 0, 0, 0, 1, 0, 0, 0),
+    Op.BNE: (0, 0, 0, 0, 1, 0, 0, 0),
+    Op.JAL: _JUMP_SIGNALS,
+    Op.JALR: _JUMP_SIGNALS,
+    Op.LUI: _I_SIGNALS,                      # immediate already shifted
+    Op.AUIPC: (1, 1, 0, 0, 0, 0, 1, 0),      # PC + immediate
+}
+
+
+# Per-instruction execute handlers, specialized once at import from the
+# tables above. Each takes (src_a, src_b, rs1_data, rs2_data, decoded, pc)
+# and returns (alu_result, branch_taken).
+def _alu_handler(alu_op):
+    def execute(src_a, src_b, rs1_data, rs2_data, decoded, pc):
+        alu_result, _ = alu(src_a, src_b, alu_op)
+        return alu_result, False
+    return execute
+
+
+def _shift_handler(shift_op):
+    def execute(src_a, src_b, rs1_data, rs2_data, decoded, pc):
+        shift_amount = slice_bits(src_b, 27, 32)  # Lower 5 bits
+        return shifter(src_a, shift_amount, shift_op), False
+    return execute
+
+
+def _branch_handler(taken_on_z):
+    def execute(src_a, src_b, rs1_data, rs2_data, decoded, pc):
+        # Compare using ALU subtraction; flags is [N, Z, C, V]
+        _, flags = alu(rs1_data, rs2_data, ALU_OP_SUB)
+        # Branch target using ALU: PC + immediate
+        target, _ = alu(pc, decoded.immediate, ALU_OP_ADD)
+        return target, flags[1] == taken_on_z
+    return execute
+
+
+def _execute_lui(src_a, src_b, rs1_data, rs2_data, decoded, pc):
+    # Load upper immediate (already shifted into place by the decoder)
+    return decoded.immediate.copy(), False
+
+
+def _execute_nothing(src_a, src_b, rs1_data, rs2_data, decoded, pc):
+    return [0] * 32, False
+
+
+_EXECUTE_HANDLERS = {
+    **{op: _alu_handler(alu_op) for op, alu_op in _ALU_OPS.items()},
+    **{op: _shift_handler(shift_op) for op, shift_op in _SHIFT_OPS.items()},
+    **{op: _branch_handler(z) for op, z in _BRANCH_TAKEN_ON_Z.items()},
+    Op.LUI: _execute_lui,
+}
+
+
 class CycleResult:
     """Result of single cycle execution.
     
@@ -49,6 +140,9 @@ class CycleResult:
         cycle_num: Cycle number
     """
     
+    __slots__ = ('pc', 'instruction', 'decoded', 'signals', 'alu_result',
+                 'mem_data', 'writeback_data', 'branch_taken', 'cycle_num')
+    
     def __init__(self):
         self.pc: List[int] = [0] * 32
         self.instruction: List[int] = [0] * 32
@@ -103,6 +197,51 @@ class Datapath:
         self.fetch_unit = FetchUnit(memory, initial_pc=0x00000000)
         self.decoder = InstructionDecoder()
         self.cycle_count = 0
+        self.halted = False
+        
+        # Decode cache keyed by the raw instruction bit pattern. Decoding is
+        # a pure function of the word, so loops and repeated instructions
+        # reuse the first DecodedInstruction (treat it as read-only).
+        self._decode_cached = lru_cache(maxsize=4096)(self._decode_word)
+    
+    def _decode_word(self, word: tuple) -> DecodedInstruction:
+        """Decode one instruction given as a bit tuple (decode cache miss path)."""
+        return self.decoder.decode(list(word))
+    
+    def predecode(self) -> int:
+        """
+        Decode the loaded program image into the decode cache up front.
+        
+        Walks the words between memory.program_start and program_end so
+        that execute_cycle finds every instruction already decoded. Words
+        that change later (data, self-modifying code) simply miss and are
+        decoded on fetch as before.
+        
+        Returns:
+            Number of words decoded (0 if no program is loaded)
+        """
+        start, end = self.memory.program_start, self.memory.program_end
+        if start is None or end is None:
+            return 0
+        read_word = self.memory.read_word
+        decode = self._decode_cached
+        count = 0
+        for addr in range(start, end, 4):
+            decode(tuple(read_word(int_to_bits_unsigned(addr, 32))))
+            count += 1
+        return count
+    
+    def reset(self):
+        """
+        Return the datapath to its power-on state: PC = 0, cycle count = 0,
+        not halted.
+        
+        Memory and register contents are left alone; clear them separately
+        with Memory.clear() and RegisterFile.clear().
+        """
+        self.fetch_unit.set_pc(_PC_RESET)
+        self.cycle_count = 0
+        self.halted = False
         
     def execute_cycle(self) -> CycleResult:
         """
@@ -139,6 +278,72 @@ class Datapath:
         
         return result
     
+    def run_cycles(self, n: int, collect: bool = True) -> List[CycleResult]:
+        """
+        Execute up to n cycles in one call.
+        
+        Clears `halted` on entry; stops early, after executing it, at a
+        halt instruction (JAL x0, 0 - a jump to itself) and sets `halted`.
+        
+        Args:
+            n: Maximum number of cycles to execute
+            collect: Keep every CycleResult (default). When False, only
+                     the last cycle's result is kept, so long runs do not
+                     hold a per-cycle trace in memory.
+            
+        Returns:
+            List of CycleResult, one per executed cycle, or just the last
+            one when collect is False (empty if n is 0)
+        """
+        self.halted = False
+        execute = self.execute_cycle
+        is_halt = self._is_halt
+        results = []
+        append = results.append
+        result = None
+        for _ in range(n):
+            result = execute()
+            if collect:
+                append(result)
+            if is_halt(result):
+                self.halted = True
+                break
+        if not collect and result is not None:
+            append(result)
+        return results
+    
+    def run_until_halt(self, max_cycles: int = 10_000_000) -> int:
+        """
+        Execute until the program halts (JAL x0, 0) or max_cycles run out.
+        
+        No per-cycle results are kept; check `halted` afterwards to tell
+        a halt from running out of cycles on this call.
+        
+        Args:
+            max_cycles: Upper bound on the number of cycles to execute
+            
+        Returns:
+            Number of cycles executed, including the halt instruction
+        """
+        start = self.cycle_count
+        self.run_cycles(max_cycles, collect=False)
+        return self.cycle_count - start
+    
+    @staticmethod
+    def _is_halt(result: CycleResult) -> bool:
+        """
+        Check whether a cycle executed the halt idiom JAL x0, 0.
+        
+        Args:
+            result: CycleResult of the executed cycle
+            
+        Returns:
+            True if the instruction jumped to itself without linking
+        """
+        decoded = result.decoded
+        return (decoded.op is Op.JAL and not any(decoded.rd)
+                and not any(decoded.immediate))
+    
     def _fetch_stage(self, result: CycleResult) -> List[int]:
         """
         Fetch instruction from memory at current PC.
@@ -149,7 +354,7 @@ class Datapath:
         Returns:
             32-bit instruction
         """
-        result.pc = self.fetch_unit.get_pc().copy()
+        result.pc = self.fetch_unit.get_pc()
         instruction = self.fetch_unit.fetch()
         result.instruction = instruction.copy()
         return instruction
@@ -165,7 +370,7 @@ class Datapath:
         Returns:
             Tuple of (DecodedInstruction, ControlSignals)
         """
-        decoded = self.decoder.decode(instruction)
+        decoded = self._decode_cached(tuple(instruction))
         signals = self._generate_control_signals(decoded)
         
         result.decoded = decoded
@@ -204,64 +409,20 @@ class Datapath:
         else:
             alu_src_b = rs2_data.copy()
         
-        # Perform operation based on instruction type
-        alu_result = [0] * 32
-        branch_taken = False
-        
-        if decoded.mnemonic in ['ADD', 'ADDI', 'LW', 'SW', 'AUIPC', 'JAL', 'JALR']:
-            # Addition
-            alu_result, flags = alu(alu_src_a, alu_src_b, ALU_OP_ADD)
-        elif decoded.mnemonic == 'SUB':
-            # Subtraction
-            alu_result, flags = alu(alu_src_a, alu_src_b, ALU_OP_SUB)
-        elif decoded.mnemonic in ['AND', 'ANDI']:
-            # Bitwise AND
-            alu_result, flags = alu(alu_src_a, alu_src_b, ALU_OP_AND)
-        elif decoded.mnemonic in ['OR', 'ORI']:
-            # Bitwise OR
-            alu_result, flags = alu(alu_src_a, alu_src_b, ALU_OP_OR)
-        elif decoded.mnemonic in ['XOR', 'XORI']:
-            # Bitwise XOR
-            alu_result, flags = alu(alu_src_a, alu_src_b, ALU_OP_XOR)
-        elif decoded.mnemonic in ['SLL', 'SLLI']:
-            # Shift left logical
-            shift_amount = slice_bits(alu_src_b, 27, 32)  # Lower 5 bits
-            alu_result = shifter(alu_src_a, shift_amount, [0, 0])
-        elif decoded.mnemonic in ['SRL', 'SRLI']:
-            # Shift right logical
-            shift_amount = slice_bits(alu_src_b, 27, 32)  # Lower 5 bits
-            alu_result = shifter(alu_src_a, shift_amount, [0, 1])
-        elif decoded.mnemonic in ['SRA', 'SRAI']:
-            # Shift right arithmetic
-            shift_amount = slice_bits(alu_src_b, 27, 32)  # Lower 5 bits
-            alu_result = shifter(alu_src_a, shift_amount, [1, 1])
-        elif decoded.mnemonic == 'LUI':
-            # LUI: Load upper immediate (already in decoded.immediate)
-            alu_result = decoded.immediate.copy()
-        elif decoded.mnemonic in ['BEQ', 'BNE']:
-            # Branch comparison using ALU subtraction
-            diff_result, flags = alu(rs1_data, rs2_data, ALU_OP_SUB)
-            # flags is [N, Z, C, V]
-            zero = flags[1]  # Z flag
-            
-            if decoded.mnemonic == 'BEQ':
-                # Branch if equal (zero flag set)
-                branch_taken = (zero == 1)
-            else:  # BNE
-                # Branch if not equal (zero flag clear)
-                branch_taken = (zero == 0)
-            
-            # Calculate branch target using ALU: PC + immediate
-            alu_result, _ = alu(result.pc, decoded.immediate, ALU_OP_ADD)
+        # Perform the instruction's specialized operation
+        execute = _EXECUTE_HANDLERS.get(decoded.op, _execute_nothing)
+        alu_result, branch_taken = execute(alu_src_a, alu_src_b, rs1_data,
+                                           rs2_data, decoded, result.pc)
         
         result.alu_result = alu_result.copy()
         result.branch_taken = branch_taken
         
         # Update PC based on control flow
-        if decoded.mnemonic == 'JAL':
+        op = decoded.op
+        if op is Op.JAL:
             # Jump to PC + immediate
             self.fetch_unit.branch_to(alu_result)
-        elif decoded.mnemonic == 'JALR':
+        elif op is Op.JALR:
             # Jump to rs1 + immediate, set LSB to 0
             target = alu_result.copy()
             target[31] = 0  # Clear LSB for alignment
@@ -321,10 +482,7 @@ class Datapath:
             writeback_data = mem_data.copy()
         elif signals.result_src == 2:
             # Write PC+4 to register (for JAL/JALR)
-            # Get next PC using ALU
-            four = int_to_bits_unsigned(4, 32)
-            pc_plus_4, _ = alu(result.pc, four, ALU_OP_ADD)
-            writeback_data = pc_plus_4
+            writeback_data = pc_plus_four(result.pc)
         else:
             # Write ALU result to register
             writeback_data = alu_result.copy()
@@ -348,67 +506,10 @@ class Datapath:
         """
         signals = ControlSignals()
         
-        # Default: no memory access, no branch/jump
-        signals.mem_read = 0
-        signals.mem_write = 0
-        signals.branch = 0
-        signals.jump = 0
-        signals.result_src = 0  # ALU result
+        (signals.alu_src_a, signals.alu_src_b, signals.mem_read, signals.mem_write,
+         signals.branch, signals.jump, signals.rf_we, signals.result_src) = \
+            _CONTROL_TABLE.get(decoded.op, _NO_SIGNALS)
         signals.pc_src = 0  # PC+4
-        signals.alu_src_a = 0  # rs1
-        signals.alu_src_b = 0  # rs2
-        signals.rf_we = 0  # No write by default
-        
-        # Set control signals based on instruction type
-        if decoded.mnemonic in ['ADD', 'SUB', 'AND', 'OR', 'XOR', 'SLL', 'SRL', 'SRA']:
-            # R-type arithmetic/logical
-            signals.alu_src_b = 0  # rs2
-            signals.rf_we = 1
-            signals.result_src = 0  # ALU result
-        elif decoded.mnemonic in ['ADDI', 'ANDI', 'ORI', 'XORI', 'SLLI', 'SRLI', 'SRAI']:
-            # I-type immediate operations
-            signals.alu_src_b = 1  # immediate
-            signals.rf_we = 1
-            signals.result_src = 0  # ALU result
-        elif decoded.mnemonic == 'LW':
-            # Load word
-            signals.alu_src_b = 1  # immediate (offset)
-            signals.mem_read = 1
-            signals.rf_we = 1
-            signals.result_src = 1  # Memory data
-        elif decoded.mnemonic == 'SW':
-            # Store word
-            signals.alu_src_b = 1  # immediate (offset)
-            signals.mem_write = 1
-            signals.rf_we = 0  # No writeback
-        elif decoded.mnemonic in ['BEQ', 'BNE']:
-            # Branch instructions
-            signals.branch = 1
-            signals.alu_src_b = 0  # Compare rs2
-            signals.rf_we = 0  # No writeback
-        elif decoded.mnemonic == 'JAL':
-            # Jump and link
-            signals.jump = 1
-            signals.alu_src_b = 1  # immediate
-            signals.rf_we = 1
-            signals.result_src = 2  # PC+4
-        elif decoded.mnemonic == 'JALR':
-            # Jump and link register
-            signals.jump = 1
-            signals.alu_src_b = 1  # immediate
-            signals.rf_we = 1
-            signals.result_src = 2  # PC+4
-        elif decoded.mnemonic == 'LUI':
-            # Load upper immediate
-            signals.alu_src_b = 1  # immediate (already shifted)
-            signals.rf_we = 1
-            signals.result_src = 0  # ALU result (immediate)
-        elif decoded.mnemonic == 'AUIPC':
-            # Add upper immediate to PC
-            signals.alu_src_a = 1  # PC
-            signals.alu_src_b = 1  # immediate
-            signals.rf_we = 1
-            signals.result_src = 0  # ALU result
         
         return signals
     
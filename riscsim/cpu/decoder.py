@@ -16,37 +16,229 @@ Supports all six RISC-V instruction formats:
 Convention: All bit arrays use MSB-at-index-0 convention.
 """
 
-from typing import List, Tuple, Optional
+from enum import Enum, IntEnum
+from operator import itemgetter
+from typing import Iterable, List, Tuple, Optional, Union
 from riscsim.utils.bit_utils import (
-    slice_bits, concat_bits, sign_extend, zero_extend
+    slice_bits, zero_extend, int_to_bits_unsigned
 )
 
+# Instruction words decode() accepts: an MSB-first bit array, or (at the I/O
+# boundary) a raw uint32 or its 4 little-endian bytes as stored in memory
+InstructionWord = Union[List[int], int, bytes, bytearray, memoryview]
+
+
+class InstrType(str, Enum):
+    """Instruction format. Members compare equal to their letter ('R', ...)."""
+    R = 'R'
+    I = 'I'
+    S = 'S'
+    B = 'B'
+    U = 'U'
+    J = 'J'
+    UNKNOWN = 'UNKNOWN'
+    
+    def __str__(self):
+        return self.value
+
+
+class Op(IntEnum):
+    """Decoded instruction identity; member names match the mnemonics."""
+    UNKNOWN = 0
+    # R-type
+    ADD = 1
+    SUB = 2
+    SLL = 3
+    SLT = 4
+    SLTU = 5
+    XOR = 6
+    SRL = 7
+    SRA = 8
+    OR = 9
+    AND = 10
+    # I-type
+    ADDI = 11
+    SLTI = 12
+    SLTIU = 13
+    XORI = 14
+    ORI = 15
+    ANDI = 16
+    SLLI = 17
+    SRLI = 18
+    SRAI = 19
+    LW = 20
+    JALR = 21
+    # S-type
+    SW = 22
+    # B-type
+    BEQ = 23
+    BNE = 24
+    BLT = 25
+    BGE = 26
+    BLTU = 27
+    BGEU = 28
+    # U-type
+    LUI = 29
+    AUIPC = 30
+    # J-type
+    JAL = 31
+
+
+# Immediate layouts: for each format, the instruction bit index (MSB-first)
+# feeding each of the 32 immediate bits, sign extension included. Index 32
+# selects a constant 0. Built once at import, together with a C-level
+# itemgetter per layout, so each extraction is a single gather call instead
+# of slice/concat/sign-extend.
+_IMM_ZERO = 32
+# I: sext(imm[11:0] = bits[31:20])
+_IMM_LAYOUT_I = (0,) * 20 + tuple(range(0, 12))
+# S: sext(imm[11:5] = bits[31:25], imm[4:0] = bits[11:7])
+_IMM_LAYOUT_S = (0,) * 20 + tuple(range(0, 7)) + tuple(range(20, 25))
+# B: sext(imm[12] = bit[31], imm[11] = bit[7], imm[10:5] = bits[30:25],
+#         imm[4:1] = bits[11:8], imm[0] = 0)
+_IMM_LAYOUT_B = ((0,) * 20 + (24,) + tuple(range(1, 7)) + tuple(range(20, 24))
+                 + (_IMM_ZERO,))
+# U: imm[31:12] = bits[31:12], imm[11:0] = 0
+_IMM_LAYOUT_U = tuple(range(0, 20)) + (_IMM_ZERO,) * 12
+# J: sext(imm[20] = bit[31], imm[19:12] = bits[19:12], imm[11] = bit[20],
+#         imm[10:1] = bits[30:21], imm[0] = 0)
+_IMM_LAYOUT_J = ((0,) * 12 + tuple(range(12, 20)) + (11,) + tuple(range(1, 11))
+                 + (_IMM_ZERO,))
+
+_IMM_PICK_I = itemgetter(*_IMM_LAYOUT_I)
+_IMM_PICK_S = itemgetter(*_IMM_LAYOUT_S)
+_IMM_PICK_B = itemgetter(*_IMM_LAYOUT_B)
+_IMM_PICK_U = itemgetter(*_IMM_LAYOUT_U)
+_IMM_PICK_J = itemgetter(*_IMM_LAYOUT_J)
+
+
+def _field_bits(value: int, width: int) -> Tuple[int, ...]:
+    """MSB-first bit tuple for a field value (import-time table building only)."""
+    return tuple((value >> (width - 1 - i)) & 1 for i in range(width))
+
+
+# Opcode -> instruction format for all 128 opcodes (bit tuple keys);
+# anything not listed is UNKNOWN.
+_OPCODE_TYPES = dict.fromkeys(
+    (_field_bits(opcode, 7) for opcode in range(128)), InstrType.UNKNOWN
+)
+_OPCODE_TYPES.update({
+    _field_bits(0b0110011, 7): InstrType.R,  # register ALU ops
+    _field_bits(0b0010011, 7): InstrType.I,  # immediate ALU ops
+    _field_bits(0b0000011, 7): InstrType.I,  # loads
+    _field_bits(0b1100111, 7): InstrType.I,  # JALR
+    _field_bits(0b0100011, 7): InstrType.S,  # stores
+    _field_bits(0b1100011, 7): InstrType.B,  # branches
+    _field_bits(0b0110111, 7): InstrType.U,  # LUI
+    _field_bits(0b0010111, 7): InstrType.U,  # AUIPC
+    _field_bits(0b1101111, 7): InstrType.J,  # JAL
+})
+
+# Mnemonic dispatch: (opcode, funct3, bit 30) -> (mnemonic, Op). None matches any
+# value of that field (funct3 is absent for U/J and unused by JALR; bit 30
+# only splits ADD/SUB, SRL/SRA and SRLI/SRAI).
+_MNEMONIC_SPECS = (
+    # R-type
+    (0b0110011, 0b000, 0, 'ADD'), (0b0110011, 0b000, 1, 'SUB'),
+    (0b0110011, 0b001, None, 'SLL'), (0b0110011, 0b010, None, 'SLT'),
+    (0b0110011, 0b011, None, 'SLTU'), (0b0110011, 0b100, None, 'XOR'),
+    (0b0110011, 0b101, 0, 'SRL'), (0b0110011, 0b101, 1, 'SRA'),
+    (0b0110011, 0b110, None, 'OR'), (0b0110011, 0b111, None, 'AND'),
+    # I-type: immediate ALU, load, JALR
+    (0b0010011, 0b000, None, 'ADDI'), (0b0010011, 0b001, None, 'SLLI'),
+    (0b0010011, 0b010, None, 'SLTI'), (0b0010011, 0b011, None, 'SLTIU'),
+    (0b0010011, 0b100, None, 'XORI'), (0b0010011, 0b101, 0, 'SRLI'),
+    (0b0010011, 0b101, 1, 'SRAI'), (0b0010011, 0b110, None, 'ORI'),
+    (0b0010011, 0b111, None, 'ANDI'),
+    (0b0000011, 0b010, None, 'LW'),
+    (0b1100111, None, None, 'JALR'),
+    # S-type
+    (0b0100011, 0b010, None, 'SW'),
+    # B-type
+    (0b1100011, 0b000, None, 'BEQ'), (0b1100011, 0b001, None, 'BNE'),
+    (0b1100011, 0b100, None, 'BLT'), (0b1100011, 0b101, None, 'BGE'),
+    (0b1100011, 0b110, None, 'BLTU'), (0b1100011, 0b111, None, 'BGEU'),
+    # U-type, J-type
+    (0b0110111, None, None, 'LUI'),
+    (0b0010111, None, None, 'AUIPC'),
+    (0b1101111, None, None, 'JAL'),
+)
+
+_MNEMONIC_TABLE = {
+    (*_field_bits(opcode, 7), *_field_bits(f3, 3), b30): (mnemonic, Op[mnemonic])
+    for opcode, funct3, bit30, mnemonic in _MNEMONIC_SPECS
+    for f3 in (range(8) if funct3 is None else (funct3,))
+    for b30 in ((0, 1) if bit30 is None else (bit30,))
+}
+
+# R-type mnemonics that also require the rest of funct7 to be zero
+_EXACT_FUNCT7 = frozenset({'ADD', 'SUB', 'SRL', 'SRA'})
+
+# Shift-immediates whose funct7 slot (imm[11:5]) carries the bit-30 selector
+_SHIFT_IMM_OPS = frozenset({Op.SLLI, Op.SRLI, Op.SRAI})
+
+
+def _as_bits(instruction: InstructionWord) -> List[int]:
+    """
+    Normalize an instruction word to a 32-bit array (I/O BOUNDARY).
+    
+    Bit arrays pass through untouched; ints and little-endian byte strings
+    are expanded once here so the decoder itself stays bit-level.
+    
+    Raises:
+        ValueError: If an int is outside uint32 range or bytes are not 4 long
+    """
+    if isinstance(instruction, (bytes, bytearray, memoryview)):
+        if len(instruction) != 4:
+            raise ValueError(f"Instruction must be 4 bytes, got {len(instruction)}")
+        return int_to_bits_unsigned(int.from_bytes(instruction, 'little'), 32)
+    if isinstance(instruction, int):
+        if not 0 <= instruction <= 0xFFFFFFFF:
+            raise ValueError(f"Instruction word out of uint32 range: {instruction:#x}")
+        return int_to_bits_unsigned(instruction, 32)
+    return instruction
+
+
+def _gather_imm(instruction: List[int], pick: itemgetter) -> List[int]:
+    """Assemble a 32-bit immediate by picking instruction bits per layout."""
+    return list(pick((*instruction, 0)))
+
 
 class DecodedInstruction:
     """Container for decoded instruction fields.
     
     Attributes:
-        instr_type: Instruction format type ('R', 'I', 'S', 'B', 'U', 'J')
+        instr_type: InstrType format ('R', 'I', 'S', 'B', 'U', 'J'; equal to
+            the plain letters)
         opcode: 7-bit opcode field
         funct3: 3-bit function field (for R, I, S, B types)
         funct7: 7-bit function field (for R-type)
+        is_alt: Instruction bit 30 (funct7[5]) for R-type and shift-immediates,
+            selecting SUB/SRA/SRAI over ADD/SRL/SRLI; False otherwise
         rd: 5-bit destination register
         rs1: 5-bit source register 1
         rs2: 5-bit source register 2
         immediate: 32-bit sign-extended immediate value
         mnemonic: Human-readable instruction name (e.g., 'ADD', 'ADDI')
+        op: Op enum member for the mnemonic, for cheap identity checks
+            (e.g., ``decoded.op is Op.ADD``)
     """
     
+    __slots__ = ('instr_type', 'opcode', 'funct3', 'funct7', 'is_alt', 'rd',
+                 'rs1', 'rs2', 'immediate', 'mnemonic', 'op')
+    
     def __init__(self):
-        self.instr_type: str = ""
+        self.instr_type: InstrType = InstrType.UNKNOWN
         self.opcode: List[int] = []
         self.funct3: List[int] = []
         self.funct7: List[int] = []
+        self.is_alt: bool = False
         self.rd: List[int] = []
         self.rs1: List[int] = []
         self.rs2: List[int] = []
         self.immediate: List[int] = []
         self.mnemonic: str = ""
+        self.op: Op = Op.UNKNOWN
         
     def __repr__(self):
         return (f"DecodedInstruction({self.mnemonic}, type={self.instr_type}, "
@@ -76,12 +268,13 @@ class InstructionDecoder:
         """Initialize the instruction decoder."""
         pass
     
-    def decode(self, instruction: List[int]) -> DecodedInstruction:
+    def decode(self, instruction: InstructionWord) -> DecodedInstruction:
         """
         Decode a 32-bit RISC-V instruction.
         
         Args:
-            instruction: 32-bit instruction as bit array [MSB...LSB]
+            instruction: 32-bit instruction as bit array [MSB...LSB], or a raw
+                uint32 / 4 little-endian bytes (converted at the boundary)
             
         Returns:
             DecodedInstruction object with all fields populated
@@ -89,70 +282,103 @@ class InstructionDecoder:
         Raises:
             ValueError: If instruction format is invalid
         """
+        instruction = _as_bits(instruction)
         if len(instruction) != 32:
             raise ValueError(f"Instruction must be 32 bits, got {len(instruction)}")
         
         decoded = DecodedInstruction()
         
-        # Extract opcode (bits 6:0)
-        decoded.opcode = self.extract_opcode(instruction)
-        
-        # Determine instruction type based on opcode
-        decoded.instr_type = self._identify_instruction_type(decoded.opcode)
-        
-        # Extract fields based on instruction type
-        if decoded.instr_type == 'R':
-            decoded.rd = self.extract_rd(instruction)
-            decoded.rs1 = self.extract_rs1(instruction)
-            decoded.rs2 = self.extract_rs2(instruction)
-            decoded.funct3 = self.extract_funct3(instruction)
-            decoded.funct7 = self.extract_funct7(instruction)
+        # Slice every fixed-position field once (MSB-first indices):
+        # funct7[0:7] rs2[7:12] rs1[12:17] funct3[17:20] rd[20:25] opcode[25:32]
+        opcode = instruction[25:32]
+        funct3 = instruction[17:20]
+        rd = instruction[20:25]
+        rs1 = instruction[12:17]
+        rs2 = instruction[7:12]
+        
+        decoded.opcode = opcode
+        instr_type = self._identify_instruction_type(opcode)
+        decoded.instr_type = instr_type
+        
+        # One table lookup on (opcode, funct3, bit 30) names the instruction
+        entry = _MNEMONIC_TABLE.get((*opcode, *funct3, instruction[1]))
+        if entry is None:
+            mnemonic = 'UNKNOWN' if instr_type is InstrType.UNKNOWN else 'UNKNOWN_' + instr_type
+            op = Op.UNKNOWN
+        else:
+            mnemonic, op = entry
+            if mnemonic in _EXACT_FUNCT7 and (instruction[0] or any(instruction[2:7])):
+                mnemonic, op = 'UNKNOWN_R', Op.UNKNOWN
+        decoded.mnemonic = mnemonic
+        decoded.op = op
+        
+        # Keep only the fields each format defines
+        if instr_type is InstrType.R:
+            funct7 = instruction[0:7]
+            decoded.rd, decoded.rs1, decoded.rs2 = rd, rs1, rs2
+            decoded.funct3, decoded.funct7 = funct3, funct7
+            decoded.is_alt = funct7[1] == 1
             decoded.immediate = [0] * 32  # R-type has no immediate
-            decoded.mnemonic = self._decode_r_type(decoded.funct3, decoded.funct7)
             
-        elif decoded.instr_type == 'I':
-            decoded.rd = self.extract_rd(instruction)
-            decoded.rs1 = self.extract_rs1(instruction)
-            decoded.funct3 = self.extract_funct3(instruction)
-            decoded.immediate = self.extract_imm_i(instruction)
-            decoded.mnemonic = self._decode_i_type(decoded.opcode, decoded.funct3, instruction)
+        elif instr_type is InstrType.I:
+            decoded.rd, decoded.rs1, decoded.funct3 = rd, rs1, funct3
+            decoded.immediate = _gather_imm(instruction, _IMM_PICK_I)
+            if op in _SHIFT_IMM_OPS:
+                decoded.is_alt = instruction[1] == 1
             
-        elif decoded.instr_type == 'S':
-            decoded.rs1 = self.extract_rs1(instruction)
-            decoded.rs2 = self.extract_rs2(instruction)
-            decoded.funct3 = self.extract_funct3(instruction)
-            decoded.immediate = self.extract_imm_s(instruction)
-            decoded.mnemonic = self._decode_s_type(decoded.funct3)
+        elif instr_type is InstrType.S:
+            decoded.rs1, decoded.rs2, decoded.funct3 = rs1, rs2, funct3
+            decoded.immediate = _gather_imm(instruction, _IMM_PICK_S)
             
-        elif decoded.instr_type == 'B':
-            decoded.rs1 = self.extract_rs1(instruction)
-            decoded.rs2 = self.extract_rs2(instruction)
-            decoded.funct3 = self.extract_funct3(instruction)
-            decoded.immediate = self.extract_imm_b(instruction)
-            decoded.mnemonic = self._decode_b_type(decoded.funct3)
+        elif instr_type is InstrType.B:
+            decoded.rs1, decoded.rs2, decoded.funct3 = rs1, rs2, funct3
+            decoded.immediate = _gather_imm(instruction, _IMM_PICK_B)
             
-        elif decoded.instr_type == 'U':
-            decoded.rd = self.extract_rd(instruction)
-            decoded.immediate = self.extract_imm_u(instruction)
-            decoded.mnemonic = self._decode_u_type(decoded.opcode)
+        elif instr_type is InstrType.U:
+            decoded.rd = rd
+            decoded.immediate = _gather_imm(instruction, _IMM_PICK_U)
             
-        elif decoded.instr_type == 'J':
-            decoded.rd = self.extract_rd(instruction)
-            decoded.immediate = self.extract_imm_j(instruction)
-            decoded.mnemonic = 'JAL'
+        elif instr_type is InstrType.J:
+            decoded.rd = rd
+            decoded.immediate = _gather_imm(instruction, _IMM_PICK_J)
             
         else:
             # Unknown instruction type - extract basic fields but don't decode
-            decoded.rd = self.extract_rd(instruction)
-            decoded.rs1 = self.extract_rs1(instruction)
-            decoded.rs2 = self.extract_rs2(instruction)
-            decoded.funct3 = self.extract_funct3(instruction)
-            decoded.funct7 = self.extract_funct7(instruction)
+            decoded.rd, decoded.rs1, decoded.rs2 = rd, rs1, rs2
+            decoded.funct3, decoded.funct7 = funct3, instruction[0:7]
             decoded.immediate = [0] * 32
-            decoded.mnemonic = 'UNKNOWN'
         
         return decoded
     
+    def decode_many(self, instructions: Iterable[InstructionWord]) -> List[DecodedInstruction]:
+        """
+        Decode a sequence of instructions, e.g. a whole program image.
+        
+        Repeated encodings are decoded once and share one
+        DecodedInstruction, so callers must not mutate the results.
+        
+        Args:
+            instructions: Iterable of 32-bit instructions in any form decode()
+                accepts
+            
+        Returns:
+            List of DecodedInstruction, one per input instruction, in order
+            
+        Raises:
+            ValueError: If any instruction is not 32 bits
+        """
+        seen = {}
+        decoded_all = []
+        append = decoded_all.append
+        for instruction in instructions:
+            instruction = _as_bits(instruction)
+            key = tuple(instruction)
+            decoded = seen.get(key)
+            if decoded is None:
+                decoded = seen[key] = self.decode(instruction)
+            append(decoded)
+        return decoded_all
+    
     def extract_opcode(self, instruction: List[int]) -> List[int]:
         """Extract opcode field (bits 6:0).
         
@@ -236,9 +462,7 @@ class InstructionDecoder:
         Returns:
             32-bit sign-extended immediate
         """
-        # I-type immediate is bits [31:20] -> indices [0:12] in MSB-first
-        imm_12 = slice_bits(instruction, 0, 12)
-        return sign_extend(imm_12, 32)
+        return _gather_imm(instruction, _IMM_PICK_I)
     
     def extract_imm_s(self, instruction: List[int]) -> List[int]:
         """Extract S-type immediate with sign extension.
@@ -252,11 +476,7 @@ class InstructionDecoder:
         Returns:
             32-bit sign-extended immediate
         """
-        # S-type splits immediate: [31:25] and [11:7]
-        imm_11_5 = slice_bits(instruction, 0, 7)   # bits [31:25]
-        imm_4_0 = slice_bits(instruction, 20, 25)  # bits [11:7]
-        imm_12 = concat_bits(imm_11_5, imm_4_0)  # Concatenate to form 12-bit
-        return sign_extend(imm_12, 32)
+        return _gather_imm(instruction, _IMM_PICK_S)
     
     def extract_imm_b(self, instruction: List[int]) -> List[int]:
         """Extract B-type immediate with sign extension.
@@ -271,16 +491,7 @@ class InstructionDecoder:
         Returns:
             32-bit sign-extended immediate (always even, bit 0 = 0)
         """
-        # B-type: imm[12] = bit[31], imm[10:5] = bits[30:25]
-        #         imm[4:1] = bits[11:8], imm[11] = bit[7]
-        imm_12 = slice_bits(instruction, 0, 1)     # bit[31]
-        imm_10_5 = slice_bits(instruction, 1, 7)   # bits[30:25]
-        imm_4_1 = slice_bits(instruction, 20, 24)  # bits[11:8]
-        imm_11 = slice_bits(instruction, 24, 25)   # bit[7]
-        
-        # Reassemble: imm[12:11:10:5:4:1:0]
-        imm_13 = concat_bits(imm_12, imm_11, imm_10_5, imm_4_1, [0])
-        return sign_extend(imm_13, 32)
+        return _gather_imm(instruction, _IMM_PICK_B)
     
     def extract_imm_u(self, instruction: List[int]) -> List[int]:
         """Extract U-type immediate (bits 31:12) with zero extension.
@@ -293,10 +504,7 @@ class InstructionDecoder:
         Returns:
             32-bit immediate (upper 20 bits set, lower 12 bits zero)
         """
-        # U-type: imm[31:12] -> indices [0:20]
-        imm_31_12 = slice_bits(instruction, 0, 20)
-        # Append 12 zero bits for lower portion
-        return concat_bits(imm_31_12, [0] * 12)
+        return _gather_imm(instruction, _IMM_PICK_U)
     
     def extract_imm_j(self, instruction: List[int]) -> List[int]:
         """Extract J-type immediate with sign extension.
@@ -311,192 +519,18 @@ class InstructionDecoder:
         Returns:
             32-bit sign-extended immediate (always even, bit 0 = 0)
         """
-        # J-type: imm[20] = bit[31], imm[10:1] = bits[30:21]
-        #         imm[11] = bit[20], imm[19:12] = bits[19:12]
-        imm_20 = slice_bits(instruction, 0, 1)      # bit[31]
-        imm_10_1 = slice_bits(instruction, 1, 11)   # bits[30:21]
-        imm_11 = slice_bits(instruction, 11, 12)    # bit[20]
-        imm_19_12 = slice_bits(instruction, 12, 20) # bits[19:12]
-        
-        # Reassemble: imm[20:19:12:11:10:1:0]
-        imm_21 = concat_bits(imm_20, imm_19_12, imm_11, imm_10_1, [0])
-        return sign_extend(imm_21, 32)
+        return _gather_imm(instruction, _IMM_PICK_J)
     
-    def _identify_instruction_type(self, opcode: List[int]) -> str:
+    def _identify_instruction_type(self, opcode: List[int]) -> InstrType:
         """Identify instruction type from opcode.
         
         Args:
             opcode: 7-bit opcode
             
         Returns:
-            Instruction type: 'R', 'I', 'S', 'B', 'U', 'J'
-        """
-        # Convert opcode to comparable format (MSB-first: bits 6:0)
-        # R-type: 0110011 (0x33)
-        # I-type: 0010011 (0x13) - immediate ALU ops
-        #         0000011 (0x03) - load
-        #         1100111 (0x67) - JALR
-        # S-type: 0100011 (0x23)
-        # B-type: 1100011 (0x63)
-        # U-type: 0110111 (0x37) - LUI
-        #         0010111 (0x17) - AUIPC
-        # J-type: 1101111 (0x6F) - JAL
-        
-        if opcode == [0,1,1,0,0,1,1]:  # 0110011
-            return 'R'
-        elif opcode == [0,0,1,0,0,1,1]:  # 0010011 (immediate ALU)
-            return 'I'
-        elif opcode == [0,0,0,0,0,1,1]:  # 0000011 (load)
-            return 'I'
-        elif opcode == [1,1,0,0,1,1,1]:  # 1100111 (JALR)
-            return 'I'
-        elif opcode == [0,1,0,0,0,1,1]:  # 0100011 (store)
-            return 'S'
-        elif opcode == [1,1,0,0,0,1,1]:  # 1100011 (branch)
-            return 'B'
-        elif opcode == [0,1,1,0,1,1,1]:  # 0110111 (LUI)
-            return 'U'
-        elif opcode == [0,0,1,0,1,1,1]:  # 0010111 (AUIPC)
-            return 'U'
-        elif opcode == [1,1,0,1,1,1,1]:  # 1101111 (JAL)
-            return 'J'
-        else:
-            # Unknown opcode
-            return 'UNKNOWN'
-    
-    def _decode_r_type(self, funct3: List[int], funct7: List[int]) -> str:
-        """Decode R-type instruction mnemonic.
-        
-        Args:
-            funct3: 3-bit function code
-            funct7: 7-bit function code
-            
-        Returns:
-            Instruction mnemonic
-        """
-        # funct3 determines base operation
-        # funct7 distinguishes variants (e.g., ADD vs SUB, SRL vs SRA)
-        
-        if funct3 == [0,0,0]:  # 000
-            if funct7 == [0,0,0,0,0,0,0]:  # 0000000
-                return 'ADD'
-            elif funct7 == [0,1,0,0,0,0,0]:  # 0100000
-                return 'SUB'
-        elif funct3 == [0,0,1]:  # 001
-            return 'SLL'
-        elif funct3 == [0,1,0]:  # 010
-            return 'SLT'
-        elif funct3 == [0,1,1]:  # 011
-            return 'SLTU'
-        elif funct3 == [1,0,0]:  # 100
-            return 'XOR'
-        elif funct3 == [1,0,1]:  # 101
-            if funct7 == [0,0,0,0,0,0,0]:  # 0000000
-                return 'SRL'
-            elif funct7 == [0,1,0,0,0,0,0]:  # 0100000
-                return 'SRA'
-        elif funct3 == [1,1,0]:  # 110
-            return 'OR'
-        elif funct3 == [1,1,1]:  # 111
-            return 'AND'
-        
-        return 'UNKNOWN_R'
-    
-    def _decode_i_type(self, opcode: List[int], funct3: List[int], 
-                       instruction: List[int]) -> str:
-        """Decode I-type instruction mnemonic.
-        
-        Args:
-            opcode: 7-bit opcode
-            funct3: 3-bit function code
-            instruction: Full 32-bit instruction (for shift amount check)
-            
-        Returns:
-            Instruction mnemonic
-        """
-        # Check if immediate ALU op (0010011) or load (0000011) or JALR (1100111)
-        if opcode == [0,0,1,0,0,1,1]:  # 0x13 - immediate ALU
-            if funct3 == [0,0,0]:  # 000
-                return 'ADDI'
-            elif funct3 == [0,0,1]:  # 001
-                # SLLI: check funct7 (bits 31:25) should be 0000000
-                return 'SLLI'
-            elif funct3 == [0,1,0]:  # 010
-                return 'SLTI'
-            elif funct3 == [0,1,1]:  # 011
-                return 'SLTIU'
-            elif funct3 == [1,0,0]:  # 100
-                return 'XORI'
-            elif funct3 == [1,0,1]:  # 101
-                # Check bit 30 (index 1) to distinguish SRLI vs SRAI
-                funct7_bit = instruction[1]  # bit 30
-                if funct7_bit == 0:
-                    return 'SRLI'
-                else:
-                    return 'SRAI'
-            elif funct3 == [1,1,0]:  # 110
-                return 'ORI'
-            elif funct3 == [1,1,1]:  # 111
-                return 'ANDI'
-        elif opcode == [0,0,0,0,0,1,1]:  # 0x03 - load
-            if funct3 == [0,1,0]:  # 010
-                return 'LW'
-            # Can add LB, LH, LBU, LHU here
-        elif opcode == [1,1,0,0,1,1,1]:  # 0x67 - JALR
-            return 'JALR'
-        
-        return 'UNKNOWN_I'
-    
-    def _decode_s_type(self, funct3: List[int]) -> str:
-        """Decode S-type instruction mnemonic.
-        
-        Args:
-            funct3: 3-bit function code
-            
-        Returns:
-            Instruction mnemonic
-        """
-        if funct3 == [0,1,0]:  # 010
-            return 'SW'
-        # Can add SB, SH here
-        return 'UNKNOWN_S'
-    
-    def _decode_b_type(self, funct3: List[int]) -> str:
-        """Decode B-type instruction mnemonic.
-        
-        Args:
-            funct3: 3-bit function code
-            
-        Returns:
-            Instruction mnemonic
-        """
-        if funct3 == [0,0,0]:  # 000
-            return 'BEQ'
-        elif funct3 == [0,0,1]:  # 001
-            return 'BNE'
-        elif funct3 == [1,0,0]:  # 100
-            return 'BLT'
-        elif funct3 == [1,0,1]:  # 101
-            return 'BGE'
-        elif funct3 == [1,1,0]:  # 110
-            return 'BLTU'
-        elif funct3 == [1,1,1]:  # 111
-            return 'BGEU'
-        return 'UNKNOWN_B'
-    
-    def _decode_u_type(self, opcode: List[int]) -> str:
-        """Decode U-type instruction mnemonic.
-        
-        Args:
-            opcode: 7-bit opcode
-            
-        Returns:
-            Instruction mnemonic
+            InstrType member (R, I, S, B, U, J or UNKNOWN)
         """
-        if opcode == [0,1,1,0,1,1,1]:  # 0110111 - LUI
-            return 'LUI'
-        elif opcode == [0,0,1,0,1,1,1]:  # 0010111 - AUIPC
-            return 'AUIPC'
-        return 'UNKNOWN_U'
+        # One lookup in the 128-entry opcode table (see _OPCODE_TYPES)
+        return _OPCODE_TYPES[tuple(opcode)]
 
 # AI-END
@@ -16,6 +16,7 @@ Date: November 2025
 
 from typing import List
 from riscsim.utils.bit_utils import (
+    Word32,
     bits_to_int_unsigned,
     int_to_bits_unsigned,
     zero_extend
@@ -23,6 +24,35 @@ from riscsim.utils.bit_utils import (
 from riscsim.cpu.alu import alu
 
 
+# Words read ahead into the prefetch queue on each miss
+PREFETCH_DEPTH = 8
+
+
+def pc_plus_four(pc: List[int]) -> List[int]:
+    """
+    Dedicated PC + 4 incrementer.
+    
+    Adding 4 to a word-aligned PC is a +1 on bits [31:2], so instead of a full
+    32-bit ALU add this ripples a single carry from bit 2 upward: set bits
+    flip to 0 and pass the carry on, the first clear bit absorbs it. Bits
+    [1:0] pass through, and the top of the address space wraps to zero like
+    the ALU add.
+    
+    Args:
+        pc: 32-bit PC value [MSB at index 0]
+    
+    Returns:
+        New 32-bit list holding PC + 4
+    """
+    next_pc = pc.copy()
+    for i in range(29, -1, -1):  # bit 2 (index 29) up to bit 31 (index 0)
+        if next_pc[i] == 0:
+            next_pc[i] = 1
+            break
+        next_pc[i] = 0
+    return next_pc
+
+
 class FetchUnit:
     """
     Instruction fetch unit with PC management.
@@ -30,13 +60,16 @@ class FetchUnit:
     Features:
     - Fetches 32-bit instructions from memory
     - Manages Program Counter (PC)
-    - PC increment (PC + 4) using ALU
+    - Prefetch queue of the next PREFETCH_DEPTH sequential words
+    - PC increment (PC + 4) using a dedicated incrementer
     - Branch/jump to target address
     - PC alignment checking
     
     Convention:
     - PC is 32-bit value [MSB at index 0]
-    - PC must be word-aligned (bits [1:0] = 00)
+    - PC must be word-aligned (bits [1:0] = 00); this is checked where PC
+      is written (constructor, pc setter, branches) and PC + 4 keeps it,
+      so the fetch paths do not re-check it
     - All arithmetic uses ALU (no host operators)
     """
     
@@ -50,17 +83,55 @@ class FetchUnit:
         
         Convention:
         - PC stored as 32-bit array
-        - Memory must support read_word() interface
+        - Memory must support the read_words()/read_word_int() interface
+        - The memory is bound for the unit's lifetime (its word reader is
+          cached here, so swap memories by building a new FetchUnit)
         """
         self.memory = memory
+        self._read_words = memory.read_words
         
         # Initialize PC (I/O BOUNDARY: convert initial value)
-        self.pc = int_to_bits_unsigned(initial_pc, 32)
+        self._pc = int_to_bits_unsigned(initial_pc, 32)
+        
+        # Prefetch queue: words read ahead from _ifq_pc (the PC list object
+        # the queue head belongs to). self._pc is never handed out or shared
+        # (the pc property copies both ways), so it only changes by being
+        # replaced: any PC write other than increment_pc misses the queue,
+        # and a memory store bumps the memory's write_generation and does the
+        # same.
+        self._ifq: List[List[int]] = []
+        self._ifq_pos = 0
+        self._ifq_pc = None
+        self._ifq_generation = -1
         
         # Validate PC alignment
-        if not self._check_pc_alignment(self.pc):
+        if not self._check_pc_alignment(self._pc):
             raise ValueError(f"Initial PC 0x{initial_pc:08X} is not word-aligned")
     
+    @property
+    def pc(self) -> List[int]:
+        """Current 32-bit PC [MSB at index 0], as a copy."""
+        return self._pc.copy()
+    
+    @pc.setter
+    def pc(self, value: List[int]) -> None:
+        """
+        Replace PC with a copy of value, checking width and alignment.
+        
+        Raises:
+            ValueError: If value is not 32 bits or not word-aligned
+        """
+        if len(value) != 32:
+            raise ValueError(f"PC must be 32 bits, got {len(value)} bits")
+        
+        # Check alignment: one OR of bits [1:0]
+        if value[30] | value[31]:
+            from riscsim.utils.bit_utils import bits_to_hex_string
+            pc_hex = bits_to_hex_string(value)
+            raise ValueError(f"PC 0x{pc_hex} is not word-aligned")
+        
+        self._pc = value.copy()
+    
     def _check_pc_alignment(self, pc: List[int]) -> bool:
         """
         Check if PC is word-aligned (bits [1:0] = 00).
@@ -71,7 +142,7 @@ class FetchUnit:
         Returns:
             True if aligned, False otherwise
         """
-        return pc[-2] == 0 and pc[-1] == 0
+        return not (pc[-2] | pc[-1])
     
     def fetch(self) -> List[int]:
         """
@@ -81,34 +152,97 @@ class FetchUnit:
             32-bit instruction [MSB at index 0]
         
         Raises:
-            ValueError: If PC is not word-aligned or out of bounds
+            ValueError: If PC is out of bounds
         
         Convention:
-        - Reads word from memory at PC
+        - Reads word from memory at PC (served from the prefetch queue when
+          PC has only moved sequentially since the last refill)
         - Does NOT increment PC (use increment_pc() separately)
         """
-        # Check PC alignment
-        if not self._check_pc_alignment(self.pc):
+        pc = self._pc
+        if pc is self._ifq_pc and self._ifq_generation == self.memory.write_generation:
+            return self._ifq[self._ifq_pos].copy()
+        
+        # Refill the prefetch queue from memory, starting at PC
+        try:
+            self._ifq = self._read_words(pc, PREFETCH_DEPTH, partial=True)
+        except ValueError as e:
             from riscsim.utils.bit_utils import bits_to_hex_string
-            pc_hex = bits_to_hex_string(self.pc)
-            raise ValueError(f"PC 0x{pc_hex} is not word-aligned")
+            pc_hex = bits_to_hex_string(pc)
+            raise ValueError(f"Failed to fetch instruction at PC 0x{pc_hex}: {e}")
+        self._ifq_pos = 0
+        self._ifq_pc = pc
+        self._ifq_generation = self.memory.write_generation
+        
+        return self._ifq[0].copy()
+    
+    def fetch_word(self) -> Word32:
+        """
+        Fetch the instruction at the current PC as a packed 32-bit integer.
+        
+        Integer counterpart of fetch() for tracers, disassemblers and
+        loaders that want the raw word; InstructionDecoder.decode accepts
+        it directly. Skips the prefetch queue and the bit-array copy.
+        
+        Returns:
+            Unsigned 32-bit instruction word
+        
+        Raises:
+            ValueError: If PC is out of bounds
+        
+        Convention:
+        - I/O BOUNDARY FUNCTION (converts PC once for the memory index)
+        - Does NOT increment PC (use increment_pc() separately)
+        """
+        pc = self._pc
         
-        # Fetch instruction from memory
         try:
-            instruction = self.memory.read_word(self.pc)
+            return self.memory.read_word_int(bits_to_int_unsigned(pc))
         except ValueError as e:
             from riscsim.utils.bit_utils import bits_to_hex_string
-            pc_hex = bits_to_hex_string(self.pc)
+            pc_hex = bits_to_hex_string(pc)
             raise ValueError(f"Failed to fetch instruction at PC 0x{pc_hex}: {e}")
+    
+    def fetch_n(self, count: int) -> List[List[int]]:
+        """
+        Fetch `count` sequential instructions and advance PC past them.
+        
+        Same as `count` fetch()/increment_pc() pairs, but the memory range is
+        validated once and read in one pass.
+        
+        Args:
+            count: Number of instructions to fetch
         
-        return instruction
+        Returns:
+            List of 32-bit instructions [MSB at index 0], in program order
+        
+        Raises:
+            ValueError: If the range is out of bounds
+        
+        Convention:
+        - PC is left unchanged if the fetch fails
+        """
+        pc = self._pc
+        
+        try:
+            instructions = self._read_words(pc, count)
+        except ValueError as e:
+            from riscsim.utils.bit_utils import bits_to_hex_string
+            pc_hex = bits_to_hex_string(pc)
+            raise ValueError(f"Failed to fetch instructions at PC 0x{pc_hex}: {e}")
+        
+        for _ in range(count):
+            pc = pc_plus_four(pc)
+        self._pc = pc
+        
+        return instructions
     
     def increment_pc(self) -> None:
         """
         Increment PC by 4 (next sequential instruction).
         
         Convention:
-        - Uses ALU for addition (no host + operator)
+        - Uses the carry-chain incrementer (no host + operator)
         - PC_new = PC_old + 4
         
         Example:
@@ -116,15 +250,19 @@ class FetchUnit:
             increment_pc()
             PC = 0x00000004
         """
-        # Create constant 4 as 32-bit value
-        four = int_to_bits_unsigned(4, 32)
-        
-        # Add using ALU: PC = PC + 4
-        # ALU control: [0, 0, 1, 0] = ADD operation
-        new_pc, flags = alu(self.pc, four, [0, 0, 1, 0])
-        
-        # Update PC
-        self.pc = new_pc
+        new_pc = pc_plus_four(self._pc)
+        
+        # Sequential step: move the prefetch queue head along with PC
+        if self._pc is self._ifq_pc:
+            pos = self._ifq_pos + 1
+            if pos < len(self._ifq):
+                self._ifq_pos = pos
+                self._ifq_pc = new_pc
+            else:
+                self._ifq_pc = None
+        
+        # PC + 4 keeps bits [1:0], so the alignment invariant still holds
+        self._pc = new_pc
     
     def branch_to(self, target_addr: List[int]) -> None:
         """
@@ -144,14 +282,14 @@ class FetchUnit:
         if len(target_addr) != 32:
             raise ValueError(f"Target address must be 32 bits, got {len(target_addr)} bits")
         
-        # Check alignment
-        if not self._check_pc_alignment(target_addr):
+        # Check alignment: one OR of bits [1:0]
+        if target_addr[30] | target_addr[31]:
             from riscsim.utils.bit_utils import bits_to_hex_string
             target_hex = bits_to_hex_string(target_addr)
             raise ValueError(f"Target address 0x{target_hex} is not word-aligned")
         
         # Set PC to target
-        self.pc = target_addr.copy()
+        self._pc = target_addr.copy()
     
     def branch_relative(self, offset: List[int]) -> None:
         """
@@ -175,16 +313,16 @@ class FetchUnit:
         
         # Add using ALU: PC_new = PC_old + offset
         # ALU control: [0, 0, 1, 0] = ADD operation
-        new_pc, flags = alu(self.pc, offset, [0, 0, 1, 0])
+        new_pc, flags = alu(self._pc, offset, [0, 0, 1, 0])
         
-        # Check alignment
-        if not self._check_pc_alignment(new_pc):
+        # Check alignment: one OR of bits [1:0]
+        if new_pc[30] | new_pc[31]:
             from riscsim.utils.bit_utils import bits_to_hex_string
             new_pc_hex = bits_to_hex_string(new_pc)
             raise ValueError(f"Computed PC 0x{new_pc_hex} is not word-aligned")
         
         # Update PC
-        self.pc = new_pc
+        self._pc = new_pc
     
     def get_pc(self) -> List[int]:
         """
@@ -193,7 +331,7 @@ class FetchUnit:
         Returns:
             32-bit PC value [MSB at index 0]
         """
-        return self.pc.copy()
+        return self._pc.copy()
     
     def set_pc(self, pc: List[int]) -> None:
         """
@@ -208,18 +346,8 @@ class FetchUnit:
         Convention:
         - Used for resets, exceptions, debugging
         """
-        # Validate PC is 32 bits
-        if len(pc) != 32:
-            raise ValueError(f"PC must be 32 bits, got {len(pc)} bits")
-        
-        # Check alignment
-        if not self._check_pc_alignment(pc):
-            from riscsim.utils.bit_utils import bits_to_hex_string
-            pc_hex = bits_to_hex_string(pc)
-            raise ValueError(f"PC 0x{pc_hex} is not word-aligned")
-        
-        # Set PC
-        self.pc = pc.copy()
+        # Set PC (the pc setter validates width and alignment and copies)
+        self.pc = pc
     
     def get_next_pc(self) -> List[int]:
         """
@@ -232,12 +360,6 @@ class FetchUnit:
         - Used for JAL/JALR return address (PC + 4)
         - Does not modify current PC
         """
-        # Create constant 4
-        four = int_to_bits_unsigned(4, 32)
-        
-        # Add using ALU: next_pc = PC + 4
-        next_pc, flags = alu(self.pc, four, [0, 0, 1, 0])
-        
-        return next_pc
+        return pc_plus_four(self._pc)
 
 # AI-END
@@ -6,6 +6,10 @@ Implements bit-level floating-point operations without using host language
 float arithmetic:
 - pack_f32/unpack_f32: Encode/decode IEEE-754 float32 format
 - fadd_f32, fsub_f32, fmul_f32: Arithmetic operations with RoundTiesToEven
+- fmul_add_f32: Multiply then add, (a * b) + c, in one call
+- fdot_f32: Multiply-accumulate dot product over float32 vectors
+- fadd_f32_result, fmul_f32_result, fmul_add_f32_result: Result-only variants
+  (no flags/trace) for callers that ignore exceptions
 - Special value handling: +/-0, +/-infinity, NaN, subnormals
 
 IEEE-754 Float32 format (32 bits total, MSB at index 0):
@@ -22,9 +26,16 @@ Special values:
 All bit arrays follow MSB-first convention (index 0 = MSB, index 31 = LSB)
 """
 
+import math
+import os
+import struct
+from collections import namedtuple
+from functools import lru_cache, wraps
+
 from riscsim.utils.bit_utils import (
     slice_bits, concat_bits, bits_or, is_zero, bits_and,
-    zero_extend, bits_not, bits_xor, bits_to_hex_string
+    zero_extend, bits_not, bits_xor, bits_to_hex_string,
+    int_to_bits_unsigned, bits_to_int_unsigned
 )
 from riscsim.cpu.alu import alu
 from riscsim.cpu.shifter import shifter
@@ -37,10 +48,52 @@ EXP_WIDTH = 8
 FRAC_WIDTH = 23
 EXP_BIAS = 127  # Bias for float32 exponent
 
+# Step-by-step operation traces (FPResult.trace) cost a formatted string per
+# step; they are only built when RISCSIM_FPU_TRACE=1. Results and flags are
+# identical either way.
+_TRACE = os.environ.get('RISCSIM_FPU_TRACE', '0') == '1'
+
 # Special exponent values
 EXP_ZERO = [0] * EXP_WIDTH      # All zeros
 EXP_INF_NAN = [1] * EXP_WIDTH   # All ones (255)
 
+# Exception flags reported in FPResult.flags, in order
+FLAG_NAMES = ('invalid', 'divide_by_zero', 'overflow', 'underflow', 'inexact')
+
+
+class FPResult(namedtuple('FPResult', 'result flags trace')):
+    """
+    Result of an FPU arithmetic operation.
+
+    Fields are read by attribute (r.result, r.flags, r.trace). Key access
+    (r['result'], r.get('flags')) and key membership ('trace' in r) are
+    kept so callers written against the old dictionary return value keep
+    working.
+
+    The tuple itself is immutable but its result list, flags dict and trace
+    list are not, so one instance can serve as a reusable output packet
+    for the *_into variants (see FPResult.empty()).
+    """
+    __slots__ = ()
+
+    @classmethod
+    def empty(cls):
+        """A zeroed result packet for fadd_f32_into/fmul_f32_into to fill."""
+        return cls([0] * FLOAT32_WIDTH, dict.fromkeys(FLAG_NAMES, 0), [])
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, key):
+        return key in self._fields
+
+    def get(self, key, default=None):
+        if key in self._fields:
+            return getattr(self, key)
+        return default
+
 
 def extract_float32_fields(bits):
     """
@@ -86,9 +139,10 @@ def is_special_value(exp, frac):
     Returns:
         Tuple of (is_zero, is_inf, is_nan, is_subnormal)
     """
-    exp_is_zero = is_zero(exp)
-    exp_is_max = all(b == 1 for b in exp)  # exp == 255
-    frac_is_zero = is_zero(frac)
+    # Membership scans run in C: "no 1 bit" is all-zeros, "no 0 bit" all-ones
+    exp_is_zero = 1 not in exp
+    exp_is_max = 0 not in exp  # exp == 255
+    frac_is_zero = 1 not in frac
 
     is_zero_val = exp_is_zero and frac_is_zero
     is_subnormal = exp_is_zero and not frac_is_zero
@@ -98,6 +152,35 @@ def is_special_value(exp, frac):
     return (is_zero_val, is_inf, is_nan, is_subnormal)
 
 
+def classify_float32(bits):
+    """
+    Split IEEE-754 float32 bits into fields and classify them in one pass.
+
+    Fuses extract_float32_fields() and is_special_value() for the FPU
+    operations, which always need both.
+
+    Args:
+        bits: 32-bit array in IEEE-754 format (MSB at index 0)
+
+    Returns:
+        Tuple of (sign_bit, exp_bits[8], frac_bits[23],
+                  is_zero, is_inf, is_nan, is_subnormal)
+    """
+    assert len(bits) == FLOAT32_WIDTH, f"Expected 32 bits, got {len(bits)}"
+
+    exp = bits[1:9]
+    frac = bits[9:32]
+    exp_is_zero = 1 not in exp
+    exp_is_max = 0 not in exp
+    frac_is_zero = 1 not in frac
+
+    return (bits[0], exp, frac,
+            exp_is_zero and frac_is_zero,       # zero
+            exp_is_max and frac_is_zero,        # infinity
+            exp_is_max and not frac_is_zero,    # NaN
+            exp_is_zero and not frac_is_zero)   # subnormal
+
+
 def leading_zeros_count(bits):
     """
     Count the number of leading zeros in a bit array.
@@ -139,7 +222,10 @@ def compare_unsigned(a, b):
 
 def increment_bits(bits):
     """
-    Increment a bit array by 1 using the ALU.
+    Increment a bit array by 1 with a ripple-carry incrementer.
+
+    Set bits from the LSB upward flip to 0 and pass the carry on; the first
+    clear bit absorbs it. Wraps to zero on overflow, like a fixed-width add.
 
     Args:
         bits: Bit array
@@ -147,19 +233,71 @@ def increment_bits(bits):
     Returns:
         Incremented bit array (same length)
     """
-    # Pad to 32 bits if needed
-    if len(bits) < 32:
-        bits_32 = zero_extend(bits, 32)
-    else:
-        bits_32 = bits[:]
+    result = list(bits)
+    for i in range(len(result) - 1, -1, -1):
+        if result[i] == 0:
+            result[i] = 1
+            break
+        result[i] = 0
+    return result
 
-    one_32 = [0] * 31 + [1]
-    result, _ = alu(bits_32, one_32, [0, 0, 1, 0])  # ADD operation
 
-    # Return original length
-    if len(bits) < 32:
-        return slice_bits(result, 32 - len(bits), 32)
-    return result
+def decrement_bits(bits):
+    """
+    Decrement a bit array by 1 with a ripple-borrow decrementer.
+
+    Clear bits from the LSB upward flip to 1 and pass the borrow on; the
+    first set bit absorbs it.
+
+    Args:
+        bits: Bit array
+
+    Returns:
+        Tuple of (decremented bit array (same length), borrow_out) where
+        borrow_out=1 if the input was zero (the result wrapped to all ones)
+    """
+    result = list(bits)
+    for i in range(len(result) - 1, -1, -1):
+        if result[i] == 1:
+            result[i] = 0
+            return (result, 0)
+        result[i] = 1
+    return (result, 1)
+
+
+def accumulate_shifted(acc, addend, end):
+    """
+    Add a bit array into a wider accumulator in place (ripple-carry adder).
+
+    The addend's LSB lines up with acc[end - 1]; the carry ripples from
+    there up to the accumulator's MSB. This is the adder row of a shift-add
+    multiplier, sized to the accumulator so no 32-bit ALU split (and no
+    carry hand-off between the halves) is needed.
+
+    Args:
+        acc: Accumulator bit array, updated in place
+        addend: Bit array to add (no wider than acc[:end])
+        end: Index one past the accumulator bit the addend's LSB lands on
+
+    Returns:
+        carry_out (1 if the sum overflowed the accumulator)
+    """
+    carry = 0
+    j = end - 1
+    for k in range(len(addend) - 1, -1, -1):
+        x = acc[j]
+        y = addend[k]
+        acc[j] = x ^ y ^ carry
+        carry = (x & y) | (carry & (x ^ y))
+        j -= 1
+    while carry and j >= 0:
+        if acc[j] == 0:
+            acc[j] = 1
+            carry = 0
+        else:
+            acc[j] = 0
+        j -= 1
+    return carry
 
 
 def add_unsigned(a, b, width=None):
@@ -320,26 +458,33 @@ def normalize_significand(sig, exp, width=24):
     shifted = shifter(sig_32, lz_count, "SLL")
     normalized_sig = slice_bits(shifted, 32 - width, 32)
 
-    # Decrease exponent by lz_count
-    # Create lz_count as bit array for subtraction
-    lz_bits = zero_extend([], 8)
-    # Simple approach: subtract 1 repeatedly lz_count times
-    new_exp = exp[:]
+    # Decrease exponent by lz_count, one step of the decrementer per shift
+    new_exp = exp
     for _ in range(lz_count):
-        # Subtract 1 from exponent
-        new_exp_32 = zero_extend(new_exp, 32)
-        one_32 = [0] * 31 + [1]
-        result, flags = alu(new_exp_32, one_32, [0, 1, 1, 0])  # SUB
-        new_exp = slice_bits(result, 24, 32)
+        new_exp, borrow = decrement_bits(new_exp)
 
         # Check for underflow (exp became zero or negative)
-        if is_zero(new_exp) or result[0] == 1:
+        if borrow or is_zero(new_exp):
             # Underflow
             return ([0] * width, [0] * 8, True)
 
     return (normalized_sig, new_exp, False)
 
 
+# Bit patterns for the special values, built once at import
+_BITS_PZERO = tuple(int_to_bits_unsigned(0x00000000, 32))   # +0.0
+_BITS_NZERO = tuple(int_to_bits_unsigned(0x80000000, 32))   # -0.0
+_BITS_PINF = tuple(int_to_bits_unsigned(0x7F800000, 32))    # +infinity
+_BITS_NINF = tuple(int_to_bits_unsigned(0xFF800000, 32))    # -infinity
+_BITS_QNAN = tuple(int_to_bits_unsigned(0x7FC00000, 32))    # canonical quiet NaN
+
+# Precompiled big-endian float32 codec; bound methods skip re-parsing the
+# format string on every pack/unpack.
+_F32 = struct.Struct('>f')
+_F32_PACK = _F32.pack
+_F32_UNPACK = _F32.unpack
+
+
 def pack_f32(value):
     """
     Pack a Python float value into IEEE-754 float32 bit representation.
@@ -363,30 +508,36 @@ def pack_f32(value):
     Returns:
         32-bit array in IEEE-754 format
     """
-    import struct
-    import math
+    # Special values return pre-built patterns without touching the cache.
+    # NaN never compares equal to itself, so it could not be a key anyway.
+    if value != value:
+        return list(_BITS_QNAN)
+    if value == 0.0:
+        # 0.0 == -0.0; the sign bit tells them apart
+        return list(_BITS_NZERO if math.copysign(1.0, value) < 0 else _BITS_PZERO)
+    if math.isinf(value):
+        return list(_BITS_NINF if value < 0 else _BITS_PINF)
 
-    # Handle special cases that might overflow struct.pack
-    if math.isnan(value):
-        # Return canonical NaN
-        return pack_float32_fields(0, EXP_INF_NAN, [1] + [0] * 22)
+    return list(_pack_f32_cached(value))
 
-    if math.isinf(value):
-        sign = 1 if value < 0 else 0
-        return pack_float32_fields(sign, EXP_INF_NAN, [0] * 23)
 
+@lru_cache(maxsize=4096)
+def _pack_f32_cached(value):
+    """Memoized body of pack_f32 for finite non-zero inputs; returns a bit tuple."""
     # Check for overflow (float32 max is approximately 3.4e38)
     # If the value is too large for float32, return infinity
     try:
-        packed = struct.pack('>f', value)
+        packed = _F32_PACK(value)
         int_val = int.from_bytes(packed, 'big')
-        # Convert to bit array (MSB first)
-        bits = [(int_val >> (31 - i)) & 1 for i in range(32)]
-        return bits
+        # Convert to bit tuple (MSB first)
+        return tuple(int_to_bits_unsigned(int_val, 32))
     except OverflowError:
         # Value too large for float32, return infinity with appropriate sign
-        sign = 1 if value < 0 else 0
-        return pack_float32_fields(sign, EXP_INF_NAN, [0] * 23)
+        return _BITS_NINF if value < 0 else _BITS_PINF
+
+
+pack_f32.cache_clear = _pack_f32_cached.cache_clear
+pack_f32.cache_info = _pack_f32_cached.cache_info
 
 
 def unpack_f32(bits):
@@ -412,20 +563,77 @@ def unpack_f32(bits):
     Returns:
         Python float value
     """
-    import struct
-
     assert len(bits) == 32, f"Expected 32 bits, got {len(bits)}"
 
+    return _unpack_f32_cached(tuple(bits))
+
+
+@lru_cache(maxsize=4096)
+def _unpack_f32_cached(bits):
+    """Memoized body of unpack_f32, keyed on the bit tuple."""
     # Convert bits to integer
-    int_val = sum(bits[i] << (31 - i) for i in range(32))
+    int_val = bits_to_int_unsigned(bits)
 
     # Use Python's struct to interpret as float
     packed = int_val.to_bytes(4, 'big')
-    value = struct.unpack('>f', packed)[0]
+    value = _F32_UNPACK(packed)[0]
 
     return value
 
 
+unpack_f32.cache_clear = _unpack_f32_cached.cache_clear
+unpack_f32.cache_info = _unpack_f32_cached.cache_info
+
+
+def _mode_key(rounding_mode):
+    """Hashable form of a rounding mode (bit list, int, or None)."""
+    return tuple(rounding_mode) if isinstance(rounding_mode, list) else rounding_mode
+
+
+def _memoized_fp_op(op):
+    """
+    Memoize a two-operand FPU operation on its input bit patterns.
+
+    The bit-level datapath is deterministic, so an operation repeated on the
+    same operands (loop constants, test literals) reuses the first result
+    instead of re-running hundreds of ALU steps. Each call still gets fresh
+    result/flags/trace objects, so callers may mutate what they receive.
+    """
+    @lru_cache(maxsize=4096)
+    def cached(a_key, b_key, mode_key, traced):
+        # `traced` only keys the entry: a result cached with tracing off
+        # must not be served (trace-less) once tracing is switched on
+        mode = list(mode_key) if isinstance(mode_key, tuple) else mode_key
+        r = op(list(a_key), list(b_key), mode)
+        return tuple(r.result), tuple(r.flags.items()), tuple(r.trace)
+
+    @wraps(op)
+    def wrapper(a_bits, b_bits, rounding_mode=None):
+        result, flags, trace = cached(tuple(a_bits), tuple(b_bits),
+                                      _mode_key(rounding_mode), _TRACE)
+        return FPResult(list(result), dict(flags), list(trace))
+
+    def result_only(a_bits, b_bits, rounding_mode=None):
+        return list(cached(tuple(a_bits), tuple(b_bits), _mode_key(rounding_mode),
+                           _TRACE)[0])
+
+    def into(a_bits, b_bits, out, rounding_mode=None):
+        # Overwrite the caller's packet in place instead of allocating one
+        result, flags, trace = cached(tuple(a_bits), tuple(b_bits),
+                                      _mode_key(rounding_mode), _TRACE)
+        out.result[:] = result
+        out.flags.update(flags)
+        out.trace[:] = trace
+        return out
+
+    wrapper.result_only = result_only
+    wrapper.into = into
+    wrapper.cache_clear = cached.cache_clear
+    wrapper.cache_info = cached.cache_info
+    return wrapper
+
+
+@_memoized_fp_op
 def fadd_f32(a_bits, b_bits, rounding_mode=None):
     """
     IEEE-754 single-precision floating-point addition.
@@ -439,10 +647,10 @@ def fadd_f32(a_bits, b_bits, rounding_mode=None):
         rounding_mode: Optional 3-bit rounding mode (default RNE [0,0,0])
 
     Returns:
-        Dictionary with:
-          - 'result': 32-bit result in IEEE-754 format
-          - 'flags': Dictionary with exception flags
-          - 'trace': List of operation trace steps
+        FPResult with:
+          - result: 32-bit result in IEEE-754 format
+          - flags: Dictionary with exception flags
+          - trace: List of operation trace steps
     """
     if rounding_mode is None:
         rounding_mode = [0, 0, 0]  # RNE (Round to Nearest, ties to Even)
@@ -456,84 +664,77 @@ def fadd_f32(a_bits, b_bits, rounding_mode=None):
         'inexact': 0
     }
 
-    # Extract fields
-    sign_a, exp_a, frac_a = extract_float32_fields(a_bits)
-    sign_b, exp_b, frac_b = extract_float32_fields(b_bits)
-
-    trace.append(f"Input A: sign={sign_a}, exp={exp_a}, frac={frac_a[:8]}...")
-    trace.append(f"Input B: sign={sign_b}, exp={exp_b}, frac={frac_b[:8]}...")
+    # Extract fields and check for special values
+    (sign_a, exp_a, frac_a,
+     is_zero_a, is_inf_a, is_nan_a, is_subn_a) = classify_float32(a_bits)
+    (sign_b, exp_b, frac_b,
+     is_zero_b, is_inf_b, is_nan_b, is_subn_b) = classify_float32(b_bits)
 
-    # Check for special values
-    is_zero_a, is_inf_a, is_nan_a, is_subn_a = is_special_value(exp_a, frac_a)
-    is_zero_b, is_inf_b, is_nan_b, is_subn_b = is_special_value(exp_b, frac_b)
+    if _TRACE:
+        trace.append(f"Input A: sign={sign_a}, exp={exp_a}, frac={frac_a[:8]}...")
+        trace.append(f"Input B: sign={sign_b}, exp={exp_b}, frac={frac_b[:8]}...")
 
     # Handle NaN propagation
     if is_nan_a or is_nan_b:
-        trace.append("NaN operand detected")
+        if _TRACE:
+            trace.append("NaN operand detected")
         flags['invalid'] = 1
         # Return canonical NaN: sign=0, exp=255, frac with MSB=1
-        return {
-            'result': pack_float32_fields(0, EXP_INF_NAN, [1] + [0] * 22),
-            'flags': flags,
-            'trace': trace
-        }
+        return FPResult(pack_float32_fields(0, EXP_INF_NAN, [1] + [0] * 22), flags, trace)
 
     # Handle infinity cases
     if is_inf_a and is_inf_b:
         if sign_a != sign_b:
             # infinity + (-infinity) = NaN
-            trace.append("infinity + (-infinity) = NaN (invalid operation)")
+            if _TRACE:
+                trace.append("infinity + (-infinity) = NaN (invalid operation)")
             flags['invalid'] = 1
-            return {
-                'result': pack_float32_fields(0, EXP_INF_NAN, [1] + [0] * 22),
-                'flags': flags,
-                'trace': trace
-            }
+            return FPResult(pack_float32_fields(0, EXP_INF_NAN, [1] + [0] * 22), flags, trace)
         else:
             # infinity + infinity = infinity
-            trace.append("infinity + infinity = infinity")
-            return {
-                'result': pack_float32_fields(sign_a, EXP_INF_NAN, [0] * 23),
-                'flags': flags,
-                'trace': trace
-            }
+            if _TRACE:
+                trace.append("infinity + infinity = infinity")
+            return FPResult(pack_float32_fields(sign_a, EXP_INF_NAN, [0] * 23), flags, trace)
 
     if is_inf_a:
-        trace.append("A is infinity, result = A")
-        return {'result': a_bits, 'flags': flags, 'trace': trace}
+        if _TRACE:
+            trace.append("A is infinity, result = A")
+        return FPResult(a_bits, flags, trace)
 
     if is_inf_b:
-        trace.append("B is infinity, result = B")
-        return {'result': b_bits, 'flags': flags, 'trace': trace}
+        if _TRACE:
+            trace.append("B is infinity, result = B")
+        return FPResult(b_bits, flags, trace)
 
     # Handle zero cases
     if is_zero_a and is_zero_b:
         # +0 + +0 = +0, -0 + -0 = -0, +0 + -0 = +0
         result_sign = 1 if (sign_a == 1 and sign_b == 1) else 0
-        trace.append("Both operands zero")
-        return {
-            'result': pack_float32_fields(result_sign, EXP_ZERO, [0] * 23),
-            'flags': flags,
-            'trace': trace
-        }
+        if _TRACE:
+            trace.append("Both operands zero")
+        return FPResult(pack_float32_fields(result_sign, EXP_ZERO, [0] * 23), flags, trace)
 
     if is_zero_a:
-        trace.append("A is zero, result = B")
-        return {'result': b_bits, 'flags': flags, 'trace': trace}
+        if _TRACE:
+            trace.append("A is zero, result = B")
+        return FPResult(b_bits, flags, trace)
 
     if is_zero_b:
-        trace.append("B is zero, result = A")
-        return {'result': a_bits, 'flags': flags, 'trace': trace}
+        if _TRACE:
+            trace.append("B is zero, result = A")
+        return FPResult(a_bits, flags, trace)
 
     # Full bit-level IEEE-754 addition implementation
-    trace.append("Performing bit-level IEEE-754 addition")
+    if _TRACE:
+        trace.append("Performing bit-level IEEE-754 addition")
 
     # Step 1: Prepare significands with hidden bit
     # Normal: 1.fraction (24 bits total)
     # Subnormal: 0.fraction (24 bits total)
     sig_a = ([0] if is_subn_a else [1]) + frac_a  # 24 bits
     sig_b = ([0] if is_subn_b else [1]) + frac_b  # 24 bits
-    trace.append(f"Significands: A={sig_a[:8]}..., B={sig_b[:8]}...")
+    if _TRACE:
+        trace.append(f"Significands: A={sig_a[:8]}..., B={sig_b[:8]}...")
 
     # Step 2: Align exponents (shift smaller significand right)
     exp_diff, a_has_larger_exp = compare_exponents(exp_a, exp_b)
@@ -546,16 +747,19 @@ def fadd_f32(a_bits, b_bits, rounding_mode=None):
         # Shift B right
         sig_b, sticky_b = shift_significand_right(sig_b, exp_diff, 25)
         result_exp = exp_a
-        trace.append(f"Aligned: shifted B right, exp={result_exp}")
+        if _TRACE:
+            trace.append(f"Aligned: shifted B right, exp={result_exp}")
     elif not a_has_larger_exp and not is_zero(exp_diff):
         # Shift A right
         sig_a, sticky_a = shift_significand_right(sig_a, exp_diff, 25)
         result_exp = exp_b
-        trace.append(f"Aligned: shifted A right, exp={result_exp}")
+        if _TRACE:
+            trace.append(f"Aligned: shifted A right, exp={result_exp}")
     else:
         # Equal exponents
         result_exp = exp_a
-        trace.append("Exponents equal, no shift needed")
+        if _TRACE:
+            trace.append("Exponents equal, no shift needed")
 
     # Step 3: Add or subtract significands based on signs
     same_sign = (sign_a == sign_b)
@@ -566,7 +770,8 @@ def fadd_f32(a_bits, b_bits, rounding_mode=None):
         sig_b_32 = zero_extend(sig_b, 32)
         result_sig_32, flags_temp = alu(sig_a_32, sig_b_32, [0, 0, 1, 0])  # ADD
         result_sign = sign_a
-        trace.append("Same sign: added significands")
+        if _TRACE:
+            trace.append("Same sign: added significands")
 
         # Check if result >= 2.0 (bit at position representing 2^1 is set)
         # After zero-extending 25-bit sig to 32 bits: bits 0-6 are padding, bit 7 is MSB of sig
@@ -579,25 +784,20 @@ def fadd_f32(a_bits, b_bits, rounding_mode=None):
             # 254 = [1,1,1,1,1,1,1,0]
             if result_exp == [1,1,1,1,1,1,1,0]:
                 flags['overflow'] = 1
-                trace.append("Overflow to infinity: exponent 254 + carry would overflow")
-                return {
-                    'result': pack_float32_fields(result_sign, EXP_INF_NAN, [0]*23),
-                    'flags': flags,
-                    'trace': trace
-                }
+                if _TRACE:
+                    trace.append("Overflow to infinity: exponent 254 + carry would overflow")
+                return FPResult(pack_float32_fields(result_sign, EXP_INF_NAN, [0]*23), flags, trace)
 
             result_exp = increment_bits(result_exp)
-            trace.append("Carry out: shifted right, incremented exponent")
+            if _TRACE:
+                trace.append("Carry out: shifted right, incremented exponent")
 
             # Check for overflow after increment
             if all(b == 1 for b in result_exp):  # Exponent = 255
                 flags['overflow'] = 1
-                trace.append("Overflow to infinity after carry")
-                return {
-                    'result': pack_float32_fields(result_sign, EXP_INF_NAN, [0]*23),
-                    'flags': flags,
-                    'trace': trace
-                }
+                if _TRACE:
+                    trace.append("Overflow to infinity after carry")
+                return FPResult(pack_float32_fields(result_sign, EXP_INF_NAN, [0]*23), flags, trace)
     else:
         # Different signs: subtract significands
         # Determine which is larger
@@ -614,56 +814,46 @@ def fadd_f32(a_bits, b_bits, rounding_mode=None):
             result_sig_32, _ = alu(sig_b_32, sig_a_32, [0, 1, 1, 0])  # SUB
             result_sign = sign_b
 
-        trace.append("Different signs: subtracted significands")
+        if _TRACE:
+            trace.append("Different signs: subtracted significands")
 
     # Step 4: Normalize result
     result_sig_24 = slice_bits(result_sig_32, 32 - 25, 32 - 1)  # Get 24 bits (drop LSB guard bit)
 
     if is_zero(result_sig_24):
         # Result is zero
-        trace.append("Result is zero")
-        return {
-            'result': pack_float32_fields(0, [0]*8, [0]*23),
-            'flags': flags,
-            'trace': trace
-        }
+        if _TRACE:
+            trace.append("Result is zero")
+        return FPResult(pack_float32_fields(0, [0]*8, [0]*23), flags, trace)
 
     # Normalize: shift left until MSB=1, adjust exponent
     normalized_sig, normalized_exp, underflow = normalize_significand(result_sig_24, result_exp, 24)
 
     if underflow:
         flags['underflow'] = 1
-        trace.append("Underflow to zero")
-        return {
-            'result': pack_float32_fields(result_sign, [0]*8, [0]*23),
-            'flags': flags,
-            'trace': trace
-        }
+        if _TRACE:
+            trace.append("Underflow to zero")
+        return FPResult(pack_float32_fields(result_sign, [0]*8, [0]*23), flags, trace)
 
-    trace.append(f"Normalized: exp={normalized_exp}")
+    if _TRACE:
+        trace.append(f"Normalized: exp={normalized_exp}")
 
     # Step 5: Check for overflow
     if all(b == 1 for b in normalized_exp):  # Exponent = 255
         flags['overflow'] = 1
-        trace.append("Overflow to infinity")
-        return {
-            'result': pack_float32_fields(result_sign, EXP_INF_NAN, [0]*23),
-            'flags': flags,
-            'trace': trace
-        }
+        if _TRACE:
+            trace.append("Overflow to infinity")
+        return FPResult(pack_float32_fields(result_sign, EXP_INF_NAN, [0]*23), flags, trace)
 
     # Step 6: Round and pack result (simplified - just truncate for now)
     # Extract 23-bit fraction (drop hidden bit)
     result_frac = slice_bits(normalized_sig, 1, 24)
 
     result_bits = pack_float32_fields(result_sign, normalized_exp, result_frac)
-    trace.append(f"Result: sign={result_sign}, exp={normalized_exp}, frac={result_frac[:8]}...")
+    if _TRACE:
+        trace.append(f"Result: sign={result_sign}, exp={normalized_exp}, frac={result_frac[:8]}...")
 
-    return {
-        'result': result_bits,
-        'flags': flags,
-        'trace': trace
-    }
+    return FPResult(result_bits, flags, trace)
 
 
 def fsub_f32(a_bits, b_bits, rounding_mode=None):
@@ -678,7 +868,7 @@ def fsub_f32(a_bits, b_bits, rounding_mode=None):
         rounding_mode: Optional 3-bit rounding mode
 
     Returns:
-        Dictionary with result, flags, and trace (same as fadd_f32)
+        FPResult with result, flags, and trace (same as fadd_f32)
     """
     # Flip sign bit of B
     b_negated = b_bits[:]
@@ -686,11 +876,13 @@ def fsub_f32(a_bits, b_bits, rounding_mode=None):
 
     # Perform addition with negated B
     result = fadd_f32(a_bits, b_negated, rounding_mode)
-    result['trace'].insert(0, "FSUB: Negating B and performing addition")
+    if _TRACE:
+        result.trace.insert(0, "FSUB: Negating B and performing addition")
 
     return result
 
 
+@_memoized_fp_op
 def fmul_f32(a_bits, b_bits, rounding_mode=None):
     """
     IEEE-754 single-precision floating-point multiplication.
@@ -703,7 +895,7 @@ def fmul_f32(a_bits, b_bits, rounding_mode=None):
         rounding_mode: Optional 3-bit rounding mode
 
     Returns:
-        Dictionary with result, flags, and trace
+        FPResult with result, flags, and trace
     """
     if rounding_mode is None:
         rounding_mode = [0, 0, 0]  # RNE
@@ -717,99 +909,50 @@ def fmul_f32(a_bits, b_bits, rounding_mode=None):
         'inexact': 0
     }
 
-    # Extract fields
-    sign_a, exp_a, frac_a = extract_float32_fields(a_bits)
-    sign_b, exp_b, frac_b = extract_float32_fields(b_bits)
+    # Extract fields and check for special values
+    (sign_a, exp_a, frac_a,
+     is_zero_a, is_inf_a, is_nan_a, is_subn_a) = classify_float32(a_bits)
+    (sign_b, exp_b, frac_b,
+     is_zero_b, is_inf_b, is_nan_b, is_subn_b) = classify_float32(b_bits)
 
-    trace.append(f"Input A: sign={sign_a}, exp={exp_a}, frac={frac_a[:8]}...")
-    trace.append(f"Input B: sign={sign_b}, exp={exp_b}, frac={frac_b[:8]}...")
+    if _TRACE:
+        trace.append(f"Input A: sign={sign_a}, exp={exp_a}, frac={frac_a[:8]}...")
+        trace.append(f"Input B: sign={sign_b}, exp={exp_b}, frac={frac_b[:8]}...")
 
     # Result sign: XOR of input signs
     result_sign = sign_a ^ sign_b
 
-    # Check for special values
-    is_zero_a, is_inf_a, is_nan_a, is_subn_a = is_special_value(exp_a, frac_a)
-    is_zero_b, is_inf_b, is_nan_b, is_subn_b = is_special_value(exp_b, frac_b)
-
     # Handle NaN propagation
     if is_nan_a or is_nan_b:
-        trace.append("NaN operand detected")
+        if _TRACE:
+            trace.append("NaN operand detected")
         flags['invalid'] = 1
-        return {
-            'result': pack_float32_fields(0, EXP_INF_NAN, [1] + [0] * 22),
-            'flags': flags,
-            'trace': trace
-        }
+        return FPResult(pack_float32_fields(0, EXP_INF_NAN, [1] + [0] * 22), flags, trace)
 
     # Handle 0 * infinity = NaN
     if (is_zero_a and is_inf_b) or (is_inf_a and is_zero_b):
-        trace.append("0 * infinity = NaN (invalid operation)")
+        if _TRACE:
+            trace.append("0 * infinity = NaN (invalid operation)")
         flags['invalid'] = 1
-        return {
-            'result': pack_float32_fields(0, EXP_INF_NAN, [1] + [0] * 22),
-            'flags': flags,
-            'trace': trace
-        }
+        return FPResult(pack_float32_fields(0, EXP_INF_NAN, [1] + [0] * 22), flags, trace)
 
     # Handle infinity
     if is_inf_a or is_inf_b:
-        trace.append("Infinity operand, result = +/-infinity")
-        return {
-            'result': pack_float32_fields(result_sign, EXP_INF_NAN, [0] * 23),
-            'flags': flags,
-            'trace': trace
-        }
+        if _TRACE:
+            trace.append("Infinity operand, result = +/-infinity")
+        return FPResult(pack_float32_fields(result_sign, EXP_INF_NAN, [0] * 23), flags, trace)
 
     # Handle zero
     if is_zero_a or is_zero_b:
-        trace.append("Zero operand, result = +/-0")
-        return {
-            'result': pack_float32_fields(result_sign, EXP_ZERO, [0] * 23),
-            'flags': flags,
-            'trace': trace
-        }
+        if _TRACE:
+            trace.append("Zero operand, result = +/-0")
+        return FPResult(pack_float32_fields(result_sign, EXP_ZERO, [0] * 23), flags, trace)
 
     # Full bit-level IEEE-754 multiplication implementation
-    trace.append("Performing bit-level IEEE-754 multiplication")
+    if _TRACE:
+        trace.append("Performing bit-level IEEE-754 multiplication")
 
-    # Step 1: Prepare significands with hidden bit
-    sig_a = ([0] if is_subn_a else [1]) + frac_a  # 24 bits
-    sig_b = ([0] if is_subn_b else [1]) + frac_b  # 24 bits
-    trace.append(f"Significands: A={sig_a[:8]}..., B={sig_b[:8]}...")
-
-    # Step 2: Multiply significands using shift-add (like MDU mul32)
-    # Result will be 48 bits
-    product = [0] * 48
-
-    # Shift-add multiplication
-    for i in range(24):
-        if sig_b[23 - i] == 1:  # Check bit from LSB to MSB
-            # When checking sig_b[23-i], it has weight 2^(-(23-i)) in 1.23 format
-            # Product is in 2.46 format: product[n] represents 2^(1-n)
-            # sig_a[0] (weight 2^0) * 2^(-(23-i)) = 2^(-(23-i)) goes at position 24-i
-            # sig_a[23] (weight 2^-23) * 2^(-(23-i)) = 2^(-46+i) goes at position 47-i
-            shifted_a = [0] * (24 - i) + sig_a + [0] * i  # 48 bits total
-
-            # Add to product using repeated ALU additions (32 bits at a time)
-            # Split into two 32-bit chunks for ALU
-            # Lower 32 bits
-            prod_lo_32 = zero_extend(product[16:48], 32)
-            shifted_lo_32 = zero_extend(shifted_a[16:48], 32)
-            new_lo, flags_lo = alu(prod_lo_32, shifted_lo_32, [0, 0, 1, 0])  # ADD
-            carry_lo = flags_lo[2]  # C flag
-            product[16:48] = slice_bits(new_lo, 0, 32)
-
-            # Upper 32 bits (with carry from lower)
-            prod_hi_32 = zero_extend(product[0:16] + [0]*16, 32)
-            shifted_hi_32 = zero_extend(shifted_a[0:16] + [0]*16, 32)
-            carry_bits = [0]*31 + [1 if carry_lo == 1 else 0]  # Convert flag to bit
-            temp, _ = alu(prod_hi_32, shifted_hi_32, [0, 0, 1, 0])  # ADD
-            new_hi, _ = alu(temp, carry_bits, [0, 0, 1, 0])  # ADD carry
-            product[0:16] = slice_bits(new_hi, 0, 16)
-
-    trace.append(f"Product (48 bits): {product[:8]}...")
-
-    # Step 3: Add exponents and subtract bias
+    # Step 1: Add exponents and subtract bias
     # result_exp = exp_a + exp_b - 127
     exp_a_32 = zero_extend(exp_a, 32)
     exp_b_32 = zero_extend(exp_b, 32)
@@ -829,15 +972,44 @@ def fmul_f32(a_bits, b_bits, rounding_mode=None):
                     diff[0] == 0)  # diff is non-negative, so result_exp_32 >= 254
     if exp_overflow:
         flags['overflow'] = 1
-        trace.append(f"Exponent overflow: {result_exp_32} >= 254")
-        return {
-            'result': pack_float32_fields(result_sign, EXP_INF_NAN, [0]*23),
-            'flags': flags,
-            'trace': trace
-        }
+        if _TRACE:
+            trace.append(f"Exponent overflow: {result_exp_32} >= 254")
+        return FPResult(pack_float32_fields(result_sign, EXP_INF_NAN, [0]*23), flags, trace)
 
     result_exp = slice_bits(result_exp_32, 24, 32)
-    trace.append(f"Exponent sum - bias: {result_exp}")
+    if _TRACE:
+        trace.append(f"Exponent sum - bias: {result_exp}")
+
+    # A negative biased exponent underflows whatever the significands are
+    # (normalization adds at most 1), so skip the 24-step multiply.
+    if result_exp_32[0] == 1:
+        flags['underflow'] = 1
+        if _TRACE:
+            trace.append("Underflow to zero")
+        return FPResult(pack_float32_fields(result_sign, [0]*8, [0]*23), flags, trace)
+
+    # Step 2: Prepare significands with hidden bit
+    sig_a = ([0] if is_subn_a else [1]) + frac_a  # 24 bits
+    sig_b = ([0] if is_subn_b else [1]) + frac_b  # 24 bits
+    if _TRACE:
+        trace.append(f"Significands: A={sig_a[:8]}..., B={sig_b[:8]}...")
+
+    # Step 3: Multiply significands using shift-add (like MDU mul32)
+    # Result will be 48 bits
+    product = [0] * 48
+
+    # Shift-add multiplication
+    for i in range(24):
+        if sig_b[23 - i] == 1:  # Check bit from LSB to MSB
+            # When checking sig_b[23-i], it has weight 2^(-(23-i)) in 1.23 format
+            # Product is in 2.46 format: product[n] represents 2^(1-n)
+            # sig_a[0] (weight 2^0) * 2^(-(23-i)) = 2^(-(23-i)) goes at position 24-i
+            # sig_a[23] (weight 2^-23) * 2^(-(23-i)) = 2^(-46+i) goes at position 47-i
+            # One 48-bit ripple-carry add; 24x24 bits never carries out
+            accumulate_shifted(product, sig_a, 48 - i)
+
+    if _TRACE:
+        trace.append(f"Product (48 bits): {product[:8]}...")
 
     # Step 4: Normalize product
     # Product of two 24-bit numbers (1.xxx * 1.yyy) is either 1.xxx or 01.xxx
@@ -847,44 +1019,170 @@ def fmul_f32(a_bits, b_bits, rounding_mode=None):
         # Manually shift right by 1 (can't use shifter on 48 bits)
         product = [0] + product[:47]
         result_exp = increment_bits(result_exp)
-        trace.append("Product >= 2.0: shifted right, incremented exponent")
+        if _TRACE:
+            trace.append("Product >= 2.0: shifted right, incremented exponent")
 
     # Extract 23-bit fraction (bits 2-24, excluding hidden bit at position 1)
     # In 2.46 format: product[1] is hidden bit, product[2:25] is fraction
     result_frac = product[2:25]
-    trace.append(f"Normalized fraction: {result_frac[:8]}...")
+    if _TRACE:
+        trace.append(f"Normalized fraction: {result_frac[:8]}...")
 
     # Step 5: Check for overflow/underflow
     # Check if exponent overflowed to 255
     if all(b == 1 for b in result_exp):
         flags['overflow'] = 1
-        trace.append("Overflow to infinity")
-        return {
-            'result': pack_float32_fields(result_sign, EXP_INF_NAN, [0]*23),
-            'flags': flags,
-            'trace': trace
-        }
-
-    # Check if exponent underflowed (MSB=1 means negative in two's complement)
-    if result_exp_32[0] == 1 or is_zero(result_exp):
+        if _TRACE:
+            trace.append("Overflow to infinity")
+        return FPResult(pack_float32_fields(result_sign, EXP_INF_NAN, [0]*23), flags, trace)
+
+    # Check if exponent is still zero (negative exponents returned early)
+    if is_zero(result_exp):
         flags['underflow'] = 1
-        trace.append("Underflow to zero")
-        return {
-            'result': pack_float32_fields(result_sign, [0]*8, [0]*23),
-            'flags': flags,
-            'trace': trace
-        }
+        if _TRACE:
+            trace.append("Underflow to zero")
+        return FPResult(pack_float32_fields(result_sign, [0]*8, [0]*23), flags, trace)
 
     # Step 6: Pack result
     result_bits = pack_float32_fields(result_sign, result_exp, result_frac)
-    trace.append(f"Result: sign={result_sign}, exp={result_exp}, frac={result_frac[:8]}...")
+    if _TRACE:
+        trace.append(f"Result: sign={result_sign}, exp={result_exp}, frac={result_frac[:8]}...")
 
-    return {
-        'result': result_bits,
-        'flags': flags,
-        'trace': trace
+    return FPResult(result_bits, flags, trace)
+
+
+def fmul_add_f32(a_bits, b_bits, c_bits, rounding_mode=None):
+    """
+    IEEE-754 single-precision multiply then add: (a * b) + c.
+
+    Not fused: the product is rounded by fmul_f32 before the add, so the
+    result matches an FMUL.S/FADD.S pair bit-for-bit (and can differ from
+    a single-rounding FMADD.S when the product is inexact). Exception flags
+    from both steps are OR-ed together.
+
+    Args:
+        a_bits: 32-bit array (IEEE-754 format)
+        b_bits: 32-bit array (IEEE-754 format)
+        c_bits: 32-bit array (IEEE-754 format), the addend
+        rounding_mode: Optional 3-bit rounding mode
+
+    Returns:
+        FPResult with result, merged flags, and trace
+    """
+    product = fmul_f32(a_bits, b_bits, rounding_mode)
+    total = fadd_f32(product.result, c_bits, rounding_mode)
+
+    flags = dict(product.flags)
+    for name, value in total.flags.items():
+        flags[name] |= value
+
+    trace = (["FMUL+FADD: multiply then add"] + product.trace + total.trace) if _TRACE else []
+    return FPResult(total.result, flags, trace)
+
+
+def fadd_f32_result(a_bits, b_bits, rounding_mode=None):
+    """
+    fadd_f32 returning only the 32-bit result.
+
+    Skips building the flags dict and trace list for callers that never
+    inspect them; use fadd_f32 when flags matter.
+
+    Returns:
+        32-bit array (IEEE-754 format)
+    """
+    return fadd_f32.result_only(a_bits, b_bits, rounding_mode)
+
+
+def fmul_f32_result(a_bits, b_bits, rounding_mode=None):
+    """
+    fmul_f32 returning only the 32-bit result.
+
+    Returns:
+        32-bit array (IEEE-754 format)
+    """
+    return fmul_f32.result_only(a_bits, b_bits, rounding_mode)
+
+
+def fadd_f32_into(a_bits, b_bits, out, rounding_mode=None):
+    """
+    fadd_f32 writing into an existing FPResult instead of allocating one.
+
+    The result list, flags dict and trace list of `out` are overwritten in
+    place, so a loop can reuse one packet (FPResult.empty()) for every op.
+    Anything still holding those objects sees the new values.
+
+    Returns:
+        `out`
+    """
+    return fadd_f32.into(a_bits, b_bits, out, rounding_mode)
+
+
+def fmul_f32_into(a_bits, b_bits, out, rounding_mode=None):
+    """
+    fmul_f32 writing into an existing FPResult instead of allocating one.
+
+    Returns:
+        `out`
+    """
+    return fmul_f32.into(a_bits, b_bits, out, rounding_mode)
+
+
+def fmul_add_f32_result(a_bits, b_bits, c_bits, rounding_mode=None):
+    """
+    fmul_add_f32 returning only the 32-bit result of (a * b) + c.
+
+    Returns:
+        32-bit array (IEEE-754 format)
+    """
+    product = fmul_f32.result_only(a_bits, b_bits, rounding_mode)
+    return fadd_f32.result_only(product, c_bits, rounding_mode)
+
+
+def fdot_f32(a_vec, b_vec, rounding_mode=None):
+    """
+    IEEE-754 single-precision dot product of two equal-length vectors.
+
+    Each product is accumulated in order with fmul_add_f32, so results match
+    the equivalent sequence of scalar instructions.
+    Exception flags are OR-ed across every step.
+
+    Args:
+        a_vec: List of 32-bit arrays (IEEE-754 format)
+        b_vec: List of 32-bit arrays (same length as a_vec)
+        rounding_mode: Optional 3-bit rounding mode
+
+    Returns:
+        FPResult with result, merged flags, and trace
+
+    Raises:
+        ValueError: If the vectors have different lengths
+    """
+    if len(a_vec) != len(b_vec):
+        raise ValueError(f"Vectors must have same length: {len(a_vec)} != {len(b_vec)}")
+
+    trace = [f"FDOT: {len(a_vec)} element(s)"] if _TRACE else []
+    flags = {
+        'invalid': 0,
+        'divide_by_zero': 0,
+        'overflow': 0,
+        'underflow': 0,
+        'inexact': 0
     }
 
+    acc = pack_float32_fields(0, EXP_ZERO, [0] * 23)
+    for i, (a_bits, b_bits) in enumerate(zip(a_vec, b_vec)):
+        if i:
+            step = fmul_add_f32(a_bits, b_bits, acc, rounding_mode)
+        else:
+            step = fmul_f32(a_bits, b_bits, rounding_mode)
+        acc = step.result
+        for name, value in step.flags.items():
+            flags[name] |= value
+
+    if _TRACE:
+        trace.append(f"Result: {bits_to_hex_string(acc)}")
+    return FPResult(acc, flags, trace)
+
 
 def fpu_with_control(a_bits, b_bits, control_signals):
     """
@@ -920,14 +1218,14 @@ def fpu_with_control(a_bits, b_bits, control_signals):
         raise ValueError(f"Unknown FPU operation: {fpu_op}")
     
     # Create trace summary
-    trace_summary = f"FPU {fpu_op}: result={bits_to_hex_string(result_dict['result'])}"
+    trace_summary = f"FPU {fpu_op}: result={bits_to_hex_string(result_dict.result)}"
     
     # Return results with control signals
     return {
-        'result': result_dict['result'],
-        'flags': result_dict['flags'],
+        'result': result_dict.result,
+        'flags': result_dict.flags,
         'signals': control_signals.copy(),
-        'trace': [trace_summary] + result_dict['trace']
+        'trace': [trace_summary] + result_dict.trace
     }
 
 
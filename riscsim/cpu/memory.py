@@ -19,16 +19,27 @@ Date: November 2025
 # Prompt: "Implement Phase 1 of RISC-V CPU - Memory unit with word/byte access,
 #         little-endian, alignment checking, following no-host-operators constraint"
 
+import ctypes
+import os
+import struct
+import sys
 from typing import List, Optional
 from riscsim.utils.bit_utils import (
+    Word32,
     bits_to_int_unsigned,
     int_to_bits_unsigned,
-    slice_bits,
-    concat_bits,
     bits_to_hex_string
 )
 
 
+# A native unsigned-int view of the byte store is the little-endian word
+# layout only on little-endian hosts with a 4-byte C unsigned int.
+_NATIVE_WORDS = sys.byteorder == 'little' and struct.calcsize('I') == 4
+
+# Little-endian word packer for stores without a native word view.
+_WORD_LE = struct.Struct('<I')
+
+
 class Memory:
     """
     Memory unit supporting both instruction and data memory.
@@ -41,9 +52,9 @@ class Memory:
     - Load/store operations with bounds checking
     
     Convention:
-    - All data stored as bit arrays [0/1]
+    - Bit arrays [0/1] at the interface, MSB at index 0
     - Addresses are 32-bit values
-    - MSB at index 0
+    - Backing store is one contiguous bytearray (one byte per address)
     """
     
     # Memory region boundaries (using boundary function for initialization only)
@@ -61,19 +72,49 @@ class Memory:
             base_addr: Base address for memory (default 0x00000000)
         
         Convention:
-        - Memory stored as list of 8-bit bytes [each byte is list of 8 bits]
+        - Memory stored as a single bytearray
         - Each address holds one byte
+        - Word accesses go through a 32-bit view of the same bytearray
+        - Size and base are fixed after construction
         """
         self.size_bytes = size_bytes
         self.base_addr = base_addr
         
-        # Initialize memory as list of bytes (each byte is 8-bit array)
-        # I/O BOUNDARY: Using host arithmetic for initialization only
-        self.memory: List[List[int]] = [[0] * 8 for _ in range(size_bytes)]
+        # Offset of the last whole word, precomputed for the word bounds checks
+        self._last_word = size_bytes - 4
+        
+        # Zero-filled byte store
+        self.memory = bytearray(size_bytes)
+        
+        # Word-granular view over the same store (one aligned 4-byte access
+        # per word); None where the native layout is not little-endian
+        if _NATIVE_WORDS and size_bytes % 4 == 0 and base_addr % 4 == 0:
+            self._words = memoryview(self.memory).cast('I')
+        else:
+            self._words = None
         
         # Track loaded program bounds
         self.program_start = None
         self.program_end = None
+        
+        # Bumped on every store so cached copies (the fetch unit's
+        # prefetch queue) can tell when memory changed under them
+        self.write_generation = 0
+    
+    def clear(self) -> None:
+        """
+        Zero all of memory and forget any loaded program bounds.
+        
+        Lets one Memory instance be reused across independent runs
+        without reallocating; the buffer is zeroed in place with memset.
+        """
+        if self.size_bytes:
+            buf = (ctypes.c_char * self.size_bytes).from_buffer(self.memory)
+            ctypes.memset(buf, 0, self.size_bytes)
+            del buf
+        self.program_start = None
+        self.program_end = None
+        self.write_generation += 1
     
     def _check_address_bounds(self, addr: List[int]) -> bool:
         """
@@ -99,37 +140,47 @@ class Memory:
         
         return True
     
-    def _check_word_alignment(self, addr: List[int]) -> bool:
+    def _addr_to_offset(self, addr: List[int]) -> int:
         """
-        Check if address is word-aligned (multiple of 4).
+        Convert absolute address to memory array offset.
         
         Args:
             addr: 32-bit address
         
         Returns:
-            True if word-aligned, False otherwise
+            Offset into memory array
         
         Convention:
-        - Word addresses must have bits [1:0] = 00
+        - I/O BOUNDARY FUNCTION (address arithmetic for array indexing)
         """
-        # Check if last 2 bits are zero
-        return addr[-2] == 0 and addr[-1] == 0
+        addr_int = bits_to_int_unsigned(addr)
+        return addr_int - self.base_addr
     
-    def _addr_to_offset(self, addr: List[int]) -> int:
+    def _word_offset(self, addr: List[int]) -> int:
         """
-        Convert absolute address to memory array offset.
+        Validate a word address and return its memory offset.
+        
+        Converts the address once for both the bounds check and the offset,
+        instead of once per helper.
         
         Args:
-            addr: 32-bit address
+            addr: 32-bit word-aligned address
         
         Returns:
             Offset into memory array
         
+        Raises:
+            ValueError: If address is out of bounds or not word-aligned
+        
         Convention:
         - I/O BOUNDARY FUNCTION (address arithmetic for array indexing)
         """
-        addr_int = bits_to_int_unsigned(addr)
-        return addr_int - self.base_addr
+        offset = bits_to_int_unsigned(addr) - self.base_addr
+        if offset < 0 or offset > self._last_word:
+            raise ValueError(f"Address 0x{bits_to_hex_string(addr)} out of bounds")
+        if addr[-2] | addr[-1]:
+            raise ValueError(f"Address 0x{bits_to_hex_string(addr)} is not word-aligned")
+        return offset
     
     def read_word(self, addr: List[int]) -> List[int]:
         """
@@ -149,31 +200,48 @@ class Memory:
         - Word at addr consists of bytes [addr, addr+1, addr+2, addr+3]
         - Result: [byte3[7:0], byte2[7:0], byte1[7:0], byte0[7:0]] in MSB-first
         """
-        # Check bounds
-        if not self._check_address_bounds(addr):
-            addr_hex = bits_to_hex_string(addr)
-            raise ValueError(f"Address 0x{addr_hex} out of bounds")
+        offset = self._word_offset(addr)
         
-        # Check alignment
-        if not self._check_word_alignment(addr):
-            addr_hex = bits_to_hex_string(addr)
-            raise ValueError(f"Address 0x{addr_hex} is not word-aligned")
+        # Read 4 bytes (little-endian) and emit them MSB-first:
+        # Word = [byte3, byte2, byte1, byte0]
+        # I/O BOUNDARY: Using host arithmetic for array indexing
+        word = int.from_bytes(self.memory[offset:offset + 4], 'little')
+        return int_to_bits_unsigned(word, 32)
+    
+    def read_words(self, addr: List[int], count: int,
+                   partial: bool = False) -> List[List[int]]:
+        """
+        Read `count` consecutive 32-bit words starting at addr.
         
-        # Get offset
-        offset = self._addr_to_offset(addr)
+        Equivalent to read_word at addr, addr+4, ... but validates the
+        whole range once instead of per word.
         
-        # Read 4 bytes (little-endian)
-        # I/O BOUNDARY: Using host arithmetic for array indexing
-        byte0 = self.memory[offset]      # LSB
-        byte1 = self.memory[offset + 1]
-        byte2 = self.memory[offset + 2]
-        byte3 = self.memory[offset + 3]  # MSB
+        Args:
+            addr: 32-bit word-aligned start address
+            count: Number of words to read
+            partial: If True, stop at the end of memory instead of raising
+                     (the first word must still be in bounds)
         
-        # Concatenate bytes in big-endian order (MSB first)
-        # Word = [byte3, byte2, byte1, byte0] for MSB-first convention
-        word = concat_bits(byte3, byte2, byte1, byte0)
+        Returns:
+            List of 32-bit words [MSB at index 0], lowest address first
         
-        return word
+        Raises:
+            ValueError: If any word is out of bounds or addr is not word-aligned
+        """
+        offset = self._word_offset(addr)
+        # I/O BOUNDARY: Using host arithmetic for array indexing
+        end = offset + 4 * count
+        if end > self.size_bytes:
+            if partial:
+                end = self.size_bytes - 3
+            else:
+                raise ValueError(
+                    f"Words 0x{bits_to_hex_string(addr)} + {count} out of bounds"
+                )
+        
+        mem = self.memory
+        return [int_to_bits_unsigned(int.from_bytes(mem[i:i + 4], 'little'), 32)
+                for i in range(offset, end, 4)]
     
     def write_word(self, addr: List[int], data: List[int]) -> None:
         """
@@ -190,36 +258,88 @@ class Memory:
         - Little-endian: data[31:24] goes to addr+3, data[7:0] goes to addr
         - Splits 32-bit word into 4 bytes and stores them
         """
-        # Check bounds
-        if not self._check_address_bounds(addr):
-            addr_hex = bits_to_hex_string(addr)
-            raise ValueError(f"Address 0x{addr_hex} out of bounds")
-        
-        # Check alignment
-        if not self._check_word_alignment(addr):
-            addr_hex = bits_to_hex_string(addr)
-            raise ValueError(f"Address 0x{addr_hex} is not word-aligned")
+        offset = self._word_offset(addr)
         
         # Validate data is 32 bits
         if len(data) != 32:
             raise ValueError(f"Data must be 32 bits, got {len(data)} bits")
         
-        # Get offset
-        offset = self._addr_to_offset(addr)
+        # Write bytes in little-endian order: data[7:0] lands at the lowest address
+        # I/O BOUNDARY: Using host arithmetic for array indexing
+        if self._words is not None:
+            self._words[offset >> 2] = bits_to_int_unsigned(data)
+        else:
+            _WORD_LE.pack_into(self.memory, offset, bits_to_int_unsigned(data))
+        self.write_generation += 1
+    
+    def _int_word_offset(self, addr: int) -> int:
+        """
+        Validate an integer word address and return its memory offset.
         
-        # Split 32-bit word into 4 bytes
-        # data = [31:24 (byte3), 23:16 (byte2), 15:8 (byte1), 7:0 (byte0)]
-        byte3 = slice_bits(data, 0, 8)    # MSB [31:24]
-        byte2 = slice_bits(data, 8, 16)   # [23:16]
-        byte1 = slice_bits(data, 16, 24)  # [15:8]
-        byte0 = slice_bits(data, 24, 32)  # LSB [7:0]
+        Args:
+            addr: Word-aligned byte address as an integer
         
-        # Write bytes in little-endian order
-        # I/O BOUNDARY: Using host arithmetic for array indexing
-        self.memory[offset] = byte0      # LSB at lowest address
-        self.memory[offset + 1] = byte1
-        self.memory[offset + 2] = byte2
-        self.memory[offset + 3] = byte3  # MSB at highest address
+        Returns:
+            Offset into memory array
+        
+        Raises:
+            ValueError: If address is out of bounds or not word-aligned
+        
+        Convention:
+        - I/O BOUNDARY FUNCTION (address arithmetic for array indexing)
+        """
+        offset = addr - self.base_addr
+        if offset < 0 or offset > self._last_word:
+            raise ValueError(f"Address 0x{addr:08X} out of bounds")
+        if addr & 0b11:
+            raise ValueError(f"Address 0x{addr:08X} is not word-aligned")
+        return offset
+    
+    def read_word_int(self, addr: int) -> Word32:
+        """
+        Read a 32-bit word as an unsigned integer (little-endian).
+        
+        Integer counterpart of read_word() for loaders and tests that would
+        otherwise convert the address and the result between ints and bit
+        arrays themselves.
+        
+        Args:
+            addr: Word-aligned byte address as an integer
+        
+        Returns:
+            Unsigned 32-bit word value
+        
+        Raises:
+            ValueError: If address is out of bounds or not word-aligned
+        
+        Convention:
+        - I/O BOUNDARY FUNCTION
+        """
+        offset = self._int_word_offset(addr)
+        if self._words is not None:
+            return self._words[offset >> 2]
+        return _WORD_LE.unpack_from(self.memory, offset)[0]
+    
+    def write_word_int(self, addr: int, value: Word32) -> None:
+        """
+        Write an unsigned 32-bit integer as a word (little-endian).
+        
+        Args:
+            addr: Word-aligned byte address as an integer
+            value: Word value; only the low 32 bits are stored
+        
+        Raises:
+            ValueError: If address is out of bounds or not word-aligned
+        
+        Convention:
+        - I/O BOUNDARY FUNCTION
+        """
+        offset = self._int_word_offset(addr)
+        if self._words is not None:
+            self._words[offset >> 2] = value & 0xFFFFFFFF
+        else:
+            _WORD_LE.pack_into(self.memory, offset, value & 0xFFFFFFFF)
+        self.write_generation += 1
     
     def read_byte(self, addr: List[int]) -> List[int]:
         """
@@ -243,7 +363,7 @@ class Memory:
         offset = self._addr_to_offset(addr)
         
         # Return byte
-        return self.memory[offset].copy()
+        return int_to_bits_unsigned(self.memory[offset], 8)
     
     def write_byte(self, addr: List[int], data: List[int]) -> None:
         """
@@ -269,50 +389,66 @@ class Memory:
         offset = self._addr_to_offset(addr)
         
         # Write byte
-        self.memory[offset] = data.copy()
+        self.memory[offset] = bits_to_int_unsigned(data)
+        self.write_generation += 1
     
-    def load_program(self, hex_file_path: str) -> None:
+    def load_program(self, program, base: Optional[int] = None) -> None:
         """
-        Load program from .hex file into instruction memory.
+        Load a program into instruction memory.
         
         Args:
-            hex_file_path: Path to .hex file containing 32-bit words
+            program: Path to a .hex file containing 32-bit words, a raw
+                     little-endian memory image (bytes/bytearray/memoryview),
+                     or a sequence of 32-bit instruction words as ints
+            base: Load address (default INSTRUCTION_BASE, 0x00000000)
         
         Convention:
         - Each line in .hex file is 8 hex digits (32 bits)
-        - Words loaded starting at INSTRUCTION_BASE (0x00000000)
-        - Sequential word addresses (0x00000000, 0x00000004, 0x00000008, ...)
+        - Words loaded starting at base
+        - Sequential word addresses (base, base+4, base+8, ...)
+        - Hex files are decoded straight to a little-endian image and word
+          sequences packed with one struct call; either way the image is
+          copied in one slice assignment
         
         Raises:
             FileNotFoundError: If hex file doesn't exist
-            ValueError: If hex file format is invalid
+            ValueError: If hex file format is invalid, a word is outside
+                        uint32 range, or the program does not fit in memory
+                        at a word-aligned base
         """
-        from riscsim.utils.hex_loader import load_hex_file
-        
-        # Load words from hex file
-        words = load_hex_file(hex_file_path)
+        if base is None:
+            base = self.INSTRUCTION_BASE
         
-        # Convert starting address to bits
-        addr = int_to_bits_unsigned(self.INSTRUCTION_BASE, 32)
-        
-        # Track program bounds
-        self.program_start = self.INSTRUCTION_BASE
-        
-        # Write each word to memory
-        for word in words:
-            # Convert word to 32-bit array
-            word_bits = int_to_bits_unsigned(word, 32)
+        if isinstance(program, (bytes, bytearray, memoryview)):
+            image = program
+        elif isinstance(program, (str, os.PathLike)):
+            from riscsim.utils.hex_loader import load_hex_image
             
-            # Write word
-            self.write_word(addr, word_bits)
-            
-            # Increment address by 4 (I/O BOUNDARY: address arithmetic)
-            addr_int = bits_to_int_unsigned(addr)
-            addr_int += 4
-            addr = int_to_bits_unsigned(addr_int, 32)
+            # Load the hex file straight to a little-endian image
+            image = load_hex_image(program)
+        else:
+            # I/O BOUNDARY: pack the words little-endian in one call
+            try:
+                image = struct.pack(f'<{len(program)}I', *program)
+            except struct.error as e:
+                raise ValueError(f"Invalid program word: {e}") from None
+        
+        # I/O BOUNDARY: address arithmetic for the image bounds
+        offset = base - self.base_addr
+        end = offset + len(image)
+        if offset < 0 or end > self.size_bytes:
+            raise ValueError(
+                f"Program of {len(image)} bytes at 0x{base:08X} does not fit in memory"
+            )
+        if base & 0b11:
+            raise ValueError(f"Address 0x{base:08X} is not word-aligned")
+        
+        self.memory[offset:end] = image
+        self.write_generation += 1
         
-        # Set program end
-        self.program_end = self.program_start + (len(words) * 4)
+        # Track program bounds
+        self.program_start = base
+        self.program_end = base + len(image)
     
     def dump_memory(self, start_addr: int, end_addr: int) -> str:
         """
@@ -10,6 +10,9 @@ Implements:
 All values represented as bit arrays (lists of 0/1).
 Convention: MSB at index 0, LSB at end.
 
+Internally each register file is a flat array of 32-bit words; bit
+arrays are converted at the read/write boundary.
+
 Usage:
     rf = RegisterFile()
 
@@ -32,7 +35,11 @@ Usage:
     flags = rf.get_fflags()
 """
 
-from riscsim.utils.bit_utils import slice_bits, set_bit, get_bit, bits_to_int_unsigned
+from array import array
+
+from riscsim.utils.bit_utils import (
+    slice_bits, set_bit, get_bit, bits_to_int_unsigned, int_to_bits_unsigned
+)
 
 
 # Constants
@@ -51,6 +58,60 @@ NUM_FP_REGS = 32  # Number of floating-point registers
 #   Bit 1: UF (Underflow)
 #   Bit 0: NX (Inexact)
 
+# Register storage typecode: 'I' where a C unsigned int holds 32 bits (every
+# mainstream platform), else 'L' (an unsigned long is at least 32 bits).
+# Writes mask to 32 bits, so a wider item still wraps correctly.
+_WORD_TYPECODE = 'I' if array('I').itemsize >= 4 else 'L'
+
+
+def _word_to_bits(word):
+    """
+    Convert a stored 32-bit word to a fresh bit array.
+
+    I/O BOUNDARY: register storage is word-based; callers see bit arrays.
+    """
+    return int_to_bits_unsigned(word, 32)
+
+
+def _bits_to_word(bits):
+    """
+    Convert a bit array to a 32-bit word for storage.
+
+    I/O BOUNDARY: register storage is word-based; callers see bit arrays.
+
+    Raises:
+        ValueError: If any element is not 0 or 1
+    """
+    try:
+        return bits_to_int_unsigned(bits)
+    except (TypeError, ValueError):
+        raise ValueError(f"Register value must contain only 0/1 bits: {bits}")
+
+
+def _check_reg_range(start, count, num_regs, kind):
+    """Validate a run of register numbers and return its exclusive end."""
+    if count is None:
+        count = num_regs - start
+    end = start + count
+    if not (0 <= start <= end <= num_regs):
+        raise ValueError(
+            f"Invalid {kind} register range: {start}..{end - 1}. "
+            f"Must be within 0-{num_regs-1}"
+        )
+    return end
+
+
+def _values_to_words(values, width):
+    """Convert a list of register values to words, checking each bit width."""
+    words = []
+    for value in values:
+        if len(value) != width:
+            raise ValueError(
+                f"Value must be {width} bits, got {len(value)} bits"
+            )
+        words.append(_bits_to_word(value))
+    return words
+
 
 class RegisterFile:
     """
@@ -63,18 +124,29 @@ class RegisterFile:
     def __init__(self):
         """Initialize register file with all registers set to zero."""
         # 32 integer registers (x0-x31), all initialized to zero
-        # Each register is XLEN bits (32 bits for RV32)
-        self.int_regs = [[0] * XLEN for _ in range(NUM_INT_REGS)]
+        # Each register is one XLEN-bit (32-bit for RV32) unsigned word
+        self.int_regs = array(_WORD_TYPECODE, [0]) * NUM_INT_REGS
 
         # 32 floating-point registers (f0-f31), all initialized to zero
-        # Each register is FLEN bits (32 bits for F extension)
-        self.fp_regs = [[0] * FLEN for _ in range(NUM_FP_REGS)]
+        # Each register is one FLEN-bit (32-bit) word holding the raw IEEE-754 bits
+        self.fp_regs = array(_WORD_TYPECODE, [0]) * NUM_FP_REGS
 
         # FCSR: Floating-Point Control and Status Register (8 bits)
         # Bits 7-5: frm (rounding mode)
         # Bits 4-0: fflags (exception flags: NV, DZ, OF, UF, NX)
         self.fcsr = [0] * FCSR_WIDTH
 
+    def clear(self):
+        """
+        Reset every register and the FCSR to zero in place.
+
+        Cheaper than building a new RegisterFile, so one instance can be
+        reused across independent programs or tests.
+        """
+        self.int_regs[:] = array(_WORD_TYPECODE, [0]) * NUM_INT_REGS
+        self.fp_regs[:] = array(_WORD_TYPECODE, [0]) * NUM_FP_REGS
+        self.fcsr[:] = [0] * FCSR_WIDTH
+
     # =========================================================================
     # Integer Register Operations
     # =========================================================================
@@ -108,12 +180,8 @@ class RegisterFile:
                 f"Must be 0-{NUM_INT_REGS-1}"
             )
 
-        # x0 is hardwired to zero
-        if reg_num == 0:
-            return [0] * XLEN
-
-        # Return a copy to prevent external modification
-        return self.int_regs[reg_num][:]
+        # x0 is hardwired to zero (its word is never written)
+        return _word_to_bits(self.int_regs[reg_num])
 
     def write_int_reg(self, reg_num, value):
         """
@@ -153,8 +221,94 @@ class RegisterFile:
         if reg_num == 0:
             return
 
-        # Store a copy to prevent external modification
-        self.int_regs[reg_num] = value[:]
+        self.int_regs[reg_num] = _bits_to_word(value)
+
+    def read_int_reg_int(self, reg_num):
+        """
+        Read integer register x[reg_num] as an unsigned integer.
+
+        ***** I/O BOUNDARY FUNCTION *****
+        Skips the bit-array conversion for callers (loaders, tests) that
+        want the numeric value directly.
+
+        Args:
+            reg_num: Register number as integer 0-31
+
+        Returns:
+            Unsigned 32-bit register value (x0 always reads 0)
+
+        Raises:
+            ValueError: If reg_num is out of range
+        """
+        if not (0 <= reg_num < NUM_INT_REGS):
+            raise ValueError(
+                f"Invalid integer register number: {reg_num}. "
+                f"Must be 0-{NUM_INT_REGS-1}"
+            )
+        return self.int_regs[reg_num]
+
+    def write_int_reg_int(self, reg_num, value):
+        """
+        Write an integer value to integer register x[reg_num].
+
+        ***** I/O BOUNDARY FUNCTION *****
+        Negative values are stored in two's complement; only the low
+        32 bits are kept.
+
+        Args:
+            reg_num: Register number as integer 0-31
+            value: Integer value to write
+
+        Raises:
+            ValueError: If reg_num is out of range
+
+        Note:
+            Writes to x0 are silently ignored (x0 is hardwired to zero).
+        """
+        if not (0 <= reg_num < NUM_INT_REGS):
+            raise ValueError(
+                f"Invalid integer register number: {reg_num}. "
+                f"Must be 0-{NUM_INT_REGS-1}"
+            )
+        if reg_num:
+            self.int_regs[reg_num] = value & 0xFFFFFFFF
+
+    def read_int_regs(self, start=0, count=None):
+        """
+        Read a run of consecutive integer registers in one call.
+
+        Args:
+            start: First register number (integer 0-31)
+            count: Number of registers to read (default: through x31)
+
+        Returns:
+            List of 32-bit arrays for x[start] .. x[start+count-1].
+
+        Raises:
+            ValueError: If the range falls outside x0-x31
+        """
+        end = _check_reg_range(start, count, NUM_INT_REGS, "integer")
+        return [_word_to_bits(word) for word in self.int_regs[start:end]]
+
+    def write_int_regs(self, start, values):
+        """
+        Write consecutive integer registers x[start], x[start+1], ... in one call.
+
+        Args:
+            start: First register number (integer 0-31)
+            values: List of 32-bit arrays
+
+        Raises:
+            ValueError: If the range falls outside x0-x31 or a value is wrong width
+
+        Note:
+            A value aimed at x0 is silently ignored, as with write_int_reg.
+        """
+        end = _check_reg_range(start, len(values), NUM_INT_REGS, "integer")
+        words = _values_to_words(values, XLEN)
+        if start == 0 and words:
+            words[0] = 0
+        self.int_regs[start:end] = array(_WORD_TYPECODE, words)
 
     # =========================================================================
     # Floating-Point Register Operations
@@ -188,8 +342,7 @@ class RegisterFile:
                 f"Must be 0-{NUM_FP_REGS-1}"
             )
 
-        # Return a copy to prevent external modification
-        return self.fp_regs[reg_num][:]
+        return _word_to_bits(self.fp_regs[reg_num])
 
     def write_fp_reg(self, reg_num, value):
         """
@@ -222,8 +375,38 @@ class RegisterFile:
                 f"Value must be {FLEN} bits, got {len(value)} bits"
             )
 
-        # Store a copy to prevent external modification
-        self.fp_regs[reg_num] = value[:]
+        self.fp_regs[reg_num] = _bits_to_word(value)
+
+    def read_fp_regs(self, start=0, count=None):
+        """
+        Read a run of consecutive floating-point registers in one call.
+
+        Args:
+            start: First register number (integer 0-31)
+            count: Number of registers to read (default: through f31)
+
+        Returns:
+            List of 32-bit arrays for f[start] .. f[start+count-1].
+
+        Raises:
+            ValueError: If the range falls outside f0-f31
+        """
+        end = _check_reg_range(start, count, NUM_FP_REGS, "FP")
+        return [_word_to_bits(word) for word in self.fp_regs[start:end]]
+
+    def write_fp_regs(self, start, values):
+        """
+        Write consecutive floating-point registers f[start], f[start+1], ... in one call.
+
+        Args:
+            start: First register number (integer 0-31)
+            values: List of 32-bit arrays
+
+        Raises:
+            ValueError: If the range falls outside f0-f31 or a value is wrong width
+        """
+        end = _check_reg_range(start, len(values), NUM_FP_REGS, "FP")
+        self.fp_regs[start:end] = array(_WORD_TYPECODE, _values_to_words(values, FLEN))
 
     # =========================================================================
     # FCSR (Floating-Point Control and Status Register) Operations
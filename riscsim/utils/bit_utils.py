@@ -262,7 +262,7 @@ def bits_to_binary_string(bits, group_size=4):
 def bits_to_hex_string(bits):
     """Convert bit array to hexadecimal string using manual lookup tables.
 
-    No use of hex(), format(), or int() with base conversion.
+    No use of the hex/format builtins or of int() with a base.
 
     Args:
         bits: List of bits (will be padded to multiple of 4 if needed)
@@ -363,11 +363,26 @@ def binary_string_to_bits(bin_str):
     return bits
 
 
+# A 32-bit word packed into a host int (bit 31 = MSB). Only the I/O
+# boundary APIs (memory images, loaders, tracers) traffic in these; the
+# datapath itself stays on bit arrays.
+Word32 = int
+
+
+# Byte translation table from bit values (0/1) to ASCII digits ('0'/'1'),
+# used by bits_to_int_unsigned below.
+_BITS_TO_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+
+# Byte value -> its 8 bits MSB first, as a bytes object of 0/1 values,
+# used by int_to_bits_unsigned below.
+_BYTE_TO_BITS = tuple(bytes((b >> (7 - i)) & 1 for i in range(8)) for b in range(256))
+
+
 def int_to_bits_unsigned(value, width):
     """Convert unsigned integer to bit array.
 
     ***** TEST-ONLY FUNCTION *****
-    WARNING: This function uses Python arithmetic operators (%, //, &, >>) and
+    WARNING: This function uses Python integer masking and int.to_bytes and
     should ONLY be used in TEST CODE for generating test data.
 
     DO NOT use in implementation modules (ALU, MDU, FPU, etc.)!
@@ -385,25 +400,23 @@ def int_to_bits_unsigned(value, width):
     """
     if value < 0:
         raise ValueError("Value must be non-negative")
+    if width <= 0:
+        return []
 
-    # I/O boundary conversion - uses Python operators for test data generation
-    bits = []
-    temp = value
-
-    for _ in range(width):
-        bits.append(temp % 2)
-        temp = temp // 2
-
-    bits.reverse()
-    return bits
+    # I/O boundary conversion - pack the low `width` bits into big-endian
+    # bytes, expand each byte through the table and drop the padding bits
+    nbytes = (width + 7) // 8
+    packed = (value & ((1 << width) - 1)).to_bytes(nbytes, 'big')
+    bits = b''.join(map(_BYTE_TO_BITS.__getitem__, packed))
+    return list(bits[8 * nbytes - width:])
 
 
 def bits_to_int_unsigned(bits):
     """Convert bit array to unsigned integer.
 
     ***** TEST-ONLY FUNCTION *****
-    WARNING: This function uses Python arithmetic operators (+, <<) and
-    should ONLY be used in TEST CODE for verification and assertions.
+    WARNING: This function uses Python integer parsing and should ONLY be
+    used in TEST CODE for verification and assertions.
 
     DO NOT use in implementation modules (ALU, MDU, FPU, etc.)!
     Implementation modules must use bit-level operations only.
@@ -417,14 +430,32 @@ def bits_to_int_unsigned(bits):
     Returns:
         Non-negative integer
     """
-    result = 0
-    power = 1
+    if not bits:
+        return 0
 
-    # I/O boundary conversion - uses Python operators for test verification
-    for i in range(len(bits) - 1, -1, -1):
-        if bits[i] == 1:
-            result += power
-        power += power  # Double (equivalent to power << 1)
+    # I/O boundary conversion - render the bits as ASCII digits and let
+    # int() parse them in one C call
+    return int(bytes(bits).translate(_BITS_TO_DIGITS), 2)
 
-    return result
+
+def bits_to_int_signed(bits):
+    """Convert two's complement bit array to signed integer.
+
+    ***** TEST-ONLY FUNCTION *****
+    WARNING: This function uses Python integer arithmetic and should ONLY be
+    used in TEST CODE for verification and assertions.
+
+    Sign-extends the unsigned value without branching: flipping the sign
+    bit and subtracting its weight maps [2^(n-1), 2^n) onto [-2^(n-1), 0).
+
+    Args:
+        bits: List of bits (MSB is the sign bit)
+
+    Returns:
+        Signed integer
+    """
+    if not bits:
+        return 0
+    sign = 1 << (len(bits) - 1)
+    return (bits_to_int_unsigned(bits) ^ sign) - sign
 # AI-END
@@ -16,15 +16,31 @@ Date: November 2025
 # AI-BEGIN: Claude Code (Anthropic) - November 14, 2025
 # Prompt: "Implement hex file loader for RISC-V CPU Phase 1, following constraints"
 
-from typing import List
+import io
+import mmap
+import os
+import struct
+from typing import BinaryIO, Iterable, List, Optional, TextIO, Union
 
 
-def parse_hex_line(line: str) -> int:
+# What the loaders accept: a filesystem path or an already-open text or
+# binary stream
+HexSource = Union[str, os.PathLike, TextIO, BinaryIO]
+
+# Files at least this large are memory-mapped and decoded straight from the
+# mapping; below it the mmap setup costs more than a buffered read
+MMAP_THRESHOLD = 64 * 1024
+
+# str.translate table deleting every hex digit: whatever survives is invalid
+_DELETE_HEX_DIGITS = str.maketrans('', '', '0123456789ABCDEFabcdef')
+
+
+def parse_hex_line(line: Union[str, bytes]) -> int:
     """
     Parse a single hex line to integer.
     
     Args:
-        line: String containing 8 hex digits (32-bit word)
+        line: String (or ASCII bytes) containing 8 hex digits (32-bit word)
     
     Returns:
         Integer value of hex string
@@ -37,6 +53,10 @@ def parse_hex_line(line: str) -> int:
     - Must be exactly 8 hex digits
     - Case insensitive (A-F or a-f)
     """
+    # Lines read from a binary stream
+    if isinstance(line, (bytes, bytearray)):
+        line = line.decode('utf-8', 'replace')
+    
     # Remove whitespace
     line = line.strip()
     
@@ -48,27 +68,172 @@ def parse_hex_line(line: str) -> int:
     if len(line) != 8:
         raise ValueError(f"Hex line must be 8 digits, got {len(line)}: '{line}'")
     
-    # Validate hex characters
-    valid_hex = set('0123456789ABCDEFabcdef')
-    for char in line:
-        if char not in valid_hex:
-            raise ValueError(f"Invalid hex character '{char}' in line: '{line}'")
+    # Fast path: ASCII letters and digits only rules out the sign,
+    # underscore, whitespace and non-ASCII digit forms int() would also
+    # accept, and the second-character test rules out its 0x/0X prefix,
+    # so int() itself rejects the rest (letters past F)
+    # I/O BOUNDARY: using int() for format conversion
+    if line.isascii() and line.isalnum() and line[1] not in 'xX':
+        try:
+            return int(line, 16)
+        except ValueError:
+            pass
+    
+    # Invalid: one C-level pass deletes the valid digits, and the first
+    # survivor is the first invalid character
+    invalid = line.translate(_DELETE_HEX_DIGITS)
+    raise ValueError(f"Invalid hex character '{invalid[0]}' in line: '{line}'")
+
+
+def _parse_stream(lines: Iterable[Union[str, bytes]]) -> List[int]:
+    """
+    Parse an iterable of hex lines into 32-bit words.
+    
+    Args:
+        lines: Lines of hex text, str or bytes (an open file, io.StringIO,
+               io.BytesIO, a list)
+    
+    Returns:
+        List of 32-bit words as integers (blank lines skipped; may be empty)
+    
+    Raises:
+        ValueError: If a line is invalid (message prefixed with "Line N:")
+    """
+    words = []
+    for line_num, line in enumerate(lines, 1):
+        try:
+            word = parse_hex_line(line)
+        except ValueError as e:
+            raise ValueError(f"Line {line_num}: {e}")
+        
+        # Skip blank lines
+        if word is not None:
+            words.append(word)
+    
+    return words
+
+
+def _batch_image(text: str) -> Optional[bytes]:
+    """
+    Decode a well-formed hex file's words in bulk, without per-line parsing.
+    
+    A file in the canonical layout (every line exactly 8 digits and '\n')
+    is checked with one strided slice and decoded after dropping the
+    newlines, so no per-line objects are built. Anything else is stripped
+    line by line, blank lines dropped, and the rest checked for 8
+    characters. Either way the digits are validated and packed by a single
+    bytes.fromhex() call.
+    
+    Args:
+        text: Full file contents
+    
+    Returns:
+        The words as one big-endian byte string, or None if some line is
+        malformed (leave it to _parse_stream to find and report it)
+    """
+    count, extra = divmod(len(text), 9)
+    if not extra and text[8::9] == '\n' * count:
+        digits = text.replace('\n', '')
+    else:
+        lines = list(filter(None, map(str.strip, text.split('\n'))))
+        if not set(map(len, lines)) <= {8}:
+            return None
+        digits = ''.join(lines)
     
-    # Convert to int (I/O BOUNDARY: using int() for format conversion)
     try:
-        value = int(line, 16)
-    except ValueError as e:
-        raise ValueError(f"Failed to parse hex line '{line}': {e}")
+        image = bytes.fromhex(digits)
+    except ValueError:
+        return None
     
-    return value
+    # fromhex() skips spaces between digit pairs, so a word with an inner
+    # space (or a stray newline) decodes short
+    return image if 2 * len(image) == len(digits) else None
 
 
-def validate_hex_file(filepath: str) -> bool:
+def _parse_text(text: str) -> List[int]:
+    """
+    Parse the whole text of a hex file into 32-bit words.
+    
+    Well-formed files are decoded in bulk by _batch_image and unpacked with
+    one struct.unpack() call. Otherwise the text is re-parsed line by line
+    with _parse_stream, which reports the first bad line.
+    
+    Args:
+        text: Full file contents
+    
+    Returns:
+        List of 32-bit words as integers (may be empty)
+    
+    Raises:
+        ValueError: If a line is invalid (message prefixed with "Line N:")
+    """
+    image = _batch_image(text)
+    if image is None:
+        return _parse_stream(io.StringIO(text))
+    return list(struct.unpack(f'>{len(image) // 4}I', image))
+
+
+def _read_hex_text(path) -> str:
+    """
+    Read the text of a hex file from disk.
+    
+    The file is opened in binary mode and decoded in one call, skipping the
+    text layer's incremental decoder and newline translation. Small files
+    are read whole; large ones are mapped with mmap and decoded straight
+    from the page cache.
+    
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            return _decode_hex_bytes(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _decode_hex_bytes(mm)
+
+
+def _decode_hex_bytes(data) -> str:
+    """
+    Decode raw hex file bytes (bytes, bytearray or an mmap) in one call.
+    
+    Undecodable bytes become U+FFFD so the parser still reports them as
+    invalid characters, and line endings are normalized to '\n' as text
+    mode would.
+    """
+    text = str(data, 'utf-8', 'replace')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _read_hex_source(source: HexSource) -> str:
+    """
+    Read the full text of a hex file path or an open text or binary stream.
+    
+    Bytes read from a binary stream are decoded like a file on disk.
+    
+    Raises:
+        FileNotFoundError: If a path is given and the file doesn't exist
+    """
+    if hasattr(source, 'read'):
+        text = source.read()
+        if isinstance(text, (bytes, bytearray)):
+            return _decode_hex_bytes(text)
+        return text
+    
+    try:
+        return _read_hex_text(source)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Hex file not found: {source}")
+
+
+def validate_hex_file(filepath: HexSource) -> bool:
     """
     Validate hex file format.
     
     Args:
-        filepath: Path to .hex file
+        filepath: Path to .hex file, or an open text or binary stream
+                  (e.g. io.StringIO, io.BytesIO)
     
     Returns:
         True if valid, False otherwise
@@ -76,34 +241,24 @@ def validate_hex_file(filepath: str) -> bool:
     Raises:
         FileNotFoundError: If file doesn't exist
         ValueError: If format is invalid
-    """
-    try:
-        with open(filepath, 'r') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                
-                # Skip blank lines
-                if not line:
-                    continue
-                
-                # Validate line
-                try:
-                    parse_hex_line(line)
-                except ValueError as e:
-                    raise ValueError(f"Line {line_num}: {e}")
-        
-        return True
     
-    except FileNotFoundError:
-        raise FileNotFoundError(f"Hex file not found: {filepath}")
+    Convention:
+    - Well-formed files are checked in bulk without building the word list;
+      only a malformed file is walked line by line, to report the bad line
+    """
+    text = _read_hex_source(filepath)
+    if _batch_image(text) is None:
+        _parse_stream(io.StringIO(text))
+    return True
 
 
-def load_hex_file(filepath: str) -> List[int]:
+def load_hex_file(filepath: HexSource) -> List[int]:
     """
     Load .hex file into list of 32-bit words.
     
     Args:
-        filepath: Path to .hex file
+        filepath: Path to .hex file, or an open text or binary stream
+                  (e.g. io.StringIO, io.BytesIO)
     
     Returns:
         List of 32-bit words as integers
@@ -126,32 +281,58 @@ def load_hex_file(filepath: str) -> List[int]:
         Returns:
             [0x00500093, 0x00A00113, 0x002081B3]
     """
-    words = []
-    
-    try:
-        with open(filepath, 'r') as f:
-            for line_num, line in enumerate(f, 1):
-                # Parse line
-                try:
-                    word = parse_hex_line(line)
-                    
-                    # Skip blank lines
-                    if word is None:
-                        continue
-                    
-                    # Add to list
-                    words.append(word)
-                
-                except ValueError as e:
-                    raise ValueError(f"Line {line_num}: {e}")
-    
-    except FileNotFoundError:
-        raise FileNotFoundError(f"Hex file not found: {filepath}")
+    words = _parse_text(_read_hex_source(filepath))
     
     # Validate we got at least one word
     if not words:
-        raise ValueError(f"Hex file is empty: {filepath}")
+        _raise_empty(filepath)
     
     return words
 
+
+def load_hex_image(filepath: HexSource) -> bytes:
+    """
+    Load .hex file as a little-endian memory image.
+    
+    Same input rules and errors as load_hex_file, but the result is the
+    bytes a loader copies into memory (word 0 at offset 0, least
+    significant byte first), so no per-word ints are created on the way.
+    
+    Args:
+        filepath: Path to .hex file, or an open text or binary stream
+                  (e.g. io.StringIO, io.BytesIO)
+    
+    Returns:
+        Little-endian image, 4 bytes per word
+    
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If file format is invalid
+    
+    Convention:
+    - I/O BOUNDARY FUNCTION (byte-order conversion for memory images)
+    """
+    text = _read_hex_source(filepath)
+    image = _batch_image(text)
+    if image is None:
+        words = _parse_stream(io.StringIO(text))
+        image = struct.pack(f'>{len(words)}I', *words)
+    
+    if not image:
+        _raise_empty(filepath)
+    
+    # Big-endian words -> little-endian: four strided byte copies
+    swapped = bytearray(len(image))
+    swapped[0::4] = image[3::4]
+    swapped[1::4] = image[2::4]
+    swapped[2::4] = image[1::4]
+    swapped[3::4] = image[0::4]
+    return bytes(swapped)
+
+
+def _raise_empty(filepath: HexSource) -> None:
+    """Raise the ValueError for a hex source with no words."""
+    name = getattr(filepath, 'name', '<stream>') if hasattr(filepath, 'read') else filepath
+    raise ValueError(f"Hex file is empty: {name}")
+
 # AI-END
@@ -0,0 +1,55 @@
+"""
+Shared pytest configuration for the RISCSim test suite.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from riscsim.cpu import fpu
+from riscsim.cpu.datapath import Datapath
+from riscsim.cpu.decoder import InstructionDecoder
+from riscsim.cpu.memory import Memory
+from riscsim.cpu.registers import RegisterFile
+
+
+@pytest.fixture
+def fpu_trace(monkeypatch):
+    """Build FPU step traces for the test; they are off by default."""
+    monkeypatch.setattr(fpu, '_TRACE', True)
+
+
+@pytest.fixture(scope='session')
+def decoder():
+    """One stateless instruction decoder shared across the whole session."""
+    return InstructionDecoder()
+
+
+# Smallest memory the datapath tests touch: code near 0x0 plus one data
+# word at the start of the data region (0x00010000).
+DUT_MEM_SIZE = 0x10010
+
+
+@pytest.fixture(scope='module')
+def _dut():
+    """One Memory/RegisterFile/Datapath set built per test module."""
+    mem = Memory(size_bytes=DUT_MEM_SIZE, base_addr=0x00000000)
+    rf = RegisterFile()
+    dp = Datapath(mem, rf)
+    return SimpleNamespace(mem=mem, rf=rf, dp=dp)
+
+
+@pytest.fixture
+def dut(_dut):
+    """The module's device under test, cleared and reset before each test."""
+    _dut.mem.clear()
+    _dut.rf.clear()
+    _dut.dp.reset()
+    return _dut
+
+
+@pytest.fixture
+def rf(_dut):
+    """The module's register file on its own, cleared before each test."""
+    _dut.rf.clear()
+    return _dut.rf
@@ -183,6 +183,14 @@ def test_int_to_bits_unsigned():
     expected = [0, 0, 0, 0, 0, 0, 0, 0]
     assert result == expected, f"Expected {expected}, got {result}"
 
+    # Values wider than the target keep only the low bits
+    result = int_to_bits_unsigned(0x1AB, 8)
+    expected = [1, 0, 1, 0, 1, 0, 1, 1]
+    assert result == expected, f"Expected {expected}, got {result}"
+
+    # Zero width yields an empty array
+    assert int_to_bits_unsigned(5, 0) == []
+
     print("✓ int_to_bits_unsigned test passed")
 
 
@@ -203,9 +211,24 @@ def test_bits_to_int_unsigned():
     result = bits_to_int_unsigned(bits)
     assert result == 0, f"Expected 0, got {result}"
 
+    # Tuples and the empty array are accepted
+    assert bits_to_int_unsigned((1, 0, 1)) == 5
+    assert bits_to_int_unsigned([]) == 0
+
     print("✓ bits_to_int_unsigned test passed")
 
 
+def test_bits_to_int_signed():
+    """Test two's complement bits to signed integer conversion."""
+    assert bits_to_int_signed([0, 1, 1, 1]) == 7
+    assert bits_to_int_signed([1, 0, 0, 0]) == -8
+    assert bits_to_int_signed([1] * 32) == -1
+    assert bits_to_int_signed([1, 1, 1, 1, 1, 1, 0, 0]) == -4
+    assert bits_to_int_signed([]) == 0
+
+    print("✓ bits_to_int_signed test passed")
+
+
 def test_roundtrip_conversions():
     """Test that conversions are reversible."""
     # Hex roundtrip
@@ -248,6 +271,7 @@ if __name__ == "__main__":
     test_binary_string_to_bits()
     test_int_to_bits_unsigned()
     test_bits_to_int_unsigned()
+    test_bits_to_int_signed()
     test_roundtrip_conversions()
 
     print("\n✅ All bit_utils tests passed!")
@@ -283,4 +283,25 @@ class TestControlUnitFPU:
         # Ensure source registers unchanged
         assert rf.read_fp_reg([0,0,0,0,1]) == [0,0,1,1,1,1,1,1,1] + [0]*23
         assert rf.read_fp_reg([0,0,0,1,0]) == [0,0,1,1,1,1,1,1,1] + [0]*23
+    
+    def test_fpu_flags_snapshot_survives_next_op(self):
+        """Test an op's recorded flags are not overwritten by the next FP op."""
+        rf = RegisterFile()
+        cu = ControlUnit(register_file=rf)
+        
+        # f1 = +inf, f2 = -inf, f3 = 1.0
+        rf.write_fp_reg([0,0,0,0,1], [0] + [1]*8 + [0]*23)
+        rf.write_fp_reg([0,0,0,1,0], [1] + [1]*8 + [0]*23)
+        rf.write_fp_reg([0,0,0,1,1], [0,0,1,1,1,1,1,1,1] + [0]*23)
+        
+        # inf + -inf is invalid
+        result = cu.execute_fpu_instruction("FADD", [0,0,0,0,1], [0,0,0,1,0], [0,0,1,0,0])
+        assert result['flags']['invalid'] == 1
+        first_flags = cu.operation_data['fpu_flags']
+        
+        # 1.0 + 1.0 raises nothing
+        cu.reset()
+        result = cu.execute_fpu_instruction("FADD", [0,0,0,1,1], [0,0,0,1,1], [0,0,1,0,1])
+        assert result['flags']['invalid'] == 0
+        assert first_flags['invalid'] == 1
 # AI-END
@@ -116,7 +116,7 @@ def test_single_cycle_alu_operation():
     assert bits_to_int(wb_result['read_a']) == 300
     
     # Verify final state
-    assert bits_to_int(rf.read_int_reg(3)) == 300
+    assert rf.read_int_reg_int(3) == 300
 
 
 def test_single_cycle_with_shifter():
@@ -239,7 +239,7 @@ def test_multi_cycle_mdu_division():
     signals.rf_waddr = int_to_bits(12, 5)
     
     wb_result = register_with_control(rf, signals, mdu_result['result'])
-    assert bits_to_int(rf.read_int_reg(12)) == 25
+    assert rf.read_int_reg_int(12) == 25
 
 
 # =============================================================================
@@ -361,7 +361,7 @@ def test_mixed_operation_sequence():
     signals.rf_we = 1
     signals.rf_waddr = int_to_bits(3, 5)
     register_with_control(rf, signals, alu_result['result'])
-    assert bits_to_int(rf.read_int_reg(3)) == 15
+    assert rf.read_int_reg_int(3) == 15
     
     # Instruction 4: SLL x4, x3, 2
     # Decode
@@ -378,7 +378,7 @@ def test_mixed_operation_sequence():
     signals.rf_we = 1
     signals.rf_waddr = int_to_bits(4, 5)
     register_with_control(rf, signals, shift_result['result'])
-    assert bits_to_int(rf.read_int_reg(4)) == 60
+    assert rf.read_int_reg_int(4) == 60
     
     # Instruction 5: MUL x5, x4, x2
     # Decode
@@ -396,14 +396,14 @@ def test_mixed_operation_sequence():
     signals.rf_we = 1
     signals.rf_waddr = int_to_bits(5, 5)
     register_with_control(rf, signals, mdu_result['result'])
-    assert bits_to_int(rf.read_int_reg(5)) == 300
+    assert rf.read_int_reg_int(5) == 300
     
     # Verify final register state
-    assert bits_to_int(rf.read_int_reg(1)) == 10
-    assert bits_to_int(rf.read_int_reg(2)) == 5
-    assert bits_to_int(rf.read_int_reg(3)) == 15
-    assert bits_to_int(rf.read_int_reg(4)) == 60
-    assert bits_to_int(rf.read_int_reg(5)) == 300
+    assert rf.read_int_reg_int(1) == 10
+    assert rf.read_int_reg_int(2) == 5
+    assert rf.read_int_reg_int(3) == 15
+    assert rf.read_int_reg_int(4) == 60
+    assert rf.read_int_reg_int(5) == 300
 
 
 def test_mixed_integer_and_float_operations():
@@ -431,7 +431,7 @@ def test_mixed_integer_and_float_operations():
     signals.rf_waddr = int_to_bits(3, 5)
     register_with_control(rf, signals, alu_result['result'])
     
-    assert bits_to_int(rf.read_int_reg(3)) == 150
+    assert rf.read_int_reg_int(3) == 150
     
     # Floating-point operation: FADD.S f3, f1, f2
     rf.write_fp_reg(1, float_to_bits(2.5))
@@ -450,7 +450,7 @@ def test_mixed_integer_and_float_operations():
     assert abs(bits_to_float(rf.read_fp_reg(3)) - 6.0) < 0.0001
     
     # Verify both results coexist
-    assert bits_to_int(rf.read_int_reg(3)) == 150  # Integer result preserved
+    assert rf.read_int_reg_int(3) == 150  # Integer result preserved
     assert abs(bits_to_float(rf.read_fp_reg(3)) - 6.0) < 0.0001  # FP result
 
 
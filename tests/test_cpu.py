@@ -91,7 +91,10 @@ class TestBasicExecution:
         cpu.set_register(1, 42)
         cpu.set_register(2, 100)
         cpu.set_memory_word(0x00000000, 0x00500093)
+        cpu.set_memory_word(0x00000004, 0x0000006F)  # JAL x0, 0 (halt)
         cpu.step()  # Execute one instruction
+        cpu.datapath.run_until_halt(1)
+        assert cpu.datapath.halted
         
         # Verify state changed
         assert cpu.get_register(1) != 0 or cpu.get_pc() != 0x00000000
@@ -107,6 +110,10 @@ class TestBasicExecution:
         # Verify memory NOT cleared (program still loaded)
         assert cpu.get_memory_word(0x00000000) == 0x00500093
         
+        # Verify datapath state reset (cycle count, halt flag)
+        assert cpu.datapath.get_cycle_count() == 0
+        assert not cpu.datapath.halted
+        
         # Verify statistics reset
         stats = cpu.get_statistics()
         assert stats.total_cycles == 0
@@ -133,6 +140,11 @@ class TestBasicExecution:
         
         with pytest.raises(ValueError):
             cpu.set_register(-1, 100)
+        
+        # Test negative values are rejected, not wrapped
+        with pytest.raises(ValueError, match="non-negative"):
+            cpu.set_register(5, -1)
+        assert cpu.get_register(5) == 0x12345678
 
 
 class TestProgramExecution:
@@ -19,9 +19,11 @@ import pytest
 from riscsim.cpu.alu import alu
 from riscsim.cpu.shifter import shifter
 from riscsim.cpu.mdu import mul, mulh, div, rem
-from riscsim.cpu.fpu import pack_f32, unpack_f32, fadd_f32, fsub_f32, fmul_f32
-from riscsim.cpu.registers import RegisterFile
-from riscsim.utils.bit_utils import bits_to_hex_string, hex_string_to_bits, int_to_bits_unsigned
+from riscsim.cpu.fpu import (pack_f32, unpack_f32, classify_float32,
+                             fadd_f32, fsub_f32, fmul_f32, fmul_add_f32, fdot_f32,
+                             fadd_f32_result, fmul_f32_result, fmul_add_f32_result)
+from riscsim.utils.bit_utils import (bits_to_hex_string, hex_string_to_bits, int_to_bits_unsigned,
+                                     bits_to_int_unsigned, bits_to_int_signed)
 from riscsim.utils.twos_complement import encode_twos_complement, decode_twos_complement
 
 
@@ -31,17 +33,70 @@ from riscsim.utils.twos_complement import encode_twos_complement, decode_twos_co
 
 def int_to_bin32(n):
     """Convert integer to 32-bit binary list (MSB at index 0)."""
-    if n < 0:
-        n = (1 << 32) + n  # Two's complement conversion
-    return [(n >> (31 - i)) & 1 for i in range(32)]
+    return int_to_bits_unsigned(n & 0xFFFFFFFF, 32)  # Two's complement conversion
 
 
 def bin32_to_int(bits, signed=False):
     """Convert 32-bit binary list to integer."""
-    val = sum(bit << (31 - i) for i, bit in enumerate(bits))
-    if signed and bits[0] == 1:
-        val -= (1 << 32)
-    return val
+    return bits_to_int_signed(bits) if signed else bits_to_int_unsigned(bits)
+
+
+# Loop-invariant operand constants. RegisterFile copies on write, so these
+# can be shared freely; never mutate them in place.
+_BIN_ZERO = int_to_bin32(0)
+_BIN_ONE = int_to_bin32(1)
+_BIN_HALF_FP = pack_f32(0.5)
+_BIN_QUARTER_FP = pack_f32(0.25)
+_BIN_FOUR_FP = pack_f32(4.0)
+_BIN_TEN_FP = pack_f32(10.0)
+_BIN_C2F_SCALE_FP = pack_f32(1.8)    # 9/5
+_BIN_C2F_OFFSET_FP = pack_f32(32.0)
+_BIN_GRAVITY_FP = pack_f32(-9.8)
+_BIN_DT_FP = pack_f32(0.1)
+
+# Q16.16 fixed-point operands (value * 2^16), folded once at import.
+_FX_ONE = 1 << 16
+_FX_3_25 = int_to_bin32(int(3.25 * _FX_ONE))  # 212992
+_FX_2_75 = int_to_bin32(int(2.75 * _FX_ONE))  # 180224
+
+
+def rf_add(rf, rd, rs1, rs2):
+    """Fused register-file ADD: x[rd] = x[rs1] + x[rs2] through the ALU.
+
+    Returns the ALU flags [N, Z, C, V].
+    """
+    result, flags = alu(rf.read_int_reg(rs1), rf.read_int_reg(rs2), [0, 0, 1, 0])
+    rf.write_int_reg(rd, result)
+    return flags
+
+
+def horner_eval(rf, coeff_regs, x_reg, out_reg):
+    """Evaluate a polynomial in FP registers with Horner's method.
+
+    coeff_regs lists the coefficient registers from the highest degree down;
+    each further coefficient costs one multiply-add (acc * x + coeff).
+    f[out_reg] receives the result.
+    """
+    x = rf.read_fp_reg(x_reg)
+    acc = rf.read_fp_reg(coeff_regs[0])
+    for reg in coeff_regs[1:]:
+        acc = fmul_add_f32_result(acc, x, rf.read_fp_reg(reg))
+    rf.write_fp_reg(out_reg, acc)
+
+
+def fsum_tree(rf, regs):
+    """Sum FP registers by pairwise (tree) reduction; returns the result bits.
+
+    Adds neighbours level by level, so the dependency chain is O(log n)
+    deep instead of O(n) for a running sum.
+    """
+    vals = [rf.read_fp_reg(r) for r in regs]
+    while len(vals) > 1:
+        paired = [fadd_f32_result(vals[i], vals[i + 1]) for i in range(0, len(vals) - 1, 2)]
+        if len(vals) % 2:
+            paired.append(vals[-1])
+        vals = paired
+    return vals[0]
 
 
 # ============================================================================
@@ -55,10 +110,8 @@ class TestPhase1ComponentIntegration:
     Tests basic operations combining ALU, Shifter, MDU, FPU, and Register File.
     """
     
-    def test_all_alu_operations(self):
+    def test_all_alu_operations(self, rf):
         """Test all ALU operations in sequence with register file."""
-        rf = RegisterFile()
-        
         # Setup: Load test values
         rf.write_int_reg(1, int_to_bin32(0xFF00FF00))  # x1 = pattern A
         rf.write_int_reg(2, int_to_bin32(0x00FF00FF))  # x2 = pattern B
@@ -92,10 +145,8 @@ class TestPhase1ComponentIntegration:
         
         print("✓ All ALU operations working correctly with register file")
     
-    def test_all_shift_operations(self):
+    def test_all_shift_operations(self, rf):
         """Test all shifter operations with various shift amounts."""
-        rf = RegisterFile()
-        
         # Setup: Load test value
         test_val = int_to_bin32(0x12345678)
         rf.write_int_reg(1, test_val)
@@ -126,10 +177,8 @@ class TestPhase1ComponentIntegration:
         
         print("✓ All shifter operations working correctly")
     
-    def test_mdu_operations(self):
+    def test_mdu_operations(self, rf):
         """Test MDU multiply and divide operations."""
-        rf = RegisterFile()
-        
         # Test MUL: 123 * 456
         rf.write_int_reg(1, int_to_bin32(123))
         rf.write_int_reg(2, int_to_bin32(456))
@@ -169,24 +218,22 @@ class TestPhase1ComponentIntegration:
         
         print("✓ MDU operations working correctly")
     
-    def test_fpu_operations(self):
+    def test_fpu_operations(self, rf):
         """Test FPU operations with floating-point register file."""
-        rf = RegisterFile()
-        
         # Test FADD
         rf.write_fp_reg(1, pack_f32(3.14159))
         rf.write_fp_reg(2, pack_f32(2.71828))
         
-        fadd_result = fadd_f32(rf.read_fp_reg(1), rf.read_fp_reg(2))
-        rf.write_fp_reg(3, fadd_result['result'])
+        fadd_result = fadd_f32(rf.read_fp_reg(1), rf.read_fp_reg(2)).result
+        rf.write_fp_reg(3, fadd_result)
         
         result_val = unpack_f32(rf.read_fp_reg(3))
         assert abs(result_val - (3.14159 + 2.71828)) < 1e-5
         print(f"  FADD: 3.14159 + 2.71828 = {result_val}")
         
         # Test FSUB
-        fsub_result = fsub_f32(rf.read_fp_reg(1), rf.read_fp_reg(2))
-        rf.write_fp_reg(4, fsub_result['result'])
+        fsub_result = fsub_f32(rf.read_fp_reg(1), rf.read_fp_reg(2)).result
+        rf.write_fp_reg(4, fsub_result)
         
         result_val = unpack_f32(rf.read_fp_reg(4))
         assert abs(result_val - (3.14159 - 2.71828)) < 1e-5
@@ -194,10 +241,10 @@ class TestPhase1ComponentIntegration:
         
         # Test FMUL
         rf.write_fp_reg(5, pack_f32(2.5))
-        rf.write_fp_reg(6, pack_f32(4.0))
+        rf.write_fp_reg(6, _BIN_FOUR_FP)
         
-        fmul_result = fmul_f32(rf.read_fp_reg(5), rf.read_fp_reg(6))
-        rf.write_fp_reg(7, fmul_result['result'])
+        fmul_result = fmul_f32(rf.read_fp_reg(5), rf.read_fp_reg(6)).result
+        rf.write_fp_reg(7, fmul_result)
         
         result_val = unpack_f32(rf.read_fp_reg(7))
         assert abs(result_val - 10.0) < 1e-5
@@ -205,10 +252,8 @@ class TestPhase1ComponentIntegration:
         
         print("✓ FPU operations working correctly")
     
-    def test_register_file_isolation(self):
+    def test_register_file_isolation(self, rf):
         """Test that integer and FP register files are isolated."""
-        rf = RegisterFile()
-        
         # Write same register number in both files
         rf.write_int_reg(5, int_to_bin32(12345))
         rf.write_fp_reg(5, pack_f32(67.89))
@@ -239,7 +284,7 @@ class TestPhase2IntegerPrograms:
     and division with remainder.
     """
     
-    def test_fibonacci_sequence(self):
+    def test_fibonacci_sequence(self, rf):
         """
         Simulate computing Fibonacci sequence: 0, 1, 1, 2, 3, 5, 8, 13, 21, 34
         
@@ -249,19 +294,16 @@ class TestPhase2IntegerPrograms:
             for i in 2..n:
                 f[i] = f[i-1] + f[i-2]
         """
-        rf = RegisterFile()
-        
         # Initialize
-        rf.write_int_reg(1, int_to_bin32(0))   # f[n-2] = 0
-        rf.write_int_reg(2, int_to_bin32(1))   # f[n-1] = 1
+        rf.write_int_reg(1, _BIN_ZERO)   # f[n-2] = 0
+        rf.write_int_reg(2, _BIN_ONE)   # f[n-1] = 1
         
         fib_sequence = [0, 1]
         
         # Compute next 8 Fibonacci numbers
         for i in range(8):
             # f[n] = f[n-1] + f[n-2]
-            result, _ = alu(rf.read_int_reg(2), rf.read_int_reg(1), [0, 0, 1, 0])  # ADD
-            rf.write_int_reg(3, result)
+            rf_add(rf, 3, 2, 1)
             
             fib_val = bin32_to_int(rf.read_int_reg(3))
             fib_sequence.append(fib_val)
@@ -276,40 +318,35 @@ class TestPhase2IntegerPrograms:
         
         print(f"✓ Fibonacci sequence computed: {fib_sequence}")
     
-    def test_array_sum(self):
+    def test_array_sum(self, rf):
         """
         Simulate computing sum of an array: [10, 20, 30, 40, 50]
         Expected sum: 150
         """
-        rf = RegisterFile()
-        
         # Load array values into registers x1-x5
         array = [10, 20, 30, 40, 50]
         for i, val in enumerate(array, 1):
             rf.write_int_reg(i, int_to_bin32(val))
         
         # Initialize sum to 0 in x10
-        rf.write_int_reg(10, int_to_bin32(0))
+        rf.write_int_reg(10, _BIN_ZERO)
         
         # Accumulate sum
         for i in range(1, 6):
-            result, _ = alu(rf.read_int_reg(10), rf.read_int_reg(i), [0, 0, 1, 0])  # ADD
-            rf.write_int_reg(10, result)
+            rf_add(rf, 10, 10, i)
         
         total_sum = bin32_to_int(rf.read_int_reg(10))
         assert total_sum == 150
         
         print(f"✓ Array sum computed: {total_sum}")
     
-    def test_multiply_by_shifting(self):
+    def test_multiply_by_shifting(self, rf):
         """
         Simulate multiplication using shifts and adds: 25 * 13
         
         Algorithm: 25 * 13 = 25 * (8 + 4 + 1) = (25 << 3) + (25 << 2) + 25
         Expected: 325
         """
-        rf = RegisterFile()
-        
         # Load multiplicand: x1 = 25
         rf.write_int_reg(1, int_to_bin32(25))
         
@@ -322,26 +359,22 @@ class TestPhase2IntegerPrograms:
         rf.write_int_reg(3, shifted_4)
         
         # Sum: (25 << 3) + (25 << 2)
-        temp_sum, _ = alu(rf.read_int_reg(2), rf.read_int_reg(3), [0, 0, 1, 0])
-        rf.write_int_reg(4, temp_sum)
+        rf_add(rf, 4, 2, 3)
         
         # Add original value: sum + 25
-        final_result, _ = alu(rf.read_int_reg(4), rf.read_int_reg(1), [0, 0, 1, 0])
-        rf.write_int_reg(5, final_result)
+        rf_add(rf, 5, 4, 1)
         
         result = bin32_to_int(rf.read_int_reg(5))
         assert result == 325
         
         print(f"✓ Multiplication by shifting: 25 * 13 = {result}")
     
-    def test_division_with_remainder(self):
+    def test_division_with_remainder(self, rf):
         """
         Simulate division with remainder: 1234 / 17
         
         Expected: quotient = 72, remainder = 10
         """
-        rf = RegisterFile()
-        
         # Load dividend and divisor
         rf.write_int_reg(1, int_to_bin32(1234))
         rf.write_int_reg(2, int_to_bin32(17))
@@ -361,22 +394,19 @@ class TestPhase2IntegerPrograms:
         mul_result = mul(rf.read_int_reg(3), rf.read_int_reg(2))
         rf.write_int_reg(5, mul_result['result'])
         
-        verification, _ = alu(rf.read_int_reg(5), rf.read_int_reg(4), [0, 0, 1, 0])
-        rf.write_int_reg(6, verification)
+        rf_add(rf, 6, 5, 4)
         
         assert bin32_to_int(rf.read_int_reg(6)) == 1234
         
         print(f"✓ Division: 1234 / 17 = {quotient} remainder {remainder}")
     
-    def test_bit_manipulation_extract_field(self):
+    def test_bit_manipulation_extract_field(self, rf):
         """
         Simulate extracting bit field from a 32-bit value.
         
         Extract bits [15:8] from 0xABCD1234
         Expected: 0x12
         """
-        rf = RegisterFile()
-        
         # Load value: x1 = 0xABCD1234
         rf.write_int_reg(1, int_to_bin32(0xABCD1234))
         
@@ -396,14 +426,12 @@ class TestPhase2IntegerPrograms:
         
         print(f"✓ Bit field extraction: bits[15:8] of 0xABCD1234 = {hex(extracted)}")
     
-    def test_absolute_value(self):
+    def test_absolute_value(self, rf):
         """
         Simulate computing absolute value of signed integers.
         
         Test cases: -42 -> 42, 100 -> 100, -1 -> 1
         """
-        rf = RegisterFile()
-        
         test_cases = [-42, 100, -1, -2147483647]
         
         for test_val in test_cases:
@@ -416,8 +444,7 @@ class TestPhase2IntegerPrograms:
             
             if is_negative:
                 # Compute two's complement: invert and add 1
-                zero = int_to_bin32(0)
-                negated, _ = alu(zero, rf.read_int_reg(1), [0, 1, 1, 0])  # SUB: 0 - val
+                negated, _ = alu(_BIN_ZERO, rf.read_int_reg(1), [0, 1, 1, 0])  # SUB: 0 - val
                 rf.write_int_reg(2, negated)
             else:
                 rf.write_int_reg(2, rf.read_int_reg(1))
@@ -438,6 +465,7 @@ class TestPhase2IntegerPrograms:
 # Phase 3: Floating-Point Program Simulations
 # ============================================================================
 
+@pytest.mark.floatpoint
 class TestPhase3FloatingPointPrograms:
     """
     Phase 3: Simulate realistic floating-point programs.
@@ -446,7 +474,7 @@ class TestPhase3FloatingPointPrograms:
     statistical calculations.
     """
     
-    def test_vector_dot_product(self):
+    def test_vector_dot_product(self, rf):
         """
         Simulate vector dot product: a · b
         
@@ -454,117 +482,81 @@ class TestPhase3FloatingPointPrograms:
         b = [4.0, 5.0, 6.0]
         Expected: 1*4 + 2*5 + 3*6 = 4 + 10 + 18 = 32.0
         """
-        rf = RegisterFile()
-        
         # Load vector a into f1-f3
         rf.write_fp_reg(1, pack_f32(1.0))
         rf.write_fp_reg(2, pack_f32(2.0))
         rf.write_fp_reg(3, pack_f32(3.0))
         
         # Load vector b into f4-f6
-        rf.write_fp_reg(4, pack_f32(4.0))
+        rf.write_fp_reg(4, _BIN_FOUR_FP)
         rf.write_fp_reg(5, pack_f32(5.0))
         rf.write_fp_reg(6, pack_f32(6.0))
         
-        # Compute products
-        prod1 = fmul_f32(rf.read_fp_reg(1), rf.read_fp_reg(4))
-        rf.write_fp_reg(7, prod1['result'])  # f7 = 1.0 * 4.0 = 4.0
-        
-        prod2 = fmul_f32(rf.read_fp_reg(2), rf.read_fp_reg(5))
-        rf.write_fp_reg(8, prod2['result'])  # f8 = 2.0 * 5.0 = 10.0
-        
-        prod3 = fmul_f32(rf.read_fp_reg(3), rf.read_fp_reg(6))
-        rf.write_fp_reg(9, prod3['result'])  # f9 = 3.0 * 6.0 = 18.0
-        
-        # Sum products
-        sum1 = fadd_f32(rf.read_fp_reg(7), rf.read_fp_reg(8))
-        rf.write_fp_reg(10, sum1['result'])  # f10 = 4.0 + 10.0 = 14.0
-        
-        sum2 = fadd_f32(rf.read_fp_reg(10), rf.read_fp_reg(9))
-        rf.write_fp_reg(11, sum2['result'])  # f11 = 14.0 + 18.0 = 32.0
+        # f11 = f1*f4 + f2*f5 + f3*f6 as one multiply-accumulate chain
+        dot = fdot_f32([rf.read_fp_reg(i) for i in (1, 2, 3)],
+                       [rf.read_fp_reg(i) for i in (4, 5, 6)])
+        rf.write_fp_reg(11, dot.result)  # f11 = 4.0 + 10.0 + 18.0 = 32.0
         
         dot_product = unpack_f32(rf.read_fp_reg(11))
         assert abs(dot_product - 32.0) < 1e-5
         
         print(f"✓ Vector dot product: [1,2,3] · [4,5,6] = {dot_product}")
     
-    def test_polynomial_evaluation(self):
+    @pytest.mark.parametrize("a, b, c, x, expected", [
+        (2.0, 3.0, 1.0, 4.0, 45.0),    # 2(16) + 3(4) + 1
+        (1.0, 0.0, -1.0, 3.0, 8.0),    # x² - 1
+        (0.5, -2.0, 4.0, 2.0, 2.0),    # 0.5(4) - 2(2) + 4
+        (-1.0, 1.0, 0.0, 0.0, 0.0),    # zero input
+    ])
+    def test_polynomial_evaluation(self, rf, a, b, c, x, expected):
         """
-        Simulate evaluating polynomial: P(x) = 2x² + 3x + 1
+        Simulate evaluating polynomial: P(x) = ax² + bx + c
         
-        Evaluate at x = 4.0
-        Expected: 2(16) + 3(4) + 1 = 32 + 12 + 1 = 45.0
+        Evaluated with Horner's method, e.g. 2x² + 3x + 1 at x = 4.0
+        gives 2(16) + 3(4) + 1 = 45.0
         """
-        rf = RegisterFile()
-        
         # Load coefficients and x
-        rf.write_fp_reg(1, pack_f32(2.0))  # a = 2
-        rf.write_fp_reg(2, pack_f32(3.0))  # b = 3
-        rf.write_fp_reg(3, pack_f32(1.0))  # c = 1
-        rf.write_fp_reg(4, pack_f32(4.0))  # x = 4
-        
-        # Compute x²
-        x_squared = fmul_f32(rf.read_fp_reg(4), rf.read_fp_reg(4))
-        rf.write_fp_reg(5, x_squared['result'])  # f5 = 16.0
-        
-        # Compute 2x²
-        term1 = fmul_f32(rf.read_fp_reg(1), rf.read_fp_reg(5))
-        rf.write_fp_reg(6, term1['result'])  # f6 = 32.0
+        rf.write_fp_reg(1, pack_f32(a))
+        rf.write_fp_reg(2, pack_f32(b))
+        rf.write_fp_reg(3, pack_f32(c))
+        rf.write_fp_reg(4, pack_f32(x))
         
-        # Compute 3x
-        term2 = fmul_f32(rf.read_fp_reg(2), rf.read_fp_reg(4))
-        rf.write_fp_reg(7, term2['result'])  # f7 = 12.0
-        
-        # Sum: 2x² + 3x
-        sum1 = fadd_f32(rf.read_fp_reg(6), rf.read_fp_reg(7))
-        rf.write_fp_reg(8, sum1['result'])  # f8 = 44.0
-        
-        # Add constant: 2x² + 3x + 1
-        result = fadd_f32(rf.read_fp_reg(8), rf.read_fp_reg(3))
-        rf.write_fp_reg(9, result['result'])  # f9 = 45.0
+        # Horner form: ((a * x) + b) * x + c -> 2 multiply-adds
+        horner_eval(rf, [1, 2, 3], 4, 9)
         
         poly_value = unpack_f32(rf.read_fp_reg(9))
-        assert abs(poly_value - 45.0) < 1e-5
+        assert abs(poly_value - expected) < 1e-5
         
-        print(f"✓ Polynomial P(4) = 2x² + 3x + 1 = {poly_value}")
+        print(f"✓ Polynomial P({x}) = {a}x² + {b}x + {c} = {poly_value}")
     
-    def test_statistical_mean(self):
+    def test_statistical_mean(self, rf):
         """
         Simulate computing mean of floating-point values.
         
         Data: [2.5, 4.5, 6.5, 8.5]
         Expected mean: (2.5 + 4.5 + 6.5 + 8.5) / 4 = 22.0 / 4 = 5.5
         """
-        rf = RegisterFile()
-        
         # Load data into f1-f4
         data = [2.5, 4.5, 6.5, 8.5]
         for i, val in enumerate(data, 1):
             rf.write_fp_reg(i, pack_f32(val))
         
-        # Compute sum
-        sum1 = fadd_f32(rf.read_fp_reg(1), rf.read_fp_reg(2))
-        rf.write_fp_reg(5, sum1['result'])
-        
-        sum2 = fadd_f32(rf.read_fp_reg(3), rf.read_fp_reg(4))
-        rf.write_fp_reg(6, sum2['result'])
-        
-        total_sum = fadd_f32(rf.read_fp_reg(5), rf.read_fp_reg(6))
-        rf.write_fp_reg(7, total_sum['result'])  # f7 = 22.0
+        # Pairwise sum: (f1 + f2) + (f3 + f4) = 22.0
+        rf.write_fp_reg(7, fsum_tree(rf, [1, 2, 3, 4]))
         
         # Divide by count (using multiplication by reciprocal since we don't have FDIV)
         # 1/4 = 0.25
-        rf.write_fp_reg(8, pack_f32(0.25))
+        rf.write_fp_reg(8, _BIN_QUARTER_FP)
         
-        mean_result = fmul_f32(rf.read_fp_reg(7), rf.read_fp_reg(8))
-        rf.write_fp_reg(9, mean_result['result'])
+        mean_result = fmul_f32_result(rf.read_fp_reg(7), rf.read_fp_reg(8))
+        rf.write_fp_reg(9, mean_result)
         
         mean = unpack_f32(rf.read_fp_reg(9))
         assert abs(mean - 5.5) < 1e-5
         
         print(f"✓ Statistical mean of [2.5, 4.5, 6.5, 8.5] = {mean}")
     
-    def test_distance_calculation(self):
+    def test_distance_calculation(self, rf):
         """
         Simulate computing Euclidean distance: √((x₂-x₁)² + (y₂-y₁)²)
         
@@ -572,33 +564,31 @@ class TestPhase3FloatingPointPrograms:
         Point B: (4.0, 6.0)
         Expected: √(9 + 16) = √25 = 5.0
         """
-        rf = RegisterFile()
-        
         # Load points
         rf.write_fp_reg(1, pack_f32(1.0))  # x1
         rf.write_fp_reg(2, pack_f32(2.0))  # y1
-        rf.write_fp_reg(3, pack_f32(4.0))  # x2
+        rf.write_fp_reg(3, _BIN_FOUR_FP)  # x2
         rf.write_fp_reg(4, pack_f32(6.0))  # y2
         
         # Compute dx = x2 - x1
-        dx = fsub_f32(rf.read_fp_reg(3), rf.read_fp_reg(1))
-        rf.write_fp_reg(5, dx['result'])  # f5 = 3.0
+        dx = fsub_f32(rf.read_fp_reg(3), rf.read_fp_reg(1)).result
+        rf.write_fp_reg(5, dx)  # f5 = 3.0
         
         # Compute dy = y2 - y1
-        dy = fsub_f32(rf.read_fp_reg(4), rf.read_fp_reg(2))
-        rf.write_fp_reg(6, dy['result'])  # f6 = 4.0
+        dy = fsub_f32(rf.read_fp_reg(4), rf.read_fp_reg(2)).result
+        rf.write_fp_reg(6, dy)  # f6 = 4.0
         
         # Compute dx²
-        dx_squared = fmul_f32(rf.read_fp_reg(5), rf.read_fp_reg(5))
-        rf.write_fp_reg(7, dx_squared['result'])  # f7 = 9.0
+        dx_squared = fmul_f32_result(rf.read_fp_reg(5), rf.read_fp_reg(5))
+        rf.write_fp_reg(7, dx_squared)  # f7 = 9.0
         
         # Compute dy²
-        dy_squared = fmul_f32(rf.read_fp_reg(6), rf.read_fp_reg(6))
-        rf.write_fp_reg(8, dy_squared['result'])  # f8 = 16.0
+        dy_squared = fmul_f32_result(rf.read_fp_reg(6), rf.read_fp_reg(6))
+        rf.write_fp_reg(8, dy_squared)  # f8 = 16.0
         
         # Sum: dx² + dy²
-        sum_squares = fadd_f32(rf.read_fp_reg(7), rf.read_fp_reg(8))
-        rf.write_fp_reg(9, sum_squares['result'])  # f9 = 25.0
+        sum_squares = fadd_f32_result(rf.read_fp_reg(7), rf.read_fp_reg(8))
+        rf.write_fp_reg(9, sum_squares)  # f9 = 25.0
         
         distance_squared = unpack_f32(rf.read_fp_reg(9))
         assert abs(distance_squared - 25.0) < 1e-5
@@ -611,6 +601,7 @@ class TestPhase3FloatingPointPrograms:
 # Phase 4: Mixed Integer/Float Operations
 # ============================================================================
 
+@pytest.mark.floatpoint
 class TestPhase4MixedOperations:
     """
     Phase 4: Test programs that use both integer and floating-point operations.
@@ -618,7 +609,7 @@ class TestPhase4MixedOperations:
     Programs include: integer-to-float conversion simulation, mixed calculations.
     """
     
-    def test_mixed_calculation_temperature_conversion(self):
+    def test_mixed_calculation_temperature_conversion(self, rf):
         """
         Simulate temperature conversion: Celsius to Fahrenheit
         
@@ -627,63 +618,48 @@ class TestPhase4MixedOperations:
         
         Uses integer for constant 32, float for rest.
         """
-        rf = RegisterFile()
-        
         # Integer part: constant 32
         rf.write_int_reg(1, int_to_bin32(32))
         
         # Float part: C = 25.0, factor = 9/5 = 1.8
         rf.write_fp_reg(1, pack_f32(25.0))    # Celsius
-        rf.write_fp_reg(2, pack_f32(1.8))     # 9/5
-        
-        # Compute (9/5) * C
-        temp_product = fmul_f32(rf.read_fp_reg(2), rf.read_fp_reg(1))
-        rf.write_fp_reg(3, temp_product['result'])  # f3 = 45.0
+        rf.write_fp_reg(2, _BIN_C2F_SCALE_FP)  # 9/5
         
         # Convert integer 32 to float (simulation: just pack it)
-        rf.write_fp_reg(4, pack_f32(32.0))
+        rf.write_fp_reg(4, _BIN_C2F_OFFSET_FP)
         
-        # Add: (9/5) * C + 32
-        fahrenheit = fadd_f32(rf.read_fp_reg(3), rf.read_fp_reg(4))
-        rf.write_fp_reg(5, fahrenheit['result'])
+        # (9/5) * C + 32 as one multiply-then-add call
+        fahrenheit = fmul_add_f32(rf.read_fp_reg(2), rf.read_fp_reg(1), rf.read_fp_reg(4)).result
+        rf.write_fp_reg(5, fahrenheit)
         
         result = unpack_f32(rf.read_fp_reg(5))
         assert abs(result - 77.0) < 1e-5
         
         print(f"✓ Temperature conversion: 25°C = {result}°F")
     
-    def test_fixed_point_simulation(self):
+    def test_fixed_point_simulation(self, rf):
         """
         Simulate fixed-point arithmetic using integers.
         
         Represent numbers as Q16.16 format (16 bits integer, 16 bits fraction).
         Compute: 3.25 + 2.75 = 6.0
         """
-        rf = RegisterFile()
-        
-        # Q16.16 representation: multiply by 2^16 = 65536
-        # 3.25 * 65536 = 212992
-        # 2.75 * 65536 = 180224
-        
-        val1 = int(3.25 * 65536)
-        val2 = int(2.75 * 65536)
-        
-        rf.write_int_reg(1, int_to_bin32(val1))
-        rf.write_int_reg(2, int_to_bin32(val2))
+        # Q16.16 operands are precomputed at module scope
+        rf.write_int_reg(1, _FX_3_25)
+        rf.write_int_reg(2, _FX_2_75)
         
         # Add fixed-point numbers
-        result, _ = alu(rf.read_int_reg(1), rf.read_int_reg(2), [0, 0, 1, 0])
-        rf.write_int_reg(3, result)
+        rf_add(rf, 3, 1, 2)
         
         # Convert back to float
         fixed_result = bin32_to_int(rf.read_int_reg(3))
-        float_result = fixed_result / 65536.0
+        float_result = fixed_result / _FX_ONE
         
         assert abs(float_result - 6.0) < 1e-10
         
         print(f"✓ Fixed-point arithmetic: 3.25 + 2.75 = {float_result}")
     
-    def test_scientific_calculation_kinetic_energy(self):
+    def test_scientific_calculation_kinetic_energy(self, rf):
         """
         Simulate kinetic energy calculation: KE = (1/2) * m * v²
         
@@ -691,8 +667,6 @@ class TestPhase4MixedOperations:
         Velocity (float): v = 5.0 m/s
         Expected: KE = 0.5 * 10 * 25 = 125.0 J
         """
-        rf = RegisterFile()
-        
         # Integer mass
         rf.write_int_reg(1, int_to_bin32(10))
         
@@ -700,20 +674,20 @@ class TestPhase4MixedOperations:
         rf.write_fp_reg(1, pack_f32(5.0))
         
         # Compute v²
-        v_squared = fmul_f32(rf.read_fp_reg(1), rf.read_fp_reg(1))
-        rf.write_fp_reg(2, v_squared['result'])  # f2 = 25.0
+        v_squared = fmul_f32(rf.read_fp_reg(1), rf.read_fp_reg(1)).result
+        rf.write_fp_reg(2, v_squared)  # f2 = 25.0
         
         # Convert mass to float
-        rf.write_fp_reg(3, pack_f32(10.0))
+        rf.write_fp_reg(3, _BIN_TEN_FP)
         
-        # Compute m * v²
-        mv_squared = fmul_f32(rf.read_fp_reg(3), rf.read_fp_reg(2))
-        rf.write_fp_reg(4, mv_squared['result'])  # f4 = 250.0
+        # Compute (1/2) * m first: both operands are constants
+        rf.write_fp_reg(5, _BIN_HALF_FP)
+        half_m = fmul_f32(rf.read_fp_reg(5), rf.read_fp_reg(3)).result
+        rf.write_fp_reg(4, half_m)  # f4 = 5.0
         
-        # Multiply by 0.5
-        rf.write_fp_reg(5, pack_f32(0.5))
-        ke = fmul_f32(rf.read_fp_reg(4), rf.read_fp_reg(5))
-        rf.write_fp_reg(6, ke['result'])
+        # KE = (m / 2) * v²
+        ke = fmul_f32(rf.read_fp_reg(4), rf.read_fp_reg(2)).result
+        rf.write_fp_reg(6, ke)
         
         kinetic_energy = unpack_f32(rf.read_fp_reg(6))
         assert abs(kinetic_energy - 125.0) < 1e-4
@@ -725,6 +699,7 @@ class TestPhase4MixedOperations:
 # Phase 5: Complex Real-World Scenarios
 # ============================================================================
 
+@pytest.mark.floatpoint
 class TestPhase5ComplexScenarios:
     """
     Phase 5: Simulate complex real-world programs.
@@ -733,7 +708,7 @@ class TestPhase5ComplexScenarios:
     multi-step calculations.
     """
     
-    def test_matrix_vector_multiply_2x2(self):
+    def test_matrix_vector_multiply_2x2(self, rf):
         """
         Simulate 2x2 matrix-vector multiplication using FPU.
         
@@ -743,37 +718,23 @@ class TestPhase5ComplexScenarios:
         
         Expected: A*x = [8.0, 14.0]
         """
-        rf = RegisterFile()
-        
         # Load matrix A row-major into f1-f4
         rf.write_fp_reg(1, pack_f32(2.0))  # A[0,0]
         rf.write_fp_reg(2, pack_f32(3.0))  # A[0,1]
-        rf.write_fp_reg(3, pack_f32(4.0))  # A[1,0]
+        rf.write_fp_reg(3, _BIN_FOUR_FP)  # A[1,0]
         rf.write_fp_reg(4, pack_f32(5.0))  # A[1,1]
         
         # Load vector x into f5-f6
         rf.write_fp_reg(5, pack_f32(1.0))  # x[0]
         rf.write_fp_reg(6, pack_f32(2.0))  # x[1]
         
-        # Compute y[0] = A[0,0]*x[0] + A[0,1]*x[1]
-        prod1 = fmul_f32(rf.read_fp_reg(1), rf.read_fp_reg(5))
-        rf.write_fp_reg(7, prod1['result'])  # f7 = 2.0
-        
-        prod2 = fmul_f32(rf.read_fp_reg(2), rf.read_fp_reg(6))
-        rf.write_fp_reg(8, prod2['result'])  # f8 = 6.0
+        # y = A @ x as one dot product per row, reusing the x operands
+        x = rf.read_fp_regs(5, 2)
+        y0 = fdot_f32(rf.read_fp_regs(1, 2), x).result
+        rf.write_fp_reg(9, y0)  # f9 = 2.0*1.0 + 3.0*2.0 = 8.0
         
-        y0 = fadd_f32(rf.read_fp_reg(7), rf.read_fp_reg(8))
-        rf.write_fp_reg(9, y0['result'])  # f9 = 8.0
-        
-        # Compute y[1] = A[1,0]*x[0] + A[1,1]*x[1]
-        prod3 = fmul_f32(rf.read_fp_reg(3), rf.read_fp_reg(5))
-        rf.write_fp_reg(10, prod3['result'])  # f10 = 4.0
-        
-        prod4 = fmul_f32(rf.read_fp_reg(4), rf.read_fp_reg(6))
-        rf.write_fp_reg(11, prod4['result'])  # f11 = 10.0
-        
-        y1 = fadd_f32(rf.read_fp_reg(10), rf.read_fp_reg(11))
-        rf.write_fp_reg(12, y1['result'])  # f12 = 14.0
+        y1 = fdot_f32(rf.read_fp_regs(3, 2), x).result
+        rf.write_fp_reg(12, y1)  # f12 = 4.0*1.0 + 5.0*2.0 = 14.0
         
         result_y0 = unpack_f32(rf.read_fp_reg(9))
         result_y1 = unpack_f32(rf.read_fp_reg(12))
@@ -783,15 +744,13 @@ class TestPhase5ComplexScenarios:
         
         print(f"✓ Matrix-vector multiply: y = [{result_y0}, {result_y1}]")
     
-    def test_power_of_two_checker(self):
+    def test_power_of_two_checker(self, rf):
         """
         Simulate checking if a number is a power of 2.
         
         Algorithm: n is power of 2 if (n & (n-1)) == 0 and n != 0
         Test: 16 is power of 2, 15 is not
         """
-        rf = RegisterFile()
-        
         test_cases = [
             (16, True),   # 2^4
             (15, False),  # Not power of 2
@@ -801,13 +760,14 @@ class TestPhase5ComplexScenarios:
             (0, False),   # Special case
         ]
         
+        # x2 = 1 is the same for every case
+        rf.write_int_reg(2, _BIN_ONE)
+        
         for n, expected in test_cases:
             # Load n
             rf.write_int_reg(1, int_to_bin32(n))
             
             # Compute n - 1
-            one = int_to_bin32(1)
-            rf.write_int_reg(2, one)
             n_minus_1, _ = alu(rf.read_int_reg(1), rf.read_int_reg(2), [0, 1, 1, 0])  # SUB
             rf.write_int_reg(3, n_minus_1)
             
@@ -824,15 +784,13 @@ class TestPhase5ComplexScenarios:
         
         print(f"✓ Power of 2 checker working correctly")
     
-    def test_greatest_common_divisor(self):
+    def test_greatest_common_divisor(self, rf):
         """
         Simulate Euclidean algorithm for GCD.
         
         GCD(48, 18) = 6
         Algorithm: GCD(a,b) = GCD(b, a mod b) until b == 0
         """
-        rf = RegisterFile()
-        
         # Initialize: a = 48, b = 18
         rf.write_int_reg(1, int_to_bin32(48))
         rf.write_int_reg(2, int_to_bin32(18))
@@ -862,51 +820,47 @@ class TestPhase5ComplexScenarios:
         
         print(f"✓ GCD(48, 18) = {gcd}, computed in {len(steps)} steps")
     
-    def test_complete_program_quadratic_roots(self):
+    def test_complete_program_quadratic_roots(self, rf):
         """
         Simulate computing discriminant of quadratic equation ax² + bx + c = 0
         
         Discriminant: Δ = b² - 4ac
         Test: a=1, b=5, c=6 -> Δ = 25 - 24 = 1
         """
-        rf = RegisterFile()
-        
         # Load coefficients
         rf.write_fp_reg(1, pack_f32(1.0))  # a
         rf.write_fp_reg(2, pack_f32(5.0))  # b
         rf.write_fp_reg(3, pack_f32(6.0))  # c
         
         # Compute b²
-        b_squared = fmul_f32(rf.read_fp_reg(2), rf.read_fp_reg(2))
-        rf.write_fp_reg(4, b_squared['result'])  # f4 = 25.0
+        b_squared = fmul_f32(rf.read_fp_reg(2), rf.read_fp_reg(2)).result
+        rf.write_fp_reg(4, b_squared)  # f4 = 25.0
         
         # Compute 4ac
-        rf.write_fp_reg(5, pack_f32(4.0))
+        rf.write_fp_reg(5, _BIN_FOUR_FP)
         
-        ac = fmul_f32(rf.read_fp_reg(1), rf.read_fp_reg(3))
-        rf.write_fp_reg(6, ac['result'])  # f6 = 6.0
+        ac = fmul_f32(rf.read_fp_reg(1), rf.read_fp_reg(3)).result
+        rf.write_fp_reg(6, ac)  # f6 = 6.0
         
-        four_ac = fmul_f32(rf.read_fp_reg(5), rf.read_fp_reg(6))
-        rf.write_fp_reg(7, four_ac['result'])  # f7 = 24.0
+        four_ac = fmul_f32(rf.read_fp_reg(5), rf.read_fp_reg(6)).result
+        rf.write_fp_reg(7, four_ac)  # f7 = 24.0
         
         # Compute discriminant: b² - 4ac
-        discriminant = fsub_f32(rf.read_fp_reg(4), rf.read_fp_reg(7))
-        rf.write_fp_reg(8, discriminant['result'])
+        discriminant = fsub_f32(rf.read_fp_reg(4), rf.read_fp_reg(7)).result
+        rf.write_fp_reg(8, discriminant)
         
         delta = unpack_f32(rf.read_fp_reg(8))
         assert abs(delta - 1.0) < 1e-5
         
         print(f"✓ Quadratic discriminant: Δ = b² - 4ac = {delta}")
     
-    def test_sorting_network_4_elements(self):
+    def test_sorting_network_4_elements(self, rf):
         """
         Simulate a simple 4-element sorting network using compare-swap.
         
         Input: [40, 10, 30, 20]
         Expected output: [10, 20, 30, 40]
         """
-        rf = RegisterFile()
-        
         # Load unsorted array into x1-x4
         rf.write_int_reg(1, int_to_bin32(40))
         rf.write_int_reg(2, int_to_bin32(10))
@@ -914,18 +868,13 @@ class TestPhase5ComplexScenarios:
         rf.write_int_reg(4, int_to_bin32(20))
         
         def compare_swap(reg_a, reg_b):
-            """Compare and swap if a > b using SLT."""
-            # Compute a - b
-            diff, flags = alu(rf.read_int_reg(reg_a), rf.read_int_reg(reg_b), [0, 1, 1, 0])
-            
-            # If result is negative (N flag set), then a < b, no swap needed
-            # If result is positive or zero, swap
-            N = flags[0]
+            """Swap x[reg_a] and x[reg_b] if x[reg_b] < x[reg_a], using ALU SLT."""
+            a, b = rf.read_int_reg(reg_a), rf.read_int_reg(reg_b)
+            less, _ = alu(b, a, [0, 1, 1, 1])  # SLT: 1 if b < a
             
-            if N == 0 and not all(bit == 0 for bit in diff):  # a > b, need swap
-                temp = rf.read_int_reg(reg_a)
-                rf.write_int_reg(reg_a, rf.read_int_reg(reg_b))
-                rf.write_int_reg(reg_b, temp)
+            if less[-1]:
+                rf.write_int_reg(reg_a, b)
+                rf.write_int_reg(reg_b, a)
         
         # Sorting network for 4 elements (Batcher odd-even mergesort)
         compare_swap(1, 2)
@@ -953,14 +902,14 @@ class TestCompleteCPUSimulation:
     Simulates a complex program that uses ALL CPU components together.
     """
     
-    def test_complete_simulation_physics_engine_step(self):
+    def test_complete_simulation_physics_engine_step(self, rf):
         """
         Simulate a single step of a physics engine.
         
         Update particle position and velocity:
         - v_new = v_old + a*dt (floating-point)
         - p_new = p_old + v_new*dt (floating-point)
-        - collision detection (integer bit operations)
+        - collision detection (ground check on p_new.y)
         
         Particle: pos=(10.0, 20.0), vel=(2.0, 3.0), accel=(0.0, -9.8)
         dt = 0.1
@@ -969,78 +918,49 @@ class TestCompleteCPUSimulation:
         - v_new = (2.0, 2.02)  # vy = 3.0 + (-9.8)*0.1 = 2.02
         - p_new = (10.2, 20.202)
         """
-        rf = RegisterFile()
-        
         print("\n=== Physics Engine Simulation ===")
         
         # Initial state (floating-point)
-        rf.write_fp_reg(1, pack_f32(10.0))  # px
+        rf.write_fp_reg(1, _BIN_TEN_FP)  # px
         rf.write_fp_reg(2, pack_f32(20.0))  # py
         rf.write_fp_reg(3, pack_f32(2.0))   # vx
         rf.write_fp_reg(4, pack_f32(3.0))   # vy
         rf.write_fp_reg(5, pack_f32(0.0))   # ax
-        rf.write_fp_reg(6, pack_f32(-9.8))  # ay
-        rf.write_fp_reg(7, pack_f32(0.1))   # dt
+        rf.write_fp_reg(6, _BIN_GRAVITY_FP)  # ay
+        rf.write_fp_reg(7, _BIN_DT_FP)   # dt
         
         print(f"Initial position: ({unpack_f32(rf.read_fp_reg(1))}, {unpack_f32(rf.read_fp_reg(2))})")
         print(f"Initial velocity: ({unpack_f32(rf.read_fp_reg(3))}, {unpack_f32(rf.read_fp_reg(4))})")
         
-        # Step 1: Update velocity - v_new = v_old + a*dt
-        
-        # vx_new = vx + ax*dt
-        ax_dt = fmul_f32(rf.read_fp_reg(5), rf.read_fp_reg(7))
-        rf.write_fp_reg(10, ax_dt['result'])
-        
-        vx_new = fadd_f32(rf.read_fp_reg(3), rf.read_fp_reg(10))
-        rf.write_fp_reg(11, vx_new['result'])
-        
-        # vy_new = vy + ay*dt
-        ay_dt = fmul_f32(rf.read_fp_reg(6), rf.read_fp_reg(7))
-        rf.write_fp_reg(12, ay_dt['result'])
+        # Registers hold (x, y) pairs: p=f1-f2, v=f3-f4, a=f5-f6, so each
+        # update is one multiply-add per lane over a 2-wide vector
+        dt = rf.read_fp_reg(7)
         
-        vy_new = fadd_f32(rf.read_fp_reg(4), rf.read_fp_reg(12))
-        rf.write_fp_reg(13, vy_new['result'])
+        # Step 1: Update velocity - v_new = a*dt + v_old -> f10-f11
+        v_new = [fmul_add_f32(a, dt, v).result
+                 for a, v in zip(rf.read_fp_regs(5, 2), rf.read_fp_regs(3, 2))]
+        rf.write_fp_regs(10, v_new)
         
-        print(f"New velocity: ({unpack_f32(rf.read_fp_reg(11))}, {unpack_f32(rf.read_fp_reg(13))})")
+        print(f"New velocity: ({unpack_f32(rf.read_fp_reg(10))}, {unpack_f32(rf.read_fp_reg(11))})")
         
-        # Step 2: Update position - p_new = p_old + v_new*dt
+        # Step 2: Update position - p_new = v_new*dt + p_old -> f12-f13
+        p_new = [fmul_add_f32(v, dt, p).result
+                 for v, p in zip(v_new, rf.read_fp_regs(1, 2))]
+        rf.write_fp_regs(12, p_new)
         
-        # px_new = px + vx_new*dt
-        vx_dt = fmul_f32(rf.read_fp_reg(11), rf.read_fp_reg(7))
-        rf.write_fp_reg(14, vx_dt['result'])
+        print(f"New position: ({unpack_f32(rf.read_fp_reg(12))}, {unpack_f32(rf.read_fp_reg(13))})")
         
-        px_new = fadd_f32(rf.read_fp_reg(1), rf.read_fp_reg(14))
-        rf.write_fp_reg(15, px_new['result'])
-        
-        # py_new = py + vy_new*dt
-        vy_dt = fmul_f32(rf.read_fp_reg(13), rf.read_fp_reg(7))
-        rf.write_fp_reg(16, vy_dt['result'])
-        
-        py_new = fadd_f32(rf.read_fp_reg(2), rf.read_fp_reg(16))
-        rf.write_fp_reg(17, py_new['result'])
-        
-        print(f"New position: ({unpack_f32(rf.read_fp_reg(15))}, {unpack_f32(rf.read_fp_reg(17))})")
-        
-        # Step 3: Collision detection (check if y < 0 using integer)
-        # Convert float to integer for boundary check
-        py_value = unpack_f32(rf.read_fp_reg(17))
-        
-        # Use integer comparison
-        py_int = int(py_value * 100)  # Scale for precision
-        rf.write_int_reg(1, int_to_bin32(py_int))
-        rf.write_int_reg(2, int_to_bin32(0))
-        
-        # Check if py < 0 using SUB and checking sign
-        diff, flags = alu(rf.read_int_reg(1), rf.read_int_reg(2), [0, 1, 1, 0])
-        collision = flags[0]  # N flag indicates negative (collision)
+        # Step 3: Collision detection (check if y < 0) on the FPU result bits:
+        # negative means sign bit set and not +/-0 or NaN
+        sign, _, _, is_zero, _, is_nan, _ = classify_float32(rf.read_fp_reg(13))
+        collision = 1 if sign and not (is_zero or is_nan) else 0
         
         print(f"Collision detected: {collision == 1}")
+        assert collision == 0
         
         # Verify physics calculations
-        vx_final = unpack_f32(rf.read_fp_reg(11))
-        vy_final = unpack_f32(rf.read_fp_reg(13))
-        px_final = unpack_f32(rf.read_fp_reg(15))
-        py_final = unpack_f32(rf.read_fp_reg(17))
+        vx_final, vy_final, px_final, py_final = (
+            unpack_f32(bits) for bits in rf.read_fp_regs(10, 4))
         
         assert abs(vx_final - 2.0) < 1e-5
         assert abs(vy_final - 2.02) < 1e-3
@@ -1060,19 +980,15 @@ class TestPerformanceAndStress:
     Performance and stress tests for CPU simulation.
     """
     
-    def test_long_computation_chain(self):
+    def test_long_computation_chain(self, rf):
         """Test a long chain of ALU operations (50 additions)."""
-        rf = RegisterFile()
-        
-        # Start with x1 = 1
-        rf.write_int_reg(1, int_to_bin32(1))
+        # Start with x1 = 1; x2 holds the loop-invariant increment
+        rf.write_int_reg(1, _BIN_ONE)
+        rf.write_int_reg(2, _BIN_ONE)
         
         # Perform 50 successive additions: x1 = x1 + 1
         for i in range(50):
-            one = int_to_bin32(1)
-            rf.write_int_reg(2, one)
-            result, _ = alu(rf.read_int_reg(1), rf.read_int_reg(2), [0, 0, 1, 0])
-            rf.write_int_reg(1, result)
+            rf_add(rf, 1, 1, 2)
         
         # Result should be 51
         final_val = bin32_to_int(rf.read_int_reg(1))
@@ -1080,26 +996,20 @@ class TestPerformanceAndStress:
         
         print(f"✓ Long computation chain: 50 additions completed, result = {final_val}")
     
-    def test_register_file_stress(self):
+    def test_register_file_stress(self, rf):
         """Stress test register file with many reads/writes."""
-        rf = RegisterFile()
-        
-        # Write to all integer registers (except x0)
-        for i in range(1, 32):
-            rf.write_int_reg(i, int_to_bin32(i * 100))
+        int_values = [i * 100 for i in range(1, 32)]
+        fp_values = [float(i) * 1.5 for i in range(32)]
         
-        # Write to all FP registers
-        for i in range(32):
-            rf.write_fp_reg(i, pack_f32(float(i) * 1.5))
+        # Bulk-write all integer registers (except x0) and all FP registers
+        rf.write_int_regs(1, [int_to_bin32(v) for v in int_values])
+        rf.write_fp_regs(0, [pack_f32(v) for v in fp_values])
         
         # Verify all values
-        for i in range(1, 32):
-            val = bin32_to_int(rf.read_int_reg(i))
-            assert val == i * 100
+        assert [bin32_to_int(bits) for bits in rf.read_int_regs(1)] == int_values
         
-        for i in range(32):
-            val = unpack_f32(rf.read_fp_reg(i))
-            assert abs(val - (i * 1.5)) < 1e-5
+        for bits, expected in zip(rf.read_fp_regs(), fp_values):
+            assert abs(unpack_f32(bits) - expected) < 1e-5
         
         print("✓ Register file stress test: 63 registers written and verified")
 
@@ -17,628 +17,321 @@ Author: RISCSim Team
 Date: November 14, 2025
 """
 
+import struct
+
 import pytest
-from riscsim.cpu.datapath import Datapath, CycleResult
-from riscsim.cpu.memory import Memory
-from riscsim.cpu.registers import RegisterFile
+from riscsim.cpu.datapath import Datapath
+from riscsim.cpu.decoder import Op
 from riscsim.utils.bit_utils import (
     int_to_bits_unsigned,
     bits_to_int_unsigned
 )
 
 
+# Instruction encodings, converted to 32-bit vectors once at import.
+# These are shared across tests: Memory and RegisterFile copy on write,
+# so never mutate them in place.
+NOP = int_to_bits_unsigned(0x00000013, 32)             # ADDI x0, x0, 0
+ADD_X3_X1_X2 = int_to_bits_unsigned(0x002081B3, 32)
+SUB_X4_X2_X1 = int_to_bits_unsigned(0x40110233, 32)
+ADDI_X1_X0_5 = int_to_bits_unsigned(0x00500093, 32)
+ADDI_X2_X0_10 = int_to_bits_unsigned(0x00A00113, 32)
+ADDI_X2_X1_3 = int_to_bits_unsigned(0x00308113, 32)
+ADDI_X0_X0_100 = int_to_bits_unsigned(0x06400013, 32)
+AND_X3_X1_X2 = int_to_bits_unsigned(0x0020F1B3, 32)
+OR_X3_X1_X2 = int_to_bits_unsigned(0x0020E1B3, 32)
+XOR_X3_X1_X2 = int_to_bits_unsigned(0x0020C1B3, 32)
+SLL_X3_X1_X2 = int_to_bits_unsigned(0x002091B3, 32)
+SRL_X3_X1_X2 = int_to_bits_unsigned(0x0020D1B3, 32)
+SRA_X3_X1_X2 = int_to_bits_unsigned(0x4020D1B3, 32)
+LW_X4_0_X5 = int_to_bits_unsigned(0x0002A203, 32)
+SW_X3_0_X5 = int_to_bits_unsigned(0x0032A023, 32)
+BEQ_X3_X4_8 = int_to_bits_unsigned(0x00418463, 32)
+BNE_X3_X4_8 = int_to_bits_unsigned(0x00419463, 32)
+JAL_X0_0 = int_to_bits_unsigned(0x0000006F, 32)        # Halt (jump to self)
+JAL_X1_16 = int_to_bits_unsigned(0x010000EF, 32)
+JALR_X1_X5_8 = int_to_bits_unsigned(0x008280E7, 32)
+LUI_X5_0X10 = int_to_bits_unsigned(0x000102B7, 32)
+AUIPC_X5_1 = int_to_bits_unsigned(0x00001297, 32)
+
+# Addresses used by the tests
+ADDR_0 = int_to_bits_unsigned(0x00000000, 32)
+ADDR_4 = int_to_bits_unsigned(0x00000004, 32)
+ADDR_8 = int_to_bits_unsigned(0x00000008, 32)
+ADDR_0X1000 = int_to_bits_unsigned(0x00001000, 32)
+
+# Little-endian memory image of one NOP, for bulk loads via load_program()
+NOP_IMAGE = struct.pack('<I', 0x00000013)
+
+
 class TestArithmetic:
     """Test arithmetic instructions through the datapath."""
     
-    def test_add_instruction(self):
-        """Test ADD R-type instruction: add x3, x1, x2"""
-        # Setup
-        mem = Memory(size_bytes=131072, base_addr=0x00000000)
-        rf = RegisterFile()
-        datapath = Datapath(mem, rf)
-        
-        # Load ADD x3, x1, x2 instruction
-        # ADD: opcode=0110011, funct3=000, funct7=0000000
-        # Encoding: 0000000 00010 00001 000 00011 0110011
-        # = 0x002081B3
-        addr = int_to_bits_unsigned(0x00000000, 32)
-        instruction = int_to_bits_unsigned(0x002081B3, 32)
-        mem.write_word(addr, instruction)
-        
-        # Set x1 = 5, x2 = 10
-        rf.write_int_reg(1, int_to_bits_unsigned(5, 32))
-        rf.write_int_reg(2, int_to_bits_unsigned(10, 32))
-        
-        # Execute
-        result = datapath.execute_cycle()
-        
-        # Verify
-        assert result.decoded.mnemonic == 'ADD'
-        assert bits_to_int_unsigned(rf.read_int_reg(3)) == 15
-        assert result.branch_taken == False
-        
-    def test_addi_instruction(self):
+    def test_addi_instruction(self, dut):
         """Test ADDI I-type instruction: addi x1, x0, 5"""
         # Setup
-        mem = Memory(size_bytes=131072, base_addr=0x00000000)
-        rf = RegisterFile()
-        datapath = Datapath(mem, rf)
+        mem, rf, datapath = dut.mem, dut.rf, dut.dp
         
         # Load ADDI x1, x0, 5 instruction
-        # ADDI: opcode=0010011, funct3=000, imm=5
-        # Encoding: 000000000101 00000 000 00001 0010011
-        # = 0x00500093
-        instruction = int_to_bits_unsigned(0x00500093, 32)
-        mem.write_word(int_to_bits_unsigned(0x00000000, 32), instruction)
+        mem.write_word(ADDR_0, ADDI_X1_X0_5)
         
         # Execute
         result = datapath.execute_cycle()
         
         # Verify
-        assert result.decoded.mnemonic == 'ADDI'
-        assert bits_to_int_unsigned(rf.read_int_reg(1)) == 5
-        
-    def test_sub_instruction(self):
-        """Test SUB R-type instruction: sub x4, x2, x1"""
-        # Setup
-        mem = Memory(size_bytes=131072, base_addr=0x00000000)
-        rf = RegisterFile()
-        datapath = Datapath(mem, rf)
+        assert result.decoded.op is Op.ADDI
+        assert rf.read_int_reg_int(1) == 5
         
-        # Load SUB x4, x2, x1 instruction
-        # SUB: opcode=0110011, funct3=000, funct7=0100000
-        # Encoding: 0100000 00001 00010 000 00100 0110011
-        # = 0x40110233
-        instruction = int_to_bits_unsigned(0x40110233, 32)
-        mem.write_word(int_to_bits_unsigned(0x00000000, 32), instruction)
-        
-        # Set x1 = 5, x2 = 10
-        rf.write_int_reg(1, int_to_bits_unsigned(5, 32))
-        rf.write_int_reg(2, int_to_bits_unsigned(10, 32))
-        
-        # Execute
-        result = datapath.execute_cycle()
-        
-        # Verify
-        assert result.decoded.mnemonic == 'SUB'
-        assert bits_to_int_unsigned(rf.read_int_reg(4)) == 5
-        
-    def test_arithmetic_with_zero_register(self):
+    def test_arithmetic_with_zero_register(self, dut):
         """Test that writes to x0 are ignored"""
         # Setup
-        mem = Memory(size_bytes=131072, base_addr=0x00000000)
-        rf = RegisterFile()
-        datapath = Datapath(mem, rf)
+        mem, rf, datapath = dut.mem, dut.rf, dut.dp
         
         # Load ADDI x0, x0, 100 instruction
         # This should not change x0
-        instruction = int_to_bits_unsigned(0x06400013, 32)
-        mem.write_word(int_to_bits_unsigned(0x00000000, 32), instruction)
+        mem.write_word(ADDR_0, ADDI_X0_X0_100)
         
         # Execute
         result = datapath.execute_cycle()
         
         # Verify x0 is still 0
-        assert bits_to_int_unsigned(rf.read_int_reg(0)) == 0
+        assert rf.read_int_reg_int(0) == 0
         
-    def test_arithmetic_overflow(self):
+    def test_arithmetic_overflow(self, dut):
         """Test arithmetic with values that cause overflow"""
         # Setup
-        mem = Memory(size_bytes=131072, base_addr=0x00000000)
-        rf = RegisterFile()
-        datapath = Datapath(mem, rf)
+        mem, rf, datapath = dut.mem, dut.rf, dut.dp
         
         # Load ADD x3, x1, x2 instruction
-        instruction = int_to_bits_unsigned(0x002081B3, 32)
-        mem.write_word(int_to_bits_unsigned(0x00000000, 32), instruction)
+        mem.write_word(ADDR_0, ADD_X3_X1_X2)
         
         # Set x1 and x2 to large values that overflow
-        rf.write_int_reg(1, int_to_bits_unsigned(0x7FFFFFFF, 32))  # Max positive
-        rf.write_int_reg(2, int_to_bits_unsigned(1, 32))
+        rf.write_int_reg_int(1, 0x7FFFFFFF)  # Max positive
+        rf.write_int_reg_int(2, 1)
         
         # Execute
         result = datapath.execute_cycle()
         
         # Verify overflow wraps around (no exception)
-        assert bits_to_int_unsigned(rf.read_int_reg(3)) == 0x80000000
+        assert rf.read_int_reg_int(3) == 0x80000000
 
 
-class TestLogical:
-    """Test logical instructions through the datapath."""
+class TestRType:
+    """Test R-type ALU and shift instructions through the datapath."""
     
-    def test_and_instruction(self):
-        """Test AND R-type instruction: and x3, x1, x2"""
-        # Setup
-        mem = Memory(size_bytes=131072, base_addr=0x00000000)
-        rf = RegisterFile()
-        datapath = Datapath(mem, rf)
-        
-        # Load AND x3, x1, x2 instruction
-        # AND: opcode=0110011, funct3=111, funct7=0000000
-        # Encoding: 0000000 00010 00001 111 00011 0110011
-        # = 0x0020F1B3
-        instruction = int_to_bits_unsigned(0x0020F1B3, 32)
-        mem.write_word(int_to_bits_unsigned(0x00000000, 32), instruction)
-        
-        # Set x1 = 0xFF00, x2 = 0xF0F0
-        rf.write_int_reg(1, int_to_bits_unsigned(0xFF00, 32))
-        rf.write_int_reg(2, int_to_bits_unsigned(0xF0F0, 32))
-        
-        # Execute
-        result = datapath.execute_cycle()
-        
-        # Verify x3 = 0xFF00 & 0xF0F0 = 0xF000
-        assert result.decoded.mnemonic == 'AND'
-        assert bits_to_int_unsigned(rf.read_int_reg(3)) == 0xF000
-        
-    def test_or_instruction(self):
-        """Test OR R-type instruction: or x3, x1, x2"""
-        # Setup
-        mem = Memory(size_bytes=131072, base_addr=0x00000000)
-        rf = RegisterFile()
-        datapath = Datapath(mem, rf)
-        
-        # Load OR x3, x1, x2 instruction
-        # OR: opcode=0110011, funct3=110, funct7=0000000
-        # Encoding: 0000000 00010 00001 110 00011 0110011
-        # = 0x0020E1B3
-        instruction = int_to_bits_unsigned(0x0020E1B3, 32)
-        mem.write_word(int_to_bits_unsigned(0x00000000, 32), instruction)
-        
-        # Set x1 = 0x00FF, x2 = 0xFF00
-        rf.write_int_reg(1, int_to_bits_unsigned(0x00FF, 32))
-        rf.write_int_reg(2, int_to_bits_unsigned(0xFF00, 32))
-        
-        # Execute
-        result = datapath.execute_cycle()
-        
-        # Verify x3 = 0x00FF | 0xFF00 = 0xFFFF
-        assert result.decoded.mnemonic == 'OR'
-        assert bits_to_int_unsigned(rf.read_int_reg(3)) == 0xFFFF
-        
-    def test_xor_instruction(self):
-        """Test XOR R-type instruction: xor x3, x1, x2"""
-        # Setup
-        mem = Memory(size_bytes=131072, base_addr=0x00000000)
-        rf = RegisterFile()
-        datapath = Datapath(mem, rf)
-        
-        # Load XOR x3, x1, x2 instruction
-        # XOR: opcode=0110011, funct3=100, funct7=0000000
-        # Encoding: 0000000 00010 00001 100 00011 0110011
-        # = 0x0020C1B3
-        instruction = int_to_bits_unsigned(0x0020C1B3, 32)
-        mem.write_word(int_to_bits_unsigned(0x00000000, 32), instruction)
-        
-        # Set x1 = 0xFFFF, x2 = 0xF0F0
-        rf.write_int_reg(1, int_to_bits_unsigned(0xFFFF, 32))
-        rf.write_int_reg(2, int_to_bits_unsigned(0xF0F0, 32))
-        
-        # Execute
-        result = datapath.execute_cycle()
-        
-        # Verify x3 = 0xFFFF ^ 0xF0F0 = 0x0F0F
-        assert result.decoded.mnemonic == 'XOR'
-        assert bits_to_int_unsigned(rf.read_int_reg(3)) == 0x0F0F
-
-
-class TestShifts:
-    """Test shift instructions through the datapath."""
-    
-    def test_sll_instruction(self):
-        """Test SLL (shift left logical) instruction"""
-        # Setup
-        mem = Memory(size_bytes=131072, base_addr=0x00000000)
-        rf = RegisterFile()
-        datapath = Datapath(mem, rf)
-        
-        # Load SLL x3, x1, x2 instruction
-        # SLL: opcode=0110011, funct3=001, funct7=0000000
-        # Encoding: 0000000 00010 00001 001 00011 0110011
-        # = 0x002091B3
-        instruction = int_to_bits_unsigned(0x002091B3, 32)
-        mem.write_word(int_to_bits_unsigned(0x00000000, 32), instruction)
-        
-        # Set x1 = 0x00000001, x2 = 4 (shift amount)
-        rf.write_int_reg(1, int_to_bits_unsigned(0x00000001, 32))
-        rf.write_int_reg(2, int_to_bits_unsigned(4, 32))
-        
-        # Execute
-        result = datapath.execute_cycle()
-        
-        # Verify x3 = 0x00000001 << 4 = 0x00000010
-        assert result.decoded.mnemonic == 'SLL'
-        assert bits_to_int_unsigned(rf.read_int_reg(3)) == 0x00000010
-        
-    def test_srl_instruction(self):
-        """Test SRL (shift right logical) instruction"""
-        # Setup
-        mem = Memory(size_bytes=131072, base_addr=0x00000000)
-        rf = RegisterFile()
-        datapath = Datapath(mem, rf)
-        
-        # Load SRL x3, x1, x2 instruction
-        # SRL: opcode=0110011, funct3=101, funct7=0000000
-        # Encoding: 0000000 00010 00001 101 00011 0110011
-        # = 0x0020D1B3
-        instruction = int_to_bits_unsigned(0x0020D1B3, 32)
-        mem.write_word(int_to_bits_unsigned(0x00000000, 32), instruction)
-        
-        # Set x1 = 0x00000080, x2 = 4 (shift amount)
-        rf.write_int_reg(1, int_to_bits_unsigned(0x00000080, 32))
-        rf.write_int_reg(2, int_to_bits_unsigned(4, 32))
-        
-        # Execute
-        result = datapath.execute_cycle()
-        
-        # Verify x3 = 0x00000080 >> 4 = 0x00000008
-        assert result.decoded.mnemonic == 'SRL'
-        assert bits_to_int_unsigned(rf.read_int_reg(3)) == 0x00000008
-        
-    def test_sra_instruction(self):
-        """Test SRA (shift right arithmetic) instruction"""
-        # Setup
-        mem = Memory(size_bytes=131072, base_addr=0x00000000)
-        rf = RegisterFile()
-        datapath = Datapath(mem, rf)
-        
-        # Load SRA x3, x1, x2 instruction
-        # SRA: opcode=0110011, funct3=101, funct7=0100000
-        # Encoding: 0100000 00010 00001 101 00011 0110011
-        # = 0x4020D1B3
-        instruction = int_to_bits_unsigned(0x4020D1B3, 32)
-        mem.write_word(int_to_bits_unsigned(0x00000000, 32), instruction)
+    # (op, instruction, x1, x2, rd, expected x[rd])
+    @pytest.mark.parametrize("op, instruction, a, b, rd, expected", [
+        (Op.ADD, ADD_X3_X1_X2, 5, 10, 3, 15),
+        (Op.SUB, SUB_X4_X2_X1, 5, 10, 4, 5),                  # x2 - x1
+        (Op.AND, AND_X3_X1_X2, 0xFF00, 0xF0F0, 3, 0xF000),
+        (Op.OR, OR_X3_X1_X2, 0x00FF, 0xFF00, 3, 0xFFFF),
+        (Op.XOR, XOR_X3_X1_X2, 0xFFFF, 0xF0F0, 3, 0x0F0F),
+        (Op.SLL, SLL_X3_X1_X2, 0x00000001, 4, 3, 0x00000010),
+        (Op.SRL, SRL_X3_X1_X2, 0x00000080, 4, 3, 0x00000008),
+        (Op.SRA, SRA_X3_X1_X2, 0x80000000, 4, 3, 0xF8000000),  # sign fills
+    ], ids=['add', 'sub', 'and', 'or', 'xor', 'sll', 'srl', 'sra'])
+    def test_rtype_instruction(self, dut, op, instruction, a, b, rd, expected):
+        """Test each R-type instruction writes the expected result to rd"""
+        mem, rf, datapath = dut.mem, dut.rf, dut.dp
+        mem.write_word(ADDR_0, instruction)
+        rf.write_int_reg_int(1, a)
+        rf.write_int_reg_int(2, b)
         
-        # Set x1 = 0x80000000 (negative), x2 = 4 (shift amount)
-        rf.write_int_reg(1, int_to_bits_unsigned(0x80000000, 32))
-        rf.write_int_reg(2, int_to_bits_unsigned(4, 32))
-        
-        # Execute
         result = datapath.execute_cycle()
         
-        # Verify x3 = 0x80000000 >> 4 (arithmetic) = 0xF8000000
-        assert result.decoded.mnemonic == 'SRA'
-        assert bits_to_int_unsigned(rf.read_int_reg(3)) == 0xF8000000
+        assert result.decoded.op is op
+        assert rf.read_int_reg_int(rd) == expected
+        assert result.branch_taken == False
 
 
 class TestMemory:
     """Test memory load/store instructions through the datapath."""
     
-    def test_lw_instruction(self):
-        """Test LW (load word) instruction"""
+    @pytest.mark.parametrize("addr", [0x00010000, 0x00010004, 0x00010008])
+    def test_lw_instruction(self, dut, addr):
+        """Test LW (load word) instruction from word-aligned addresses"""
         # Setup
-        mem = Memory(size_bytes=131072, base_addr=0x00000000)
-        rf = RegisterFile()
-        datapath = Datapath(mem, rf)
+        mem, rf, datapath = dut.mem, dut.rf, dut.dp
         
         # Write test data to memory at data region
-        test_data = int_to_bits_unsigned(0xDEADBEEF, 32)
-        mem.write_word(int_to_bits_unsigned(0x00010000, 32), test_data)
+        mem.write_word_int(addr, 0xDEADBEEF)
         
         # Load LW x4, 0(x5) instruction
-        # LW: opcode=0000011, funct3=010
-        # Encoding: 000000000000 00101 010 00100 0000011
-        # = 0x0002A203
-        instruction = int_to_bits_unsigned(0x0002A203, 32)
-        mem.write_word(int_to_bits_unsigned(0x00000000, 32), instruction)
+        mem.write_word(ADDR_0, LW_X4_0_X5)
         
-        # Set x5 = 0x00010000 (data region base)
-        rf.write_int_reg(5, int_to_bits_unsigned(0x00010000, 32))
+        # Set x5 to the aligned data address
+        rf.write_int_reg_int(5, addr)
         
         # Execute
         result = datapath.execute_cycle()
         
         # Verify x4 contains loaded data
-        assert result.decoded.mnemonic == 'LW'
-        assert bits_to_int_unsigned(rf.read_int_reg(4)) == 0xDEADBEEF
+        assert result.decoded.op is Op.LW
+        assert rf.read_int_reg_int(4) == 0xDEADBEEF
         
-    def test_sw_instruction(self):
+    def test_sw_instruction(self, dut):
         """Test SW (store word) instruction"""
         # Setup
-        mem = Memory(size_bytes=131072, base_addr=0x00000000)
-        rf = RegisterFile()
-        datapath = Datapath(mem, rf)
+        mem, rf, datapath = dut.mem, dut.rf, dut.dp
         
         # Load SW x3, 0(x5) instruction
-        # SW: opcode=0100011, funct3=010
-        # Encoding: 0000000 00011 00101 010 00000 0100011
-        # = 0x0032A023
-        instruction = int_to_bits_unsigned(0x0032A023, 32)
-        mem.write_word(int_to_bits_unsigned(0x00000000, 32), instruction)
+        mem.write_word(ADDR_0, SW_X3_0_X5)
         
         # Set x3 = 0x12345678, x5 = 0x00010000
-        rf.write_int_reg(3, int_to_bits_unsigned(0x12345678, 32))
-        rf.write_int_reg(5, int_to_bits_unsigned(0x00010000, 32))
+        rf.write_int_reg_int(3, 0x12345678)
+        rf.write_int_reg_int(5, 0x00010000)
         
         # Execute
         result = datapath.execute_cycle()
         
         # Verify data written to memory
-        assert result.decoded.mnemonic == 'SW'
-        stored_data = mem.read_word(int_to_bits_unsigned(0x00010000, 32))
-        assert bits_to_int_unsigned(stored_data) == 0x12345678
+        assert result.decoded.op is Op.SW
+        assert mem.read_word_int(0x00010000) == 0x12345678
         
-    def test_lw_sw_sequence(self):
+    def test_lw_sw_sequence(self, dut):
         """Test store followed by load sequence"""
         # Setup
-        mem = Memory(size_bytes=131072, base_addr=0x00000000)
-        rf = RegisterFile()
-        datapath = Datapath(mem, rf)
+        mem, rf, datapath = dut.mem, dut.rf, dut.dp
         
         # Instruction 1: SW x3, 0(x5) at PC=0x00000000
-        sw_instr = int_to_bits_unsigned(0x0032A023, 32)
-        mem.write_word(int_to_bits_unsigned(0x00000000, 32), sw_instr)
+        mem.write_word(ADDR_0, SW_X3_0_X5)
         
         # Instruction 2: LW x4, 0(x5) at PC=0x00000004
-        lw_instr = int_to_bits_unsigned(0x0002A203, 32)
-        mem.write_word(int_to_bits_unsigned(0x00000004, 32), lw_instr)
+        mem.write_word(ADDR_4, LW_X4_0_X5)
         
         # Set x3 = 15, x5 = 0x00010000
-        rf.write_int_reg(3, int_to_bits_unsigned(15, 32))
-        rf.write_int_reg(5, int_to_bits_unsigned(0x00010000, 32))
+        rf.write_int_reg_int(3, 15)
+        rf.write_int_reg_int(5, 0x00010000)
         
         # Execute SW
         result1 = datapath.execute_cycle()
-        assert result1.decoded.mnemonic == 'SW'
+        assert result1.decoded.op is Op.SW
         
         # Execute LW
         result2 = datapath.execute_cycle()
-        assert result2.decoded.mnemonic == 'LW'
+        assert result2.decoded.op is Op.LW
         
         # Verify x4 contains stored value
-        assert bits_to_int_unsigned(rf.read_int_reg(4)) == 15
-        
-    def test_memory_alignment(self):
-        """Test that memory operations respect word alignment"""
-        # Setup
-        mem = Memory(size_bytes=131072, base_addr=0x00000000)
-        rf = RegisterFile()
-        datapath = Datapath(mem, rf)
-        
-        # Load LW x4, 0(x5) instruction
-        instruction = int_to_bits_unsigned(0x0002A203, 32)
-        mem.write_word(int_to_bits_unsigned(0x00000000, 32), instruction)
-        
-        # Set x5 to aligned address
-        rf.write_int_reg(5, int_to_bits_unsigned(0x00010000, 32))
-        
-        # Should execute without error
-        result = datapath.execute_cycle()
-        assert result.decoded.mnemonic == 'LW'
+        assert rf.read_int_reg_int(4) == 15
 
 
 class TestBranches:
     """Test branch instructions through the datapath."""
     
-    def test_beq_taken(self):
-        """Test BEQ (branch if equal) when condition is true"""
-        # Setup
-        mem = Memory(size_bytes=131072, base_addr=0x00000000)
-        rf = RegisterFile()
-        datapath = Datapath(mem, rf)
-        
-        # Load BEQ x3, x4, 8 instruction (branch forward 8 bytes)
-        # BEQ: opcode=1100011, funct3=000
-        # imm = 8 = [0,0,0,0,0,0,0,0,1,0,0,0]
-        # Encoding: 0 000000 00100 00011 000 1000 0 1100011
-        # = 0x00418463
-        instruction = int_to_bits_unsigned(0x00418463, 32)
-        mem.write_word(int_to_bits_unsigned(0x00000000, 32), instruction)
-        
-        # Set x3 = x4 = 15 (equal)
-        rf.write_int_reg(3, int_to_bits_unsigned(15, 32))
-        rf.write_int_reg(4, int_to_bits_unsigned(15, 32))
+    # BEQ/BNE x3, x4, 8: taken -> PC = 0 + 8, not taken -> PC = 0 + 4
+    @pytest.mark.parametrize("op, instruction, x3, x4, taken, next_pc", [
+        (Op.BEQ, BEQ_X3_X4_8, 15, 15, True, 0x00000008),
+        (Op.BEQ, BEQ_X3_X4_8, 15, 10, False, 0x00000004),
+        (Op.BNE, BNE_X3_X4_8, 15, 10, True, 0x00000008),
+        (Op.BNE, BNE_X3_X4_8, 15, 15, False, 0x00000004),
+    ], ids=['beq_taken', 'beq_not_taken', 'bne_taken', 'bne_not_taken'])
+    def test_branch(self, dut, op, instruction, x3, x4, taken, next_pc):
+        """Test BEQ/BNE outcome and the resulting PC"""
+        mem, rf, datapath = dut.mem, dut.rf, dut.dp
+        mem.write_word(ADDR_0, instruction)
+        rf.write_int_reg_int(3, x3)
+        rf.write_int_reg_int(4, x4)
         
-        # Execute
         result = datapath.execute_cycle()
         
-        # Verify branch taken and PC updated
-        assert result.decoded.mnemonic == 'BEQ'
-        assert result.branch_taken == True
-        # PC should be 0x00000000 + 8 = 0x00000008
-        assert bits_to_int_unsigned(datapath.get_pc()) == 0x00000008
-        
-    def test_beq_not_taken(self):
-        """Test BEQ (branch if equal) when condition is false"""
-        # Setup
-        mem = Memory(size_bytes=131072, base_addr=0x00000000)
-        rf = RegisterFile()
-        datapath = Datapath(mem, rf)
-        
-        # Load BEQ x3, x4, 8 instruction
-        instruction = int_to_bits_unsigned(0x00418463, 32)
-        mem.write_word(int_to_bits_unsigned(0x00000000, 32), instruction)
-        
-        # Set x3 = 15, x4 = 10 (not equal)
-        rf.write_int_reg(3, int_to_bits_unsigned(15, 32))
-        rf.write_int_reg(4, int_to_bits_unsigned(10, 32))
-        
-        # Execute
-        result = datapath.execute_cycle()
-        
-        # Verify branch not taken, PC incremented normally
-        assert result.decoded.mnemonic == 'BEQ'
-        assert result.branch_taken == False
-        # PC should be 0x00000000 + 4 = 0x00000004
-        assert bits_to_int_unsigned(datapath.get_pc()) == 0x00000004
-        
-    def test_bne_taken(self):
-        """Test BNE (branch if not equal) when condition is true"""
-        # Setup
-        mem = Memory(size_bytes=131072, base_addr=0x00000000)
-        rf = RegisterFile()
-        datapath = Datapath(mem, rf)
-        
-        # Load BNE x3, x4, 8 instruction
-        # BNE: opcode=1100011, funct3=001
-        # Encoding: 0 000000 00100 00011 001 1000 0 1100011
-        # = 0x00419463
-        instruction = int_to_bits_unsigned(0x00419463, 32)
-        mem.write_word(int_to_bits_unsigned(0x00000000, 32), instruction)
-        
-        # Set x3 = 15, x4 = 10 (not equal)
-        rf.write_int_reg(3, int_to_bits_unsigned(15, 32))
-        rf.write_int_reg(4, int_to_bits_unsigned(10, 32))
-        
-        # Execute
-        result = datapath.execute_cycle()
-        
-        # Verify branch taken
-        assert result.decoded.mnemonic == 'BNE'
-        assert result.branch_taken == True
-        assert bits_to_int_unsigned(datapath.get_pc()) == 0x00000008
-        
-    def test_bne_not_taken(self):
-        """Test BNE (branch if not equal) when condition is false"""
-        # Setup
-        mem = Memory(size_bytes=131072, base_addr=0x00000000)
-        rf = RegisterFile()
-        datapath = Datapath(mem, rf)
-        
-        # Load BNE x3, x4, 8 instruction
-        instruction = int_to_bits_unsigned(0x00419463, 32)
-        mem.write_word(int_to_bits_unsigned(0x00000000, 32), instruction)
-        
-        # Set x3 = x4 = 15 (equal)
-        rf.write_int_reg(3, int_to_bits_unsigned(15, 32))
-        rf.write_int_reg(4, int_to_bits_unsigned(15, 32))
-        
-        # Execute
-        result = datapath.execute_cycle()
-        
-        # Verify branch not taken
-        assert result.decoded.mnemonic == 'BNE'
-        assert result.branch_taken == False
-        assert bits_to_int_unsigned(datapath.get_pc()) == 0x00000004
+        assert result.decoded.op is op
+        assert result.branch_taken == taken
+        assert bits_to_int_unsigned(datapath.get_pc()) == next_pc
 
 
 class TestJumps:
     """Test jump instructions through the datapath."""
     
-    def test_jal_instruction(self):
+    def test_jal_instruction(self, dut):
         """Test JAL (jump and link) instruction"""
         # Setup
-        mem = Memory(size_bytes=131072, base_addr=0x00000000)
-        rf = RegisterFile()
-        datapath = Datapath(mem, rf)
+        mem, rf, datapath = dut.mem, dut.rf, dut.dp
         
         # Load JAL x1, 16 instruction (jump forward 16 bytes)
-        # JAL: opcode=1101111
-        # imm[20:1] = 16 >> 1 = 8
-        # Encoding: imm[20|10:1|11|19:12] rd opcode
-        # = 0x010000EF
-        instruction = int_to_bits_unsigned(0x010000EF, 32)
-        mem.write_word(int_to_bits_unsigned(0x00000000, 32), instruction)
+        mem.write_word(ADDR_0, JAL_X1_16)
         
         # Execute
         result = datapath.execute_cycle()
         
         # Verify jump taken and return address saved
-        assert result.decoded.mnemonic == 'JAL'
+        assert result.decoded.op is Op.JAL
         # PC should jump to 0x00000000 + 16 = 0x00000010
         assert bits_to_int_unsigned(datapath.get_pc()) == 0x00000010
         # x1 should contain return address (PC+4 = 0x00000004)
-        assert bits_to_int_unsigned(rf.read_int_reg(1)) == 0x00000004
+        assert rf.read_int_reg_int(1) == 0x00000004
         
-    def test_jalr_instruction(self):
+    def test_jalr_instruction(self, dut):
         """Test JALR (jump and link register) instruction"""
         # Setup
-        mem = Memory(size_bytes=131072, base_addr=0x00000000)
-        rf = RegisterFile()
-        datapath = Datapath(mem, rf)
+        mem, rf, datapath = dut.mem, dut.rf, dut.dp
         
         # Load JALR x1, 8(x5) instruction
-        # JALR: opcode=1100111, funct3=000
-        # Encoding: 000000001000 00101 000 00001 1100111
-        # = 0x008280E7
-        instruction = int_to_bits_unsigned(0x008280E7, 32)
-        mem.write_word(int_to_bits_unsigned(0x00000000, 32), instruction)
+        mem.write_word(ADDR_0, JALR_X1_X5_8)
         
         # Set x5 = 0x00000100
-        rf.write_int_reg(5, int_to_bits_unsigned(0x00000100, 32))
+        rf.write_int_reg_int(5, 0x00000100)
         
         # Execute
         result = datapath.execute_cycle()
         
         # Verify jump taken to x5 + 8 = 0x00000108
-        assert result.decoded.mnemonic == 'JALR'
+        assert result.decoded.op is Op.JALR
         assert bits_to_int_unsigned(datapath.get_pc()) == 0x00000108
         # x1 should contain return address (PC+4 = 0x00000004)
-        assert bits_to_int_unsigned(rf.read_int_reg(1)) == 0x00000004
+        assert rf.read_int_reg_int(1) == 0x00000004
 
 
 class TestUpperImmediate:
     """Test upper immediate instructions through the datapath."""
     
-    def test_lui_instruction(self):
+    def test_lui_instruction(self, dut):
         """Test LUI (load upper immediate) instruction"""
         # Setup
-        mem = Memory(size_bytes=131072, base_addr=0x00000000)
-        rf = RegisterFile()
-        datapath = Datapath(mem, rf)
+        mem, rf, datapath = dut.mem, dut.rf, dut.dp
         
         # Load LUI x5, 0x00010 instruction
-        # LUI: opcode=0110111
-        # Encoding: imm[31:12] rd opcode
-        # 0x00010 in upper 20 bits = 0x00010000
-        # = 0x000102B7
-        instruction = int_to_bits_unsigned(0x000102B7, 32)
-        mem.write_word(int_to_bits_unsigned(0x00000000, 32), instruction)
+        mem.write_word(ADDR_0, LUI_X5_0X10)
         
         # Execute
         result = datapath.execute_cycle()
         
         # Verify x5 = 0x00010000
-        assert result.decoded.mnemonic == 'LUI'
-        assert bits_to_int_unsigned(rf.read_int_reg(5)) == 0x00010000
+        assert result.decoded.op is Op.LUI
+        assert rf.read_int_reg_int(5) == 0x00010000
         
-    def test_auipc_instruction(self):
+    def test_auipc_instruction(self, dut):
         """Test AUIPC (add upper immediate to PC) instruction"""
         # Setup
-        mem = Memory(size_bytes=131072, base_addr=0x00000000)
-        rf = RegisterFile()
-        datapath = Datapath(mem, rf)
+        mem, rf, datapath = dut.mem, dut.rf, dut.dp
         
         # Set PC to 0x00001000
         datapath.set_pc(0x00001000)
         
         # Load AUIPC x5, 0x00001 instruction
-        # AUIPC: opcode=0010111
-        # Encoding: imm[31:12] rd opcode
-        # = 0x00001297
-        instruction = int_to_bits_unsigned(0x00001297, 32)
-        mem.write_word(int_to_bits_unsigned(0x00001000, 32), instruction)
+        mem.write_word(ADDR_0X1000, AUIPC_X5_1)
         
         # Execute
         result = datapath.execute_cycle()
         
         # Verify x5 = PC + (0x00001 << 12) = 0x00001000 + 0x00001000 = 0x00002000
-        assert result.decoded.mnemonic == 'AUIPC'
-        assert bits_to_int_unsigned(rf.read_int_reg(5)) == 0x00002000
+        assert result.decoded.op is Op.AUIPC
+        assert rf.read_int_reg_int(5) == 0x00002000
 
 
 class TestIntegration:
     """Test integrated datapath scenarios."""
     
-    def test_sequential_execution(self):
+    def test_sequential_execution(self, dut):
         """Test sequential execution of multiple instructions"""
         # Setup
-        mem = Memory(size_bytes=131072, base_addr=0x00000000)
-        rf = RegisterFile()
-        datapath = Datapath(mem, rf)
-        
-        # Load 3 sequential ADDI instructions
-        # ADDI x1, x0, 5
-        mem.write_word(int_to_bits_unsigned(0x00000000, 32), int_to_bits_unsigned(0x00500093, 32))
-        # ADDI x2, x0, 10
-        mem.write_word(int_to_bits_unsigned(0x00000004, 32), int_to_bits_unsigned(0x00A00113, 32))
-        # ADD x3, x1, x2
-        mem.write_word(int_to_bits_unsigned(0x00000008, 32), int_to_bits_unsigned(0x002081B3, 32))
+        mem, rf, datapath = dut.mem, dut.rf, dut.dp
+        
+        # Load 3 sequential instructions:
+        # ADDI x1, x0, 5; ADDI x2, x0, 10; ADD x3, x1, x2
+        mem.load_program(struct.pack('<III', 0x00500093, 0x00A00113, 0x002081B3))
         
         # Execute 3 cycles
-        result1 = datapath.execute_cycle()
-        result2 = datapath.execute_cycle()
-        result3 = datapath.execute_cycle()
+        result1, result2, result3 = datapath.run_cycles(3)
         
         # Verify sequential execution
         assert bits_to_int_unsigned(result1.pc) == 0x00000000
@@ -646,24 +339,22 @@ class TestIntegration:
         assert bits_to_int_unsigned(result3.pc) == 0x00000008
         
         # Verify final state
-        assert bits_to_int_unsigned(rf.read_int_reg(1)) == 5
-        assert bits_to_int_unsigned(rf.read_int_reg(2)) == 10
-        assert bits_to_int_unsigned(rf.read_int_reg(3)) == 15
+        assert rf.read_int_reg_int(1) == 5
+        assert rf.read_int_reg_int(2) == 10
+        assert rf.read_int_reg_int(3) == 15
         
-    def test_register_dependencies(self):
+    def test_register_dependencies(self, dut):
         """Test instructions with register dependencies"""
         # Setup
-        mem = Memory(size_bytes=131072, base_addr=0x00000000)
-        rf = RegisterFile()
-        datapath = Datapath(mem, rf)
+        mem, rf, datapath = dut.mem, dut.rf, dut.dp
         
         # Load instructions with dependencies
         # ADDI x1, x0, 5    -> x1 = 5
-        mem.write_word(int_to_bits_unsigned(0x00000000, 32), int_to_bits_unsigned(0x00500093, 32))
+        mem.write_word(ADDR_0, ADDI_X1_X0_5)
         # ADDI x2, x1, 3    -> x2 = x1 + 3 = 8
-        mem.write_word(int_to_bits_unsigned(0x00000004, 32), int_to_bits_unsigned(0x00308113, 32))
+        mem.write_word(ADDR_4, ADDI_X2_X1_3)
         # ADD x3, x1, x2    -> x3 = x1 + x2 = 13
-        mem.write_word(int_to_bits_unsigned(0x00000008, 32), int_to_bits_unsigned(0x002081B3, 32))
+        mem.write_word(ADDR_8, ADD_X3_X1_X2)
         
         # Execute 3 cycles
         datapath.execute_cycle()
@@ -671,39 +362,123 @@ class TestIntegration:
         datapath.execute_cycle()
         
         # Verify results
-        assert bits_to_int_unsigned(rf.read_int_reg(1)) == 5
-        assert bits_to_int_unsigned(rf.read_int_reg(2)) == 8
-        assert bits_to_int_unsigned(rf.read_int_reg(3)) == 13
+        assert rf.read_int_reg_int(1) == 5
+        assert rf.read_int_reg_int(2) == 8
+        assert rf.read_int_reg_int(3) == 13
         
-    def test_pc_increment(self):
+    def test_pc_increment(self, dut):
         """Test that PC increments correctly"""
         # Setup
-        mem = Memory(size_bytes=131072, base_addr=0x00000000)
-        rf = RegisterFile()
-        datapath = Datapath(mem, rf)
+        mem, rf, datapath = dut.mem, dut.rf, dut.dp
         
         # Load NOP-like instruction (ADDI x0, x0, 0)
-        for i in range(10):
-            mem.write_word(int_to_bits_unsigned(i * 4, 32), int_to_bits_unsigned(0x00000013, 32))
+        mem.load_program(NOP_IMAGE * 10)
         
         # Execute 10 cycles
-        for i in range(10):
-            result = datapath.execute_cycle()
+        results = datapath.run_cycles(10)
+        assert len(results) == 10
+        for i, result in enumerate(results):
             # PC should be at i*4 at start of each cycle
             assert bits_to_int_unsigned(result.pc) == i * 4
         
         # Final PC should be at 10*4 = 40
         assert bits_to_int_unsigned(datapath.get_pc()) == 40
         
-    def test_invalid_instruction(self):
+    def test_decode_cache_reuses_decoded_instruction(self, dut):
+        """Test repeated instruction words are decoded once"""
+        mem, rf = dut.mem, dut.rf
+        datapath = Datapath(mem, rf)  # Fresh, empty decode cache
+        
+        mem.load_program(NOP_IMAGE * 3)
+        
+        results = [datapath.execute_cycle() for _ in range(3)]
+        
+        assert all(r.decoded is results[0].decoded for r in results)
+        info = datapath._decode_cached.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+        
+    def test_predecode_warms_decode_cache(self, dut):
+        """Test predecode() decodes the loaded image so fetches hit the cache"""
+        mem, rf, datapath = dut.mem, dut.rf, dut.dp
+        datapath._decode_cached.cache_clear()
+        mem.load_program(NOP_IMAGE * 2 + struct.pack('<I', 0x0000006F))
+        
+        assert datapath.predecode() == 3
+        datapath.run_cycles(3)
+        
+        info = datapath._decode_cached.cache_info()
+        assert info.misses == 2  # NOP and JAL, each decoded once
+        assert info.hits == 4    # repeated NOP in predecode + three fetches
+        
+    def test_run_cycles_stops_at_halt(self, dut):
+        """Test run_cycles() returns early after JAL x0, 0"""
+        mem, rf, datapath = dut.mem, dut.rf, dut.dp
+        mem.write_word(ADDR_0, ADDI_X1_X0_5)
+        mem.write_word(ADDR_4, JAL_X0_0)
+        
+        results = datapath.run_cycles(100)
+        
+        assert [r.decoded.op for r in results] == [Op.ADDI, Op.JAL]
+        assert rf.read_int_reg_int(1) == 5
+        assert datapath.halted
+        
+    def test_run_cycles_without_collecting(self, dut):
+        """Test run_cycles(collect=False) keeps only the final CycleResult"""
+        mem, rf, datapath = dut.mem, dut.rf, dut.dp
+        mem.load_program(NOP_IMAGE * 5)
+        
+        results = datapath.run_cycles(5, collect=False)
+        
+        assert len(results) == 1
+        assert results[0].cycle_num == 4
+        assert datapath.get_cycle_count() == 5
+        
+    def test_run_until_halt_cycle_limit(self, dut):
+        """Test run_until_halt() stops at max_cycles when no halt is reached"""
+        mem, rf, datapath = dut.mem, dut.rf, dut.dp
+        mem.load_program(NOP_IMAGE * 4)
+        
+        cycles = datapath.run_until_halt(3)
+        
+        assert cycles == 3
+        assert not datapath.halted
+        
+    def test_run_until_halt_twice(self, dut):
+        """Test halted reflects only the latest run, not an earlier halt"""
+        mem, rf, datapath = dut.mem, dut.rf, dut.dp
+        mem.write_word(ADDR_0, JAL_X0_0)
+        mem.write_word(ADDR_4, NOP)
+        mem.write_word(ADDR_8, NOP)
+        
+        assert datapath.run_until_halt(5) == 1
+        assert datapath.halted
+        
+        datapath.fetch_unit.set_pc(ADDR_4)
+        assert datapath.run_until_halt(2) == 2
+        assert not datapath.halted
+        
+    def test_reset(self, dut):
+        """Test reset() returns PC and cycle count to zero"""
+        mem, rf, datapath = dut.mem, dut.rf, dut.dp
+        
+        # Two NOPs (ADDI x0, x0, 0)
+        mem.write_word(ADDR_0, NOP)
+        mem.write_word(ADDR_4, NOP)
+        datapath.execute_cycle()
+        datapath.execute_cycle()
+        
+        datapath.reset()
+        
+        assert bits_to_int_unsigned(datapath.get_pc()) == 0
+        assert datapath.get_cycle_count() == 0
+        
+    def test_invalid_instruction(self, dut):
         """Test handling of invalid/unknown instructions"""
         # Setup
-        mem = Memory(size_bytes=131072, base_addr=0x00000000)
-        rf = RegisterFile()
-        datapath = Datapath(mem, rf)
+        mem, rf, datapath = dut.mem, dut.rf, dut.dp
         
         # Load invalid instruction (all zeros)
-        mem.write_word(int_to_bits_unsigned(0x00000000, 32), int_to_bits_unsigned(0x00000000, 32))
+        mem.write_word_int(0x00000000, 0x00000000)
         
         # Execute - should not crash
         result = datapath.execute_cycle()
@@ -711,25 +486,21 @@ class TestIntegration:
         # Verify execution completed (even if instruction is unknown)
         assert result.cycle_num == 0
         
-    def test_halt_detection(self):
+    def test_halt_detection(self, dut):
         """Test detection of halt condition (JAL x0, 0)"""
         # Setup
-        mem = Memory(size_bytes=131072, base_addr=0x00000000)
-        rf = RegisterFile()
-        datapath = Datapath(mem, rf)
+        mem, rf, datapath = dut.mem, dut.rf, dut.dp
         
         # Load JAL x0, 0 instruction (infinite loop)
         # JAL: opcode=1101111, rd=x0, imm=0
         # = 0x0000006F
-        mem.write_word(int_to_bits_unsigned(0x00000000, 32), int_to_bits_unsigned(0x0000006F, 32))
+        mem.write_word(ADDR_0, JAL_X0_0)
         
-        # Execute
-        result = datapath.execute_cycle()
+        # Execute until the halt is seen
+        cycles = datapath.run_until_halt(2)
         
-        # Verify it's a JAL to x0
-        assert result.decoded.mnemonic == 'JAL'
-        assert bits_to_int_unsigned(result.decoded.rd) == 0
-        # PC should still be at 0 (jumped to self)
+        # Halted after the single JAL; PC still at 0 (jumped to self)
+        assert datapath.halted and cycles == 1
         assert bits_to_int_unsigned(datapath.get_pc()) == 0
 
 
@@ -16,387 +16,267 @@ Test Structure:
 """
 
 import pytest
-from riscsim.cpu.decoder import InstructionDecoder, DecodedInstruction
-from riscsim.utils.bit_utils import int_to_bits_unsigned, bits_to_int_unsigned
+from riscsim.cpu.decoder import DecodedInstruction, InstrType, Op
+from riscsim.utils.bit_utils import (
+    int_to_bits_unsigned, bits_to_int_unsigned, bits_to_int_signed
+)
+
+
+# Test instructions as 32-bit encodings, expanded to MSB-first bit lists once
+ADD_X3_X1_X2 = int_to_bits_unsigned(0x002081B3, 32)     # add x3, x1, x2
+SUB_X4_X2_X1 = int_to_bits_unsigned(0x40110233, 32)     # sub x4, x2, x1
+AND_X5_X3_X4 = int_to_bits_unsigned(0x0041F2B3, 32)     # and x5, x3, x4
+OR_X6_X5_X4 = int_to_bits_unsigned(0x0042E333, 32)      # or x6, x5, x4
+XOR_X7_X6_X5 = int_to_bits_unsigned(0x005343B3, 32)     # xor x7, x6, x5
+SLL_X8_X1_X2 = int_to_bits_unsigned(0x00209433, 32)     # sll x8, x1, x2
+SRL_X9_X8_X2 = int_to_bits_unsigned(0x002454B3, 32)     # srl x9, x8, x2
+SRA_X10_X9_X1 = int_to_bits_unsigned(0x4014D533, 32)    # sra x10, x9, x1
+ADDI_X1_X0_5 = int_to_bits_unsigned(0x00500093, 32)     # addi x1, x0, 5
+ANDI_X3_X1_0XFF = int_to_bits_unsigned(0x0FF0F193, 32)  # andi x3, x1, 0xFF
+ORI_X4_X2_0X10 = int_to_bits_unsigned(0x01016213, 32)   # ori x4, x2, 0x10
+XORI_X5_X3_0XF = int_to_bits_unsigned(0x00F1C293, 32)   # xori x5, x3, 0xF
+SLLI_X6_X4_5 = int_to_bits_unsigned(0x00521313, 32)     # slli x6, x4, 5
+SRLI_X7_X5_3 = int_to_bits_unsigned(0x0032D393, 32)     # srli x7, x5, 3
+SRAI_X8_X6_4 = int_to_bits_unsigned(0x40435413, 32)     # srai x8, x6, 4
+LW_X4_0_X5 = int_to_bits_unsigned(0x0002A203, 32)       # lw x4, 0(x5)
+ADDI_X2_X0_NEG1 = int_to_bits_unsigned(0xFFF00113, 32)  # addi x2, x0, -1
+SW_X3_0_X5 = int_to_bits_unsigned(0x0032A023, 32)       # sw x3, 0(x5)
+SW_X4_8_X5 = int_to_bits_unsigned(0x0042A423, 32)       # sw x4, 8(x5)
+BEQ_X3_X4_8 = int_to_bits_unsigned(0x00418463, 32)      # beq x3, x4, 8
+BNE_X1_X2_4 = int_to_bits_unsigned(0x00209263, 32)      # bne x1, x2, 4
+LUI_X5_0X10 = int_to_bits_unsigned(0x000102B7, 32)      # lui x5, 0x10
+AUIPC_X6_0X1 = int_to_bits_unsigned(0x00001317, 32)     # auipc x6, 0x1
+JAL_X0_0 = int_to_bits_unsigned(0x0000006F, 32)         # jal x0, 0
+JALR_X1_0_X2 = int_to_bits_unsigned(0x000100E7, 32)     # jalr x1, 0(x2)
+ADDI_X1_X0_2047 = int_to_bits_unsigned(0x7FF00093, 32)  # addi x1, x0, 2047
+ADDI_X1_X0_NEG1 = int_to_bits_unsigned(0xFFF00093, 32)  # addi x1, x0, -1
+LUI_X1_0XFFFFF = int_to_bits_unsigned(0xFFFFF0B7, 32)   # lui x1, 0xFFFFF
+INVALID_OPCODE = int_to_bits_unsigned(0x00000081, 32)   # opcode 0000001 (no such format)
+BEQ_X1_X2_NEG4 = int_to_bits_unsigned(0xFE208EE3, 32)   # beq x1, x2, -4
+JAL_X1_8 = int_to_bits_unsigned(0x008000EF, 32)         # jal x1, 8
+
+
+# Whole corpus as (word, mnemonic, type, rd, rs1, rs2, signed imm); None marks
+# a field the format does not carry.
+CORPUS = (
+    (0x002081B3, 'ADD', 'R', 3, 1, 2, None),
+    (0x40110233, 'SUB', 'R', 4, 2, 1, None),
+    (0x0041F2B3, 'AND', 'R', 5, 3, 4, None),
+    (0x0042E333, 'OR', 'R', 6, 5, 4, None),
+    (0x005343B3, 'XOR', 'R', 7, 6, 5, None),
+    (0x00209433, 'SLL', 'R', 8, 1, 2, None),
+    (0x002454B3, 'SRL', 'R', 9, 8, 2, None),
+    (0x4014D533, 'SRA', 'R', 10, 9, 1, None),
+    (0x00500093, 'ADDI', 'I', 1, 0, None, 5),
+    (0x0FF0F193, 'ANDI', 'I', 3, 1, None, 0xFF),
+    (0x01016213, 'ORI', 'I', 4, 2, None, 0x10),
+    (0x00F1C293, 'XORI', 'I', 5, 3, None, 0xF),
+    (0x00521313, 'SLLI', 'I', 6, 4, None, 5),
+    (0x0032D393, 'SRLI', 'I', 7, 5, None, 3),
+    (0x40435413, 'SRAI', 'I', 8, 6, None, 0x404),
+    (0x0002A203, 'LW', 'I', 4, 5, None, 0),
+    (0xFFF00113, 'ADDI', 'I', 2, 0, None, -1),
+    (0x000100E7, 'JALR', 'I', 1, 2, None, 0),
+    (0x0032A023, 'SW', 'S', None, 5, 3, 0),
+    (0x0042A423, 'SW', 'S', None, 5, 4, 8),
+    (0x00418463, 'BEQ', 'B', None, 3, 4, 8),
+    (0x00209263, 'BNE', 'B', None, 1, 2, 4),
+    (0xFE208EE3, 'BEQ', 'B', None, 1, 2, -4),
+    (0x000102B7, 'LUI', 'U', 5, None, None, 0x10000),
+    (0x00001317, 'AUIPC', 'U', 6, None, None, 0x1000),
+    (0xFFFFF0B7, 'LUI', 'U', 1, None, None, -0x1000),
+    (0x0000006F, 'JAL', 'J', 0, None, None, 0),
+    (0x008000EF, 'JAL', 'J', 1, None, None, 8),
+)
+
+
+def _corpus_fields(decoded):
+    """Project a decoded instruction onto a CORPUS entry's field layout."""
+    instr_type = decoded.instr_type
+    return (
+        decoded.mnemonic,
+        instr_type,
+        bits_to_int_unsigned(decoded.rd) if instr_type in 'RIUJ' else None,
+        bits_to_int_unsigned(decoded.rs1) if instr_type in 'RISB' else None,
+        bits_to_int_unsigned(decoded.rs2) if instr_type in 'RSB' else None,
+        bits_to_int_signed(decoded.immediate) if instr_type != 'R' else None,
+    )
 
 
 class TestRTypeInstructions:
     """Test R-type instruction decoding."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.decoder = InstructionDecoder()
-    
-    def test_decode_add(self):
-        """Test ADD instruction: add x3, x1, x2 (x3 = x1 + x2)."""
-        # ADD: 0000000 00010 00001 000 00011 0110011
-        #      funct7  rs2   rs1  f3  rd    opcode
-        # Binary: 0000000_00010_00001_000_00011_0110011
-        instruction = [0,0,0,0,0,0,0,  0,0,0,1,0,  0,0,0,0,1,  0,0,0,  0,0,0,1,1,  0,1,1,0,0,1,1]
-        
-        decoded = self.decoder.decode(instruction)
-        
-        assert decoded.instr_type == 'R'
-        assert decoded.mnemonic == 'ADD'
-        assert decoded.rd == [0,0,0,1,1]  # x3
-        assert decoded.rs1 == [0,0,0,0,1]  # x1
-        assert decoded.rs2 == [0,0,0,1,0]  # x2
-        assert decoded.funct3 == [0,0,0]
-        assert decoded.funct7 == [0,0,0,0,0,0,0]
-    
-    def test_decode_sub(self):
-        """Test SUB instruction: sub x4, x2, x1 (x4 = x2 - x1)."""
-        # SUB: 0100000 00001 00010 000 00100 0110011
-        instruction = [0,1,0,0,0,0,0,  0,0,0,0,1,  0,0,0,1,0,  0,0,0,  0,0,1,0,0,  0,1,1,0,0,1,1]
-        
-        decoded = self.decoder.decode(instruction)
-        
-        assert decoded.instr_type == 'R'
-        assert decoded.mnemonic == 'SUB'
-        assert decoded.rd == [0,0,1,0,0]  # x4
-        assert decoded.rs1 == [0,0,0,1,0]  # x2
-        assert decoded.rs2 == [0,0,0,0,1]  # x1
-        assert decoded.funct3 == [0,0,0]
-        assert decoded.funct7 == [0,1,0,0,0,0,0]
-    
-    def test_decode_and(self):
-        """Test AND instruction: and x5, x3, x4."""
-        # AND: 0000000 00100 00011 111 00101 0110011
-        instruction = [0,0,0,0,0,0,0,  0,0,1,0,0,  0,0,0,1,1,  1,1,1,  0,0,1,0,1,  0,1,1,0,0,1,1]
-        
-        decoded = self.decoder.decode(instruction)
-        
-        assert decoded.instr_type == 'R'
-        assert decoded.mnemonic == 'AND'
-        assert decoded.rd == [0,0,1,0,1]  # x5
-        assert decoded.rs1 == [0,0,0,1,1]  # x3
-        assert decoded.rs2 == [0,0,1,0,0]  # x4
-        assert decoded.funct3 == [1,1,1]
-    
-    def test_decode_or(self):
-        """Test OR instruction: or x6, x5, x4."""
-        # OR: 0000000 00100 00101 110 00110 0110011
-        instruction = [0,0,0,0,0,0,0,  0,0,1,0,0,  0,0,1,0,1,  1,1,0,  0,0,1,1,0,  0,1,1,0,0,1,1]
-        
-        decoded = self.decoder.decode(instruction)
-        
-        assert decoded.instr_type == 'R'
-        assert decoded.mnemonic == 'OR'
-        assert decoded.rd == [0,0,1,1,0]  # x6
-        assert decoded.rs1 == [0,0,1,0,1]  # x5
-        assert decoded.rs2 == [0,0,1,0,0]  # x4
-        assert decoded.funct3 == [1,1,0]
-    
-    def test_decode_xor(self):
-        """Test XOR instruction: xor x7, x6, x5."""
-        # XOR: 0000000 00101 00110 100 00111 0110011
-        instruction = [0,0,0,0,0,0,0,  0,0,1,0,1,  0,0,1,1,0,  1,0,0,  0,0,1,1,1,  0,1,1,0,0,1,1]
-        
-        decoded = self.decoder.decode(instruction)
+    # Fields: funct7 | rs2 | rs1 | funct3 | rd | opcode (0110011)
+    @pytest.mark.parametrize("instruction, mnemonic, rd, rs1, rs2, funct3, funct7", [
+        # add x3, x1, x2: 0000000 00010 00001 000 00011 0110011
+        (ADD_X3_X1_X2, 'ADD', 3, 1, 2, [0,0,0], [0,0,0,0,0,0,0]),
+        # sub x4, x2, x1: 0100000 00001 00010 000 00100 0110011
+        (SUB_X4_X2_X1, 'SUB', 4, 2, 1, [0,0,0], [0,1,0,0,0,0,0]),
+        # and x5, x3, x4: 0000000 00100 00011 111 00101 0110011
+        (AND_X5_X3_X4, 'AND', 5, 3, 4, [1,1,1], [0,0,0,0,0,0,0]),
+        # or x6, x5, x4: 0000000 00100 00101 110 00110 0110011
+        (OR_X6_X5_X4, 'OR', 6, 5, 4, [1,1,0], [0,0,0,0,0,0,0]),
+        # xor x7, x6, x5: 0000000 00101 00110 100 00111 0110011
+        (XOR_X7_X6_X5, 'XOR', 7, 6, 5, [1,0,0], [0,0,0,0,0,0,0]),
+        # sll x8, x1, x2: 0000000 00010 00001 001 01000 0110011
+        (SLL_X8_X1_X2, 'SLL', 8, 1, 2, [0,0,1], [0,0,0,0,0,0,0]),
+        # srl x9, x8, x2: 0000000 00010 01000 101 01001 0110011
+        (SRL_X9_X8_X2, 'SRL', 9, 8, 2, [1,0,1], [0,0,0,0,0,0,0]),
+        # sra x10, x9, x1: 0100000 00001 01001 101 01010 0110011
+        (SRA_X10_X9_X1, 'SRA', 10, 9, 1, [1,0,1], [0,1,0,0,0,0,0]),
+    ], ids=['add', 'sub', 'and', 'or', 'xor', 'sll', 'srl', 'sra'])
+    def test_decode_rtype(self, decoder, instruction, mnemonic, rd, rs1, rs2,
+                          funct3, funct7):
+        """Test R-type decoding of mnemonic, registers and function fields."""
+        decoded = decoder.decode(instruction)
         
         assert decoded.instr_type == 'R'
-        assert decoded.mnemonic == 'XOR'
-        assert decoded.rd == [0,0,1,1,1]  # x7
-        assert decoded.funct3 == [1,0,0]
-    
-    def test_decode_sll(self):
-        """Test SLL instruction: sll x8, x1, x2."""
-        # SLL: 0000000 00010 00001 001 01000 0110011
-        instruction = [0,0,0,0,0,0,0,  0,0,0,1,0,  0,0,0,0,1,  0,0,1,  0,1,0,0,0,  0,1,1,0,0,1,1]
-        
-        decoded = self.decoder.decode(instruction)
-        
-        assert decoded.instr_type == 'R'
-        assert decoded.mnemonic == 'SLL'
-        assert decoded.rd == [0,1,0,0,0]  # x8
-        assert decoded.funct3 == [0,0,1]
-    
-    def test_decode_srl(self):
-        """Test SRL instruction: srl x9, x8, x2."""
-        # SRL: 0000000 00010 01000 101 01001 0110011
-        instruction = [0,0,0,0,0,0,0,  0,0,0,1,0,  0,1,0,0,0,  1,0,1,  0,1,0,0,1,  0,1,1,0,0,1,1]
-        
-        decoded = self.decoder.decode(instruction)
-        
-        assert decoded.instr_type == 'R'
-        assert decoded.mnemonic == 'SRL'
-        assert decoded.rd == [0,1,0,0,1]  # x9
-        assert decoded.funct3 == [1,0,1]
-        assert decoded.funct7 == [0,0,0,0,0,0,0]
-    
-    def test_decode_sra(self):
-        """Test SRA instruction: sra x10, x9, x1."""
-        # SRA: 0100000 00001 01001 101 01010 0110011
-        instruction = [0,1,0,0,0,0,0,  0,0,0,0,1,  0,1,0,0,1,  1,0,1,  0,1,0,1,0,  0,1,1,0,0,1,1]
-        
-        decoded = self.decoder.decode(instruction)
-        
-        assert decoded.instr_type == 'R'
-        assert decoded.mnemonic == 'SRA'
-        assert decoded.rd == [0,1,0,1,0]  # x10
-        assert decoded.funct3 == [1,0,1]
-        assert decoded.funct7 == [0,1,0,0,0,0,0]
+        assert decoded.mnemonic == mnemonic
+        assert decoded.rd == int_to_bits_unsigned(rd, 5)
+        assert decoded.rs1 == int_to_bits_unsigned(rs1, 5)
+        assert decoded.rs2 == int_to_bits_unsigned(rs2, 5)
+        assert decoded.funct3 == funct3
+        assert decoded.funct7 == funct7
+        assert decoded.is_alt is (funct7[1] == 1)
 
 
 class TestITypeInstructions:
     """Test I-type instruction decoding."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.decoder = InstructionDecoder()
-    
-    def test_decode_addi(self):
-        """Test ADDI instruction: addi x1, x0, 5."""
-        # ADDI: 000000000101 00000 000 00001 0010011
-        #       imm[11:0]   rs1  f3  rd    opcode
-        instruction = [0,0,0,0,0,0,0,0,0,1,0,1,  0,0,0,0,0,  0,0,0,  0,0,0,0,1,  0,0,1,0,0,1,1]
-        
-        decoded = self.decoder.decode(instruction)
+    # Fields: imm[11:0] | rs1 | funct3 | rd | opcode (0010011 ALU, 0000011 load)
+    @pytest.mark.parametrize("instruction, mnemonic, rd, rs1, funct3, immediate", [
+        # addi x1, x0, 5: 000000000101 00000 000 00001 0010011
+        (ADDI_X1_X0_5, 'ADDI', 1, 0, [0,0,0], 5),
+        # andi x3, x1, 0xFF: 000011111111 00001 111 00011 0010011
+        (ANDI_X3_X1_0XFF, 'ANDI', 3, 1, [1,1,1], 0xFF),
+        # ori x4, x2, 0x10: 000000010000 00010 110 00100 0010011
+        (ORI_X4_X2_0X10, 'ORI', 4, 2, [1,1,0], 0x10),
+        # xori x5, x3, 0xF: 000000001111 00011 100 00101 0010011
+        (XORI_X5_X3_0XF, 'XORI', 5, 3, [1,0,0], 0xF),
+        # slli x6, x4, 5: 0000000 00101 00100 001 00110 0010011 (shamt in imm[4:0])
+        (SLLI_X6_X4_5, 'SLLI', 6, 4, [0,0,1], 5),
+        # srli x7, x5, 3: 0000000 00011 00101 101 00111 0010011
+        (SRLI_X7_X5_3, 'SRLI', 7, 5, [1,0,1], 3),
+        # srai x8, x6, 4: 0100000 00100 00110 101 01000 0010011 (imm[10] marks SRAI)
+        (SRAI_X8_X6_4, 'SRAI', 8, 6, [1,0,1], 0x404),
+        # lw x4, 0(x5): 000000000000 00101 010 00100 0000011
+        (LW_X4_0_X5, 'LW', 4, 5, [0,1,0], 0),
+    ], ids=['addi', 'andi', 'ori', 'xori', 'slli', 'srli', 'srai', 'lw'])
+    def test_decode_itype(self, decoder, instruction, mnemonic, rd, rs1, funct3,
+                          immediate):
+        """Test I-type decoding of mnemonic, registers, funct3 and immediate."""
+        decoded = decoder.decode(instruction)
         
         assert decoded.instr_type == 'I'
-        assert decoded.mnemonic == 'ADDI'
-        assert decoded.rd == [0,0,0,0,1]  # x1
-        assert decoded.rs1 == [0,0,0,0,0]  # x0
-        assert decoded.funct3 == [0,0,0]
-        # Immediate should be sign-extended 5
-        assert bits_to_int_unsigned(decoded.immediate) == 5
-    
-    def test_decode_addi_negative(self):
+        assert decoded.mnemonic == mnemonic
+        assert decoded.rd == int_to_bits_unsigned(rd, 5)
+        assert decoded.rs1 == int_to_bits_unsigned(rs1, 5)
+        assert decoded.funct3 == funct3
+        assert bits_to_int_unsigned(decoded.immediate) == immediate
+        assert decoded.is_alt is (mnemonic == 'SRAI')
+    
+    def test_decode_addi_negative(self, decoder):
         """Test ADDI with negative immediate: addi x2, x0, -1."""
         # ADDI: 111111111111 00000 000 00010 0010011
         #       imm=-1      rs1  f3  rd    opcode
-        instruction = [1,1,1,1,1,1,1,1,1,1,1,1,  0,0,0,0,0,  0,0,0,  0,0,0,1,0,  0,0,1,0,0,1,1]
+        instruction = ADDI_X2_X0_NEG1
         
-        decoded = self.decoder.decode(instruction)
+        decoded = decoder.decode(instruction)
         
         assert decoded.instr_type == 'I'
         assert decoded.mnemonic == 'ADDI'
         # Check sign extension: -1 should extend to all 1s
-        assert decoded.immediate == [1] * 32
-    
-    def test_decode_andi(self):
-        """Test ANDI instruction: andi x3, x1, 0xFF."""
-        # ANDI: 000011111111 00001 111 00011 0010011
-        instruction = [0,0,0,0,1,1,1,1,1,1,1,1,  0,0,0,0,1,  1,1,1,  0,0,0,1,1,  0,0,1,0,0,1,1]
-        
-        decoded = self.decoder.decode(instruction)
-        
-        assert decoded.instr_type == 'I'
-        assert decoded.mnemonic == 'ANDI'
-        assert decoded.rd == [0,0,0,1,1]  # x3
-        assert decoded.rs1 == [0,0,0,0,1]  # x1
-        assert decoded.funct3 == [1,1,1]
-    
-    def test_decode_ori(self):
-        """Test ORI instruction: ori x4, x2, 0x10."""
-        # ORI: 000000010000 00010 110 00100 0010011
-        instruction = [0,0,0,0,0,0,0,1,0,0,0,0,  0,0,0,1,0,  1,1,0,  0,0,1,0,0,  0,0,1,0,0,1,1]
-        
-        decoded = self.decoder.decode(instruction)
-        
-        assert decoded.instr_type == 'I'
-        assert decoded.mnemonic == 'ORI'
-        assert decoded.funct3 == [1,1,0]
-    
-    def test_decode_xori(self):
-        """Test XORI instruction: xori x5, x3, 0xF."""
-        # XORI: 000000001111 00011 100 00101 0010011
-        instruction = [0,0,0,0,0,0,0,0,1,1,1,1,  0,0,0,1,1,  1,0,0,  0,0,1,0,1,  0,0,1,0,0,1,1]
-        
-        decoded = self.decoder.decode(instruction)
-        
-        assert decoded.instr_type == 'I'
-        assert decoded.mnemonic == 'XORI'
-        assert decoded.funct3 == [1,0,0]
-    
-    def test_decode_slli(self):
-        """Test SLLI instruction: slli x6, x4, 5."""
-        # SLLI: 0000000 00101 00100 001 00110 0010011
-        instruction = [0,0,0,0,0,0,0,0,0,1,0,1,  0,0,1,0,0,  0,0,1,  0,0,1,1,0,  0,0,1,0,0,1,1]
-        
-        decoded = self.decoder.decode(instruction)
-        
-        assert decoded.instr_type == 'I'
-        assert decoded.mnemonic == 'SLLI'
-        assert decoded.funct3 == [0,0,1]
-        # Immediate lower 5 bits are shift amount
-        imm_val = bits_to_int_unsigned(decoded.immediate[-5:])
-        assert imm_val == 5
-    
-    def test_decode_srli(self):
-        """Test SRLI instruction: srli x7, x5, 3."""
-        # SRLI: 0000000 00011 00101 101 00111 0010011
-        instruction = [0,0,0,0,0,0,0,0,0,0,1,1,  0,0,1,0,1,  1,0,1,  0,0,1,1,1,  0,0,1,0,0,1,1]
-        
-        decoded = self.decoder.decode(instruction)
-        
-        assert decoded.instr_type == 'I'
-        assert decoded.mnemonic == 'SRLI'
-        assert decoded.funct3 == [1,0,1]
-    
-    def test_decode_srai(self):
-        """Test SRAI instruction: srai x8, x6, 4."""
-        # SRAI: 0100000 00100 00110 101 01000 0010011
-        instruction = [0,1,0,0,0,0,0,0,0,1,0,0,  0,0,1,1,0,  1,0,1,  0,1,0,0,0,  0,0,1,0,0,1,1]
-        
-        decoded = self.decoder.decode(instruction)
-        
-        assert decoded.instr_type == 'I'
-        assert decoded.mnemonic == 'SRAI'
-        assert decoded.funct3 == [1,0,1]
-    
-    def test_decode_lw(self):
-        """Test LW instruction: lw x4, 0(x5)."""
-        # LW: 000000000000 00101 010 00100 0000011
-        instruction = [0,0,0,0,0,0,0,0,0,0,0,0,  0,0,1,0,1,  0,1,0,  0,0,1,0,0,  0,0,0,0,0,1,1]
-        
-        decoded = self.decoder.decode(instruction)
-        
-        assert decoded.instr_type == 'I'
-        assert decoded.mnemonic == 'LW'
-        assert decoded.rd == [0,0,1,0,0]  # x4
-        assert decoded.rs1 == [0,0,1,0,1]  # x5
-        assert decoded.funct3 == [0,1,0]
-        assert bits_to_int_unsigned(decoded.immediate) == 0
+        assert bits_to_int_signed(decoded.immediate) == -1
 
 
 class TestSTypeInstructions:
     """Test S-type instruction decoding."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.decoder = InstructionDecoder()
-    
-    def test_decode_sw(self):
-        """Test SW instruction: sw x3, 0(x5)."""
-        # SW: 0000000 00011 00101 010 00000 0100011
-        #     imm[11:5] rs2  rs1  f3 imm[4:0] opcode
-        instruction = [0,0,0,0,0,0,0,  0,0,0,1,1,  0,0,1,0,1,  0,1,0,  0,0,0,0,0,  0,1,0,0,0,1,1]
-        
-        decoded = self.decoder.decode(instruction)
+    # Fields: imm[11:5] | rs2 | rs1 | funct3 | imm[4:0] | opcode (0100011)
+    @pytest.mark.parametrize("instruction, rs1, rs2, immediate", [
+        # sw x3, 0(x5): 0000000 00011 00101 010 00000 0100011
+        (SW_X3_0_X5, 5, 3, 0),
+        # sw x4, 8(x5): 0000000 00100 00101 010 01000 0100011
+        (SW_X4_8_X5, 5, 4, 8),
+    ], ids=['sw', 'sw_offset'])
+    def test_decode_sw(self, decoder, instruction, rs1, rs2, immediate):
+        """Test SW decoding of base (rs1), data (rs2) and split offset."""
+        decoded = decoder.decode(instruction)
         
         assert decoded.instr_type == 'S'
         assert decoded.mnemonic == 'SW'
-        assert decoded.rs1 == [0,0,1,0,1]  # x5 (base address)
-        assert decoded.rs2 == [0,0,0,1,1]  # x3 (data to store)
+        assert decoded.rs1 == int_to_bits_unsigned(rs1, 5)
+        assert decoded.rs2 == int_to_bits_unsigned(rs2, 5)
         assert decoded.funct3 == [0,1,0]
-        assert bits_to_int_unsigned(decoded.immediate) == 0
-    
-    def test_decode_sw_with_offset(self):
-        """Test SW instruction with offset: sw x4, 8(x5)."""
-        # SW: 0000000 00100 00101 010 01000 0100011
-        #     offset=8: upper 7 bits = 0000000, lower 5 bits = 01000
-        instruction = [0,0,0,0,0,0,0,  0,0,1,0,0,  0,0,1,0,1,  0,1,0,  0,1,0,0,0,  0,1,0,0,0,1,1]
-        
-        decoded = self.decoder.decode(instruction)
-        
-        assert decoded.instr_type == 'S'
-        assert decoded.mnemonic == 'SW'
-        assert bits_to_int_unsigned(decoded.immediate) == 8
+        assert bits_to_int_unsigned(decoded.immediate) == immediate
 
 
 class TestBTypeInstructions:
     """Test B-type instruction decoding."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.decoder = InstructionDecoder()
-    
-    def test_decode_beq(self):
-        """Test BEQ instruction: beq x3, x4, 8."""
-        # BEQ: offset=8 (01000 in binary)
-        # B-type encoding: imm[12|10:5] rs2 rs1 000 imm[4:1|11] 1100011
-        # offset=8: imm = 00000001000 -> [12]=0, [11]=0, [10:5]=000000, [4:1]=0100
-        instruction = [0,0,0,0,0,0,0,  0,0,1,0,0,  0,0,0,1,1,  0,0,0,  0,1,0,0,0,  1,1,0,0,0,1,1]
-        
-        decoded = self.decoder.decode(instruction)
-        
-        assert decoded.instr_type == 'B'
-        assert decoded.mnemonic == 'BEQ'
-        assert decoded.rs1 == [0,0,0,1,1]  # x3
-        assert decoded.rs2 == [0,0,1,0,0]  # x4
-        assert decoded.funct3 == [0,0,0]
-        assert bits_to_int_unsigned(decoded.immediate) == 8
-    
-    def test_decode_bne(self):
-        """Test BNE instruction: bne x1, x2, 4."""
-        # BNE: offset=4
-        # B-type: imm[12|10:5] rs2 rs1 001 imm[4:1|11] 1100011
-        # offset=4: imm = 00000000100 -> [12]=0, [11]=0, [10:5]=000000, [4:1]=0010
-        instruction = [0,0,0,0,0,0,0,  0,0,0,1,0,  0,0,0,0,1,  0,0,1,  0,0,1,0,0,  1,1,0,0,0,1,1]
-        
-        decoded = self.decoder.decode(instruction)
+    # Fields: imm[12|10:5] | rs2 | rs1 | funct3 | imm[4:1|11] | opcode (1100011)
+    @pytest.mark.parametrize("instruction, mnemonic, rs1, rs2, funct3, immediate", [
+        # beq x3, x4, 8: [12]=0, [11]=0, [10:5]=000000, [4:1]=0100
+        (BEQ_X3_X4_8, 'BEQ', 3, 4, [0,0,0], 8),
+        # bne x1, x2, 4: [12]=0, [11]=0, [10:5]=000000, [4:1]=0010
+        (BNE_X1_X2_4, 'BNE', 1, 2, [0,0,1], 4),
+    ], ids=['beq', 'bne'])
+    def test_decode_btype(self, decoder, instruction, mnemonic, rs1, rs2, funct3,
+                          immediate):
+        """Test B-type decoding of mnemonic, compared registers and offset."""
+        decoded = decoder.decode(instruction)
         
         assert decoded.instr_type == 'B'
-        assert decoded.mnemonic == 'BNE'
-        assert decoded.rs1 == [0,0,0,0,1]  # x1
-        assert decoded.rs2 == [0,0,0,1,0]  # x2
-        assert decoded.funct3 == [0,0,1]
-        assert bits_to_int_unsigned(decoded.immediate) == 4
+        assert decoded.mnemonic == mnemonic
+        assert decoded.rs1 == int_to_bits_unsigned(rs1, 5)
+        assert decoded.rs2 == int_to_bits_unsigned(rs2, 5)
+        assert decoded.funct3 == funct3
+        assert bits_to_int_unsigned(decoded.immediate) == immediate
 
 
 class TestUTypeInstructions:
     """Test U-type instruction decoding."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.decoder = InstructionDecoder()
-    
-    def test_decode_lui(self):
-        """Test LUI instruction: lui x5, 0x10."""
-        # LUI: 00000000000000010000 00101 0110111
-        #      imm[31:12]          rd    opcode
-        # 0x10 << 12 = 0x10000
-        instruction = [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,  0,0,1,0,1,  0,1,1,0,1,1,1]
-        
-        decoded = self.decoder.decode(instruction)
-        
-        assert decoded.instr_type == 'U'
-        assert decoded.mnemonic == 'LUI'
-        assert decoded.rd == [0,0,1,0,1]  # x5
-        # Upper 20 bits set to 0x10, lower 12 bits zero
-        assert bits_to_int_unsigned(decoded.immediate) == 0x10000
-    
-    def test_decode_auipc(self):
-        """Test AUIPC instruction: auipc x6, 0x1."""
-        # AUIPC: 00000000000000000001 00110 0010111
-        instruction = [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,  0,0,1,1,0,  0,0,1,0,1,1,1]
-        
-        decoded = self.decoder.decode(instruction)
+    # Fields: imm[31:12] | rd | opcode (0110111 LUI, 0010111 AUIPC)
+    @pytest.mark.parametrize("instruction, mnemonic, rd, immediate", [
+        # lui x5, 0x10: upper 20 bits 0x10, lower 12 bits zero
+        (LUI_X5_0X10, 'LUI', 5, 0x10000),
+        # auipc x6, 0x1
+        (AUIPC_X6_0X1, 'AUIPC', 6, 0x1000),
+    ], ids=['lui', 'auipc'])
+    def test_decode_utype(self, decoder, instruction, mnemonic, rd, immediate):
+        """Test U-type decoding of mnemonic, rd and shifted immediate."""
+        decoded = decoder.decode(instruction)
         
         assert decoded.instr_type == 'U'
-        assert decoded.mnemonic == 'AUIPC'
-        assert decoded.rd == [0,0,1,1,0]  # x6
-        assert bits_to_int_unsigned(decoded.immediate) == 0x1000
+        assert decoded.mnemonic == mnemonic
+        assert decoded.rd == int_to_bits_unsigned(rd, 5)
+        assert bits_to_int_unsigned(decoded.immediate) == immediate
 
 
 class TestJTypeInstructions:
     """Test J-type instruction decoding."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.decoder = InstructionDecoder()
-    
-    def test_decode_jal(self):
+    def test_decode_jal(self, decoder):
         """Test JAL instruction: jal x0, 0 (infinite loop)."""
         # JAL: offset=0
         # J-type: imm[20|10:1|11|19:12] rd 1101111
         # offset=0: all immediate bits are 0
-        instruction = [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,  0,0,0,0,0,  1,1,0,1,1,1,1]
+        instruction = JAL_X0_0
         
-        decoded = self.decoder.decode(instruction)
+        decoded = decoder.decode(instruction)
         
         assert decoded.instr_type == 'J'
         assert decoded.mnemonic == 'JAL'
         assert decoded.rd == [0,0,0,0,0]  # x0
         assert bits_to_int_unsigned(decoded.immediate) == 0
     
-    def test_decode_jalr(self):
+    def test_decode_jalr(self, decoder):
         """Test JALR instruction: jalr x1, 0(x2)."""
         # JALR: 000000000000 00010 000 00001 1100111
-        instruction = [0,0,0,0,0,0,0,0,0,0,0,0,  0,0,0,1,0,  0,0,0,  0,0,0,0,1,  1,1,0,0,1,1,1]
+        instruction = JALR_X1_0_X2
         
-        decoded = self.decoder.decode(instruction)
+        decoded = decoder.decode(instruction)
         
         assert decoded.instr_type == 'I'  # JALR is I-type
         assert decoded.mnemonic == 'JALR'
@@ -407,98 +287,136 @@ class TestJTypeInstructions:
 class TestEdgeCases:
     """Test edge cases and special scenarios."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.decoder = InstructionDecoder()
+    def test_op_matches_mnemonic(self, decoder):
+        """Test decoded.op is the Op member named by the mnemonic."""
+        add = decoder.decode(ADD_X3_X1_X2)
+        assert add.op is Op.ADD
+        assert add.op.name == add.mnemonic
+        
+        unknown = decoder.decode([0] * 32)
+        assert unknown.op is Op.UNKNOWN
     
-    def test_immediate_sign_extension_positive(self):
+    def test_instr_type_enum(self, decoder):
+        """Test instr_type is an InstrType member that still equals its letter."""
+        decoded = decoder.decode(BEQ_X3_X4_8)
+        assert decoded.instr_type is InstrType.B
+        assert decoded.instr_type == 'B'
+        assert f"{decoded.instr_type}" == 'B'
+        
+        assert decoder.decode(INVALID_OPCODE).instr_type is InstrType.UNKNOWN
+    
+    def test_immediate_sign_extension_positive(self, decoder):
         """Test that positive immediates are correctly sign-extended."""
         # ADDI x1, x0, 127 (max positive 12-bit)
         # imm = 011111111111 (0x7FF)
-        instruction = [0,1,1,1,1,1,1,1,1,1,1,1,  0,0,0,0,0,  0,0,0,  0,0,0,0,1,  0,0,1,0,0,1,1]
+        instruction = ADDI_X1_X0_2047
         
-        decoded = self.decoder.decode(instruction)
+        decoded = decoder.decode(instruction)
         
         # Should sign-extend to 32 bits with leading zeros
         assert decoded.immediate[0] == 0  # MSB should be 0
         assert bits_to_int_unsigned(decoded.immediate) == 2047  # 0x7FF
     
-    def test_immediate_sign_extension_negative(self):
+    def test_immediate_sign_extension_negative(self, decoder):
         """Test that negative immediates are correctly sign-extended."""
         # ADDI x1, x0, -1
         # imm = 111111111111
-        instruction = [1,1,1,1,1,1,1,1,1,1,1,1,  0,0,0,0,0,  0,0,0,  0,0,0,0,1,  0,0,1,0,0,1,1]
+        instruction = ADDI_X1_X0_NEG1
         
-        decoded = self.decoder.decode(instruction)
+        decoded = decoder.decode(instruction)
         
         # Should sign-extend to all 1s
-        assert decoded.immediate == [1] * 32
+        assert bits_to_int_signed(decoded.immediate) == -1
     
-    def test_immediate_zero_extension_u_type(self):
+    def test_immediate_zero_extension_u_type(self, decoder):
         """Test that U-type immediate is zero-extended (lower 12 bits)."""
         # LUI x1, 0xFFFFF (max 20-bit value)
-        instruction = [1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,  0,0,0,0,1,  0,1,1,0,1,1,1]
+        instruction = LUI_X1_0XFFFFF
         
-        decoded = self.decoder.decode(instruction)
+        decoded = decoder.decode(instruction)
         
         # Upper 20 bits set, lower 12 bits zero
-        assert decoded.immediate[:20] == [1] * 20
-        assert decoded.immediate[20:] == [0] * 12
+        immediate = bits_to_int_unsigned(decoded.immediate)
+        assert immediate >> 12 == 0xFFFFF
+        assert immediate & 0xFFF == 0
     
-    def test_all_zero_instruction(self):
+    def test_all_zero_instruction(self, decoder):
         """Test decoding of all-zero instruction."""
         instruction = [0] * 32
         
         # This should decode as an invalid instruction
         # Opcode 0000000 doesn't match any valid type initially
-        decoded = self.decoder.decode(instruction)
+        decoded = decoder.decode(instruction)
         
         # Should still extract fields without crashing
         assert len(decoded.opcode) == 7
     
-    def test_all_one_instruction(self):
+    def test_all_one_instruction(self, decoder):
         """Test decoding of all-one instruction."""
         instruction = [1] * 32
         
-        decoded = self.decoder.decode(instruction)
+        decoded = decoder.decode(instruction)
         
         # Should extract fields without crashing
         assert len(decoded.opcode) == 7
     
-    def test_invalid_opcode(self):
+    def test_invalid_opcode(self, decoder):
         """Test handling of invalid opcode."""
         # Use an opcode that doesn't correspond to any instruction type
         # Opcode: 0000001 (invalid)
-        instruction = [0,0,0,0,0,0,0,0,0,0,0,0,  0,0,0,0,0,  0,0,0,  0,0,0,0,1,  0,0,0,0,0,0,1]
+        instruction = INVALID_OPCODE
         
-        decoded = self.decoder.decode(instruction)
+        decoded = decoder.decode(instruction)
         
         # Should return UNKNOWN type
         assert decoded.instr_type == 'UNKNOWN'
     
-    def test_branch_immediate_encoding(self):
+    @pytest.mark.parametrize("word", [
+        0x002081B3,
+        (0x002081B3).to_bytes(4, 'little'),
+        bytearray((0x002081B3).to_bytes(4, 'little')),
+        memoryview((0x002081B3).to_bytes(4, 'little')),
+    ], ids=['int', 'bytes', 'bytearray', 'memoryview'])
+    def test_decode_raw_word(self, decoder, word):
+        """Test raw uint32 / little-endian byte words decode like bit arrays."""
+        decoded = decoder.decode(word)
+        expected = decoder.decode(ADD_X3_X1_X2)
+        
+        assert decoded.mnemonic == 'ADD'
+        assert (decoded.rd, decoded.rs1, decoded.rs2) == \
+            (expected.rd, expected.rs1, expected.rs2)
+    
+    @pytest.mark.parametrize("word", [-1, 1 << 32, b'\x33\x81\x20'],
+                             ids=['negative', 'too_wide', 'short_bytes'])
+    def test_decode_raw_word_invalid(self, decoder, word):
+        """Test raw words outside 32 bits are rejected."""
+        with pytest.raises(ValueError):
+            decoder.decode(word)
+    
+    def test_branch_immediate_encoding(self, decoder):
         """Test B-type immediate with complex bit reordering."""
         # BEQ with offset = -4 (backward branch)
         # offset=-4: binary 11111111111111111111111111111100 (two's complement)
         # B-type encoding: imm[12]=1, imm[10:5]=111111, imm[4:1]=1110, imm[11]=1
         # Instruction: 1 111111 00010 00001 000 1110 1 1100011
-        instruction = [1,1,1,1,1,1,1,  0,0,0,1,0,  0,0,0,0,1,  0,0,0,  1,1,1,0,1,  1,1,0,0,0,1,1]
+        instruction = BEQ_X1_X2_NEG4
         
-        decoded = self.decoder.decode(instruction)
+        decoded = decoder.decode(instruction)
         
         assert decoded.instr_type == 'B'
         # Should be negative (sign-extended with leading 1s)
         assert decoded.immediate[0] == 1
+        assert bits_to_int_signed(decoded.immediate) == -4
     
-    def test_jump_immediate_encoding(self):
+    def test_jump_immediate_encoding(self, decoder):
         """Test J-type immediate with complex bit reordering."""
         # JAL with offset = 8
         # J-type encoding: imm[20|10:1|11|19:12]
         # offset=8: binary 00000000000000001000
         # Reordered: imm[20]=0, imm[19:12]=00000000, imm[11]=0, imm[10:1]=0000000100
-        instruction = [0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,  0,0,0,0,1,  1,1,0,1,1,1,1]
+        instruction = JAL_X1_8
         
-        decoded = self.decoder.decode(instruction)
+        decoded = decoder.decode(instruction)
         
         assert decoded.instr_type == 'J'
         assert decoded.mnemonic == 'JAL'
@@ -508,38 +426,45 @@ class TestEdgeCases:
 class TestInstructionSetCoverage:
     """Test coverage of minimum viable instruction set."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.decoder = InstructionDecoder()
-    
-    def test_minimum_viable_arithmetic(self):
+    def test_minimum_viable_arithmetic(self, decoder):
         """Verify all arithmetic instructions decode correctly."""
         # ADD, SUB, ADDI should all decode
         instructions = {
-            'ADD': [0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,1,0,0,0,0,0,0,1,1,0,1,1,0,0,1,1],
-            'SUB': [0,1,0,0,0,0,0,0,0,0,0,1,0,0,0,1,0,0,0,0,0,0,1,0,0,0,1,1,0,0,1,1],
-            'ADDI': [0,0,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,1,0,0,1,1],
+            'ADD': ADD_X3_X1_X2,
+            'SUB': SUB_X4_X2_X1,
+            'ADDI': ADDI_X1_X0_5,
         }
         
-        for mnemonic, instr in instructions.items():
-            decoded = self.decoder.decode(instr)
-            assert decoded.mnemonic == mnemonic
+        decoded_all = decoder.decode_many(instructions.values())
+        assert [d.mnemonic for d in decoded_all] == list(instructions)
     
-    def test_minimum_viable_logical(self):
-        """Verify all logical instructions decode correctly."""
-        # Test that we can decode AND, OR, XOR and immediate variants
-        assert True  # Covered by individual tests above
+    def test_decode_many_matches_decode(self, decoder):
+        """Verify batch decoding matches per-instruction decode and reuses repeats."""
+        program = [ADDI_X1_X0_5, LW_X4_0_X5, BEQ_X1_X2_NEG4, ADDI_X1_X0_5, JAL_X0_0]
+        
+        decoded_all = decoder.decode_many(program)
+        
+        assert [d.mnemonic for d in decoded_all] == \
+            [decoder.decode(instr).mnemonic for instr in program]
+        assert [d.immediate for d in decoded_all] == \
+            [decoder.decode(instr).immediate for instr in program]
+        assert decoded_all[0] is decoded_all[3]
+    
+    def test_decode_many_corpus(self, decoder):
+        """Verify the whole corpus decodes to its expected fields in one batch."""
+        program = [int_to_bits_unsigned(entry[0], 32) for entry in CORPUS]
+        
+        decoded_all = decoder.decode_many(program)
+        
+        assert [_corpus_fields(d) for d in decoded_all] == \
+            [entry[1:] for entry in CORPUS]
     
-    def test_minimum_viable_memory(self):
+    @pytest.mark.parametrize('instr,mnemonic', [
+        (LW_X4_0_X5, 'LW'),
+        (SW_X3_0_X5, 'SW'),
+    ])
+    def test_minimum_viable_memory(self, decoder, instr, mnemonic):
         """Verify memory instructions decode correctly."""
-        # LW
-        lw_instr = [0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,1,0,1,0,0,0,1,0,0,0,0,0,0,0,1,1]
-        decoded = self.decoder.decode(lw_instr)
-        assert decoded.mnemonic == 'LW'
-        
-        # SW
-        sw_instr = [0,0,0,0,0,0,0,0,0,0,1,1,0,0,1,0,1,0,1,0,0,0,0,0,0,0,1,0,0,0,1,1]
-        decoded = self.decoder.decode(sw_instr)
-        assert decoded.mnemonic == 'SW'
+        assert decoder.decode(instr).mnemonic == mnemonic
 
 # AI-END
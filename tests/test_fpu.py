@@ -8,9 +8,13 @@ and exception flags according to IEEE-754 standard.
 
 import pytest
 import math
+from riscsim.cpu import fpu
 from riscsim.cpu.fpu import (
-    pack_f32, unpack_f32, fadd_f32, fsub_f32, fmul_f32,
-    extract_float32_fields, pack_float32_fields, is_special_value
+    pack_f32, unpack_f32, fadd_f32, fsub_f32, fmul_f32, fmul_add_f32, fdot_f32,
+    fadd_f32_result, fmul_f32_result, fmul_add_f32_result,
+    fadd_f32_into, fmul_f32_into, FPResult,
+    extract_float32_fields, pack_float32_fields, is_special_value,
+    classify_float32, increment_bits, decrement_bits, accumulate_shifted
 )
 from riscsim.utils.bit_utils import bits_to_hex_string, hex_string_to_bits
 
@@ -138,6 +142,31 @@ class TestPackUnpack:
             recovered = unpack_f32(bits)
             assert approx_equal(recovered, val), f"Failed for {val}"
 
+    def test_pack_cache_keeps_signed_zeros_apart(self):
+        """Cached +0.0 and -0.0 must still pack to different bits."""
+        assert bits_to_hex_string(pack_f32(0.0)) == "0x00000000"
+        assert bits_to_hex_string(pack_f32(-0.0)) == "0x80000000"
+        assert bits_to_hex_string(pack_f32(0.0)) == "0x00000000"
+
+    def test_pack_cache_returns_fresh_lists(self):
+        """Mutating a packed result must not leak into later calls."""
+        bits = pack_f32(2.5)
+        bits[0] = 1
+        assert unpack_f32(pack_f32(2.5)) == 2.5
+
+    def test_unpack_accepts_repeated_bits(self):
+        """Repeated unpack of equal bit lists gives the same value."""
+        assert unpack_f32(pack_f32(0.1)) == unpack_f32(list(pack_f32(0.1)))
+
+    def test_pack_unpack_cache_hits(self):
+        """Repeated constants are served from the pack/unpack caches."""
+        pack_f32.cache_clear()
+        unpack_f32.cache_clear()
+        for _ in range(3):
+            assert unpack_f32(pack_f32(1.5)) == 1.5
+        assert pack_f32.cache_info().hits == 2
+        assert unpack_f32.cache_info().hits == 2
+
 
 class TestSpecialValues:
     """Test detection and handling of special values."""
@@ -190,6 +219,62 @@ class TestSpecialValues:
         assert is_inf is False
         assert is_nan is False
 
+    @pytest.mark.parametrize("value", [0.0, -0.0, float('inf'), float('-inf'),
+                                       float('nan'), 1.5, 1e-45])
+    def test_classify_matches_extract_and_special(self, value):
+        """classify_float32 agrees with extract_float32_fields + is_special_value."""
+        bits = pack_f32(value)
+        sign, exp, frac = extract_float32_fields(bits)
+        assert classify_float32(bits) == (sign, exp, frac) + is_special_value(exp, frac)
+
+    @pytest.mark.parametrize("value, expected", [
+        (0.0, "0x00000000"),
+        (-0.0, "0x80000000"),
+        (float('inf'), "0x7F800000"),
+        (float('-inf'), "0xFF800000"),
+        (float('nan'), "0x7FC00000"),
+        (1e39, "0x7F800000"),
+        (-1e39, "0xFF800000"),
+    ], ids=['pzero', 'nzero', 'pinf', 'ninf', 'nan', 'overflow', 'neg_overflow'])
+    def test_pack_special_patterns(self, value, expected):
+        """Special values pack to their fixed patterns as fresh lists."""
+        bits = pack_f32(value)
+        assert bits_to_hex_string(bits) == expected
+        bits[1] ^= 1
+        assert bits_to_hex_string(pack_f32(value)) == expected
+
+
+class TestExponentStepHelpers:
+    """Test the ripple helpers used for exponent and significand steps."""
+
+    @pytest.mark.parametrize("bits, expected", [
+        ([0, 0, 0, 0, 0, 0, 0, 0], [0, 0, 0, 0, 0, 0, 0, 1]),
+        ([0, 1, 1, 1, 1, 1, 1, 1], [1, 0, 0, 0, 0, 0, 0, 0]),
+        ([1, 1, 1, 1, 1, 1, 1, 1], [0, 0, 0, 0, 0, 0, 0, 0]),  # wraps
+    ])
+    def test_increment_bits(self, bits, expected):
+        """Test +1 carries through set bits and wraps at full width."""
+        assert increment_bits(bits) == expected
+
+    @pytest.mark.parametrize("bits, expected, borrow", [
+        ([0, 0, 0, 0, 0, 0, 1, 0], [0, 0, 0, 0, 0, 0, 0, 1], 0),
+        ([1, 0, 0, 0, 0, 0, 0, 0], [0, 1, 1, 1, 1, 1, 1, 1], 0),
+        ([0, 0, 0, 0, 0, 0, 0, 0], [1, 1, 1, 1, 1, 1, 1, 1], 1),  # borrow out
+    ])
+    def test_decrement_bits(self, bits, expected, borrow):
+        """Test -1 borrows through clear bits and flags borrow from zero."""
+        assert decrement_bits(bits) == (expected, borrow)
+
+    @pytest.mark.parametrize("acc, addend, end, expected, carry", [
+        ([0, 0, 0, 1, 1, 0], [1, 1], 6, [0, 0, 1, 0, 0, 1], 0),
+        ([0, 0, 1, 1, 0, 0], [1, 1], 4, [0, 1, 1, 0, 0, 0], 0),  # carry ripples up
+        ([1, 1, 1, 1, 0, 0], [0, 1], 4, [0, 0, 0, 0, 0, 0], 1),  # carry out
+    ])
+    def test_accumulate_shifted(self, acc, addend, end, expected, carry):
+        """Test the in-place shifted add used by the significand multiplier."""
+        assert accumulate_shifted(acc, addend, end) == carry
+        assert acc == expected
+
 
 class TestFloatAddition:
     """Test IEEE-754 floating-point addition."""
@@ -408,6 +493,20 @@ class TestFloatMultiplication:
         # Just check that underflow flag is set
         assert result_dict['flags']['underflow'] == 1
 
+    @pytest.mark.parametrize("a,b,expected,underflow", [
+        (-1e-20, 1e-20, -0.0, 1),                 # negative exponent: early out
+        (2.0 ** -63, 2.0 ** -64, 0.0, 1),         # biased exponent exactly 0
+        (1.5 * 2.0 ** -63, 1.5 * 2.0 ** -64,      # product >= 2 renormalizes
+         1.125 * 2.0 ** -126, 0),
+    ], ids=['negative_exp', 'zero_exp', 'renormalized'])
+    def test_mul_underflow_boundary(self, a, b, expected, underflow):
+        """Test underflow is decided on the exponent around the boundary."""
+        result_dict = fmul_f32(pack_f32(a), pack_f32(b))
+        result = unpack_f32(result_dict['result'])
+        assert result == expected
+        assert math.copysign(1.0, result) == math.copysign(1.0, expected)
+        assert result_dict['flags']['underflow'] == underflow
+
     def test_mul_fractional(self):
         """Test 0.5 * 0.25 = 0.125."""
         a = pack_f32(0.5)
@@ -416,10 +515,146 @@ class TestFloatMultiplication:
         result = unpack_f32(result_dict['result'])
         assert approx_equal(result, 0.125)
 
+    def test_mul_carry_between_partial_sums(self):
+        """Test 1.1 * 1.3 keeps carries that cross the middle of the product."""
+        result_dict = fmul_f32(pack_f32(1.1), pack_f32(1.3))
+        # Truncated float32 product 0x3FB70A3D (~1.43)
+        assert bits_to_hex_string(result_dict['result']) == "0x3FB70A3D"
+
+
+class TestFloatOpMemoization:
+    """Test that memoized FP ops behave like fresh computations."""
+
+    @pytest.mark.usefixtures('fpu_trace')
+    def test_repeat_gives_equal_independent_results(self):
+        """Repeated ops return equal values in distinct mutable objects."""
+        a, b = pack_f32(1.5), pack_f32(2.25)
+        first = fmul_f32(a, b)
+        second = fmul_f32(a, b)
+        assert first.result == second.result
+        assert first.flags == second.flags
+        first.result[0] = 1
+        first.flags['inexact'] = 1
+        first.trace.clear()
+        third = fmul_f32(a, b)
+        assert third.result == second.result
+        assert third.flags == second.flags
+        assert len(third.trace) > 0
+
+    @pytest.mark.usefixtures('fpu_trace')
+    def test_fsub_trace_not_accumulated(self):
+        """FSUB's trace entry is not added to the cached FADD result."""
+        a, b = pack_f32(5.0), pack_f32(3.0)
+        fsub_f32(a, b)
+        trace = fsub_f32(a, b).trace
+        assert sum('FSUB' in t for t in trace) == 1
+        assert not any('FSUB' in t for t in fadd_f32(a, pack_f32(-3.0)).trace)
+
+
+class TestFloatMultiplyAdd:
+    """Test the unfused multiply-then-add helper."""
+
+    def test_fmul_add_simple(self):
+        """Test 1.8 * 25.0 + 32.0 = 77.0."""
+        result_dict = fmul_add_f32(pack_f32(1.8), pack_f32(25.0), pack_f32(32.0))
+        assert approx_equal(unpack_f32(result_dict.result), 77.0, rel_tol=1e-5)
+
+    def test_fmul_add_matches_fmul_then_fadd(self):
+        """Test fmul_add is bit-identical to an fmul followed by an fadd."""
+        a, b, c = pack_f32(0.1), pack_f32(-9.8), pack_f32(3.0)
+        expected = fadd_f32(fmul_f32(a, b).result, c).result
+        assert fmul_add_f32(a, b, c).result == expected
+
+    def test_fmul_add_merges_flags(self):
+        """Test flags from the multiply step are reported."""
+        result_dict = fmul_add_f32(pack_f32(float('inf')), pack_f32(0.0), pack_f32(1.0))
+        assert result_dict.flags['invalid'] == 1
+
+
+class TestResultOnlyVariants:
+    """Test the result-only (no flags/trace) FP entry points."""
+
+    def test_result_only_matches_full(self):
+        """Test each _result variant returns the same bits as its full form."""
+        a, b, c = pack_f32(1.5), pack_f32(-0.1), pack_f32(3.0)
+        assert fadd_f32_result(a, b) == fadd_f32(a, b).result
+        assert fmul_f32_result(a, b) == fmul_f32(a, b).result
+        assert fmul_add_f32_result(a, b, c) == fmul_add_f32(a, b, c).result
+
+    def test_result_only_returns_fresh_list(self):
+        """Test mutating a returned result does not poison the cache."""
+        a, b = pack_f32(2.0), pack_f32(3.0)
+        first = fmul_f32_result(a, b)
+        first[0] = 1
+        assert unpack_f32(fmul_f32_result(a, b)) == 6.0
+
+
+class TestIntoVariants:
+    """Test the FP entry points that fill a caller-owned FPResult."""
+
+    def test_into_matches_full(self):
+        """Test _into fills the same result, flags and trace as the full form."""
+        a, b = pack_f32(1e30), pack_f32(1e30)
+        out = FPResult.empty()
+        assert fmul_f32_into(a, b, out) is out
+        assert tuple(out) == tuple(fmul_f32(a, b))
+        assert out.flags['overflow'] == 1
+
+    def test_into_reuses_packet(self):
+        """Test one packet is overwritten in place across operations."""
+        out = FPResult.empty()
+        result, flags, trace = out
+        fmul_f32_into(pack_f32(1e30), pack_f32(1e30), out)
+        fadd_f32_into(pack_f32(1.0), pack_f32(2.0), out)
+        assert out.result is result and out.flags is flags and out.trace is trace
+        assert unpack_f32(out.result) == 3.0
+        assert out.flags['overflow'] == 0
+
+        # The packet's lists are not the cached entry's
+        out.result[0] = 1
+        assert unpack_f32(fadd_f32(pack_f32(1.0), pack_f32(2.0)).result) == 3.0
+
+
+class TestFloatDotProduct:
+    """Test IEEE-754 dot product accumulation."""
+
+    def test_dot_simple(self):
+        """Test [1,2,3] . [4,5,6] = 32.0."""
+        a = [pack_f32(v) for v in (1.0, 2.0, 3.0)]
+        b = [pack_f32(v) for v in (4.0, 5.0, 6.0)]
+        result_dict = fdot_f32(a, b)
+        assert approx_equal(unpack_f32(result_dict.result), 32.0)
+        assert result_dict.flags['invalid'] == 0
+
+    def test_dot_matches_scalar_sequence(self):
+        """Test dot product is bit-identical to explicit fmul/fadd steps."""
+        a = [pack_f32(v) for v in (0.1, -2.5, 3.75)]
+        b = [pack_f32(v) for v in (7.0, 0.3, -1.25)]
+        acc = fmul_f32(a[0], b[0]).result
+        for x, y in zip(a[1:], b[1:]):
+            acc = fadd_f32(acc, fmul_f32(x, y).result).result
+        assert fdot_f32(a, b).result == acc
+
+    def test_dot_empty_is_zero(self):
+        """Test empty dot product is +0.0."""
+        assert fdot_f32([], []).result == [0] * 32
+
+    def test_dot_merges_flags(self):
+        """Test flags from any step are reported."""
+        a = [pack_f32(1.0), pack_f32(float('inf'))]
+        b = [pack_f32(1.0), pack_f32(0.0)]
+        assert fdot_f32(a, b).flags['invalid'] == 1
+
+    def test_dot_length_mismatch(self):
+        """Test mismatched vector lengths raise ValueError."""
+        with pytest.raises(ValueError):
+            fdot_f32([pack_f32(1.0)], [])
+
 
 class TestFloatTrace:
     """Test that operations produce trace output."""
 
+    @pytest.mark.usefixtures('fpu_trace')
     def test_add_produces_trace(self):
         """Test that addition produces trace information."""
         a = pack_f32(1.0)
@@ -429,6 +664,7 @@ class TestFloatTrace:
         assert len(result_dict['trace']) > 0
         assert isinstance(result_dict['trace'], list)
 
+    @pytest.mark.usefixtures('fpu_trace')
     def test_sub_produces_trace(self):
         """Test that subtraction produces trace information."""
         a = pack_f32(5.0)
@@ -439,6 +675,7 @@ class TestFloatTrace:
         # Should mention FSUB and negation
         assert any('FSUB' in str(t) for t in result_dict['trace'])
 
+    @pytest.mark.usefixtures('fpu_trace')
     def test_mul_produces_trace(self):
         """Test that multiplication produces trace information."""
         a = pack_f32(2.0)
@@ -447,6 +684,22 @@ class TestFloatTrace:
         assert 'trace' in result_dict
         assert len(result_dict['trace']) > 0
 
+    def test_trace_disabled(self, monkeypatch):
+        """With tracing off, results and flags match but no trace is built."""
+        a = pack_f32(7.25)
+        b = pack_f32(-1.125)
+        monkeypatch.setattr(fpu, '_TRACE', False)
+        untraced = [op(a, b) for op in (fadd_f32, fsub_f32, fmul_f32)]
+
+        monkeypatch.setattr(fpu, '_TRACE', True)
+        traced = [op(a, b) for op in (fadd_f32, fsub_f32, fmul_f32)]
+        for off, on in zip(untraced, traced):
+            assert off.result == on.result
+            assert off.flags == on.flags
+            assert off.trace == []
+            # A result cached while tracing was off is not reused once it is on
+            assert on.trace
+
 
 class TestExceptionFlags:
     """Test IEEE-754 exception flags."""
@@ -10,116 +10,141 @@ Date: November 2025
 # AI-BEGIN: Claude Code (Anthropic) - November 14, 2025
 # Prompt: "Create comprehensive tests for hex_loader module following Phase 1 requirements"
 
+import io
+import struct
+from pathlib import Path
+
 import pytest
-import tempfile
-import os
-from riscsim.utils.hex_loader import parse_hex_line, validate_hex_file, load_hex_file
+from riscsim.utils.hex_loader import (
+    parse_hex_line, validate_hex_file, load_hex_file, load_hex_image,
+    _parse_stream, MMAP_THRESHOLD
+)
+
+
+# Words of tests/programs/test_base.hex (see test_base.s)
+EXPECTED_TEST_BASE = (
+    0x00500093,  # addi x1, x0, 5
+    0x00A00113,  # addi x2, x0, 10
+    0x002081B3,  # add x3, x1, x2
+    0x40110233,  # sub x4, x2, x1
+    0x000102B7,  # lui x5, 0x00010
+    0x0032A023,  # sw x3, 0(x5)
+    0x0002A203,  # lw x4, 0(x5)
+    0x00418463,  # beq x3, x4, label1
+    0x00100313,  # addi x6, x0, 1 (skipped)
+    0x00200313,  # addi x6, x0, 2
+    0x0000006F,  # jal x0, 0 (infinite loop)
+)
+
+
+@pytest.fixture(scope='module')
+def hex_dir(tmp_path_factory):
+    """One directory for every .hex file this module writes."""
+    return tmp_path_factory.mktemp('hex')
+
+
+@pytest.fixture
+def hex_path(hex_dir, request):
+    """A path in hex_dir named after the requesting test (unique per test id)."""
+    return hex_dir / f"{request.node.name}.hex"
+
+
+@pytest.fixture(scope='module')
+def hex_file(hex_dir):
+    """One small .hex file on disk, shared by the path-based tests."""
+    path = hex_dir / 'simple.hex'
+    path.write_text("00500093\n00A00113\n002081B3\n")
+    return path
 
 
 class TestParseHexLine:
     """Test parsing individual hex lines."""
     
-    def test_parse_valid_hex_line(self):
-        """Test parsing valid 8-digit hex line."""
-        result = parse_hex_line("00500093")
-        assert result == 0x00500093
+    @pytest.mark.parametrize("line, expected", [
+        ("00500093", 0x00500093),
+        ("ABCDEF01", 0xABCDEF01),        # uppercase
+        ("abcdef01", 0xABCDEF01),        # lowercase
+        ("AbCdEf01", 0xABCDEF01),        # mixed case
+        ("  00500093  ", 0x00500093),    # surrounding whitespace
+        ("00000000", 0x00000000),
+        ("FFFFFFFF", 0xFFFFFFFF),
+        ("   ", None),                   # blank lines parse to None
+        ("", None),
+        (b"00500093", 0x00500093),       # bytes from a binary stream
+        (b" abcdef01\r\n", 0xABCDEF01),
+    ], ids=['valid', 'uppercase', 'lowercase', 'mixed_case', 'whitespace',
+            'all_zeros', 'all_ones', 'blank', 'empty', 'bytes', 'bytes_padded'])
+    def test_parse_valid(self, line, expected):
+        """Test parsing valid and blank lines."""
+        assert parse_hex_line(line) == expected
     
-    def test_parse_uppercase_hex(self):
-        """Test parsing uppercase hex digits."""
-        result = parse_hex_line("ABCDEF01")
-        assert result == 0xABCDEF01
-    
-    def test_parse_lowercase_hex(self):
-        """Test parsing lowercase hex digits."""
-        result = parse_hex_line("abcdef01")
-        assert result == 0xABCDEF01
-    
-    def test_parse_mixed_case_hex(self):
-        """Test parsing mixed case hex digits."""
-        result = parse_hex_line("AbCdEf01")
-        assert result == 0xABCDEF01
-    
-    def test_parse_line_with_whitespace(self):
-        """Test parsing line with leading/trailing whitespace."""
-        result = parse_hex_line("  00500093  ")
-        assert result == 0x00500093
-    
-    def test_parse_all_zeros(self):
-        """Test parsing all zeros."""
-        result = parse_hex_line("00000000")
-        assert result == 0x00000000
-    
-    def test_parse_all_ones(self):
-        """Test parsing all ones (0xFFFFFFFF)."""
-        result = parse_hex_line("FFFFFFFF")
-        assert result == 0xFFFFFFFF
-    
-    def test_parse_blank_line(self):
-        """Test parsing blank line returns None."""
-        result = parse_hex_line("   ")
-        assert result is None
-        
-        result = parse_hex_line("")
-        assert result is None
-    
-    def test_parse_invalid_length(self):
-        """Test parsing line with wrong length."""
-        with pytest.raises(ValueError, match="must be 8 digits"):
-            parse_hex_line("1234567")  # Too short
-        
-        with pytest.raises(ValueError, match="must be 8 digits"):
-            parse_hex_line("123456789")  # Too long
-    
-    def test_parse_invalid_characters(self):
-        """Test parsing line with invalid hex characters."""
-        with pytest.raises(ValueError, match="Invalid hex character"):
-            parse_hex_line("1234567G")  # G is not valid hex
-        
-        with pytest.raises(ValueError, match="Invalid hex character"):
-            parse_hex_line("1234567!")  # ! is not valid hex
+    @pytest.mark.parametrize("line, message", [
+        ("1234567", "must be 8 digits"),           # Too short
+        ("123456789", "must be 8 digits"),         # Too long
+        ("1234567G", "Invalid hex character"),     # G is not valid hex
+        ("1234567!", "Invalid hex character"),     # ! is not valid hex
+        ("1G34567!", "character 'G'"),             # first bad character reported
+        ("+1234567", "Invalid hex character"),     # int() would take a sign
+        ("12_34567", "Invalid hex character"),     # ... or an underscore
+        ("0050009\u0663", "Invalid hex character"),  # ... or a non-ASCII digit
+        ("0x001234", "character 'x'"),             # ... or a 0x prefix
+        ("0XABCDEF", "character 'X'"),
+    ], ids=['too_short', 'too_long', 'letter_g', 'punctuation', 'first_bad',
+            'sign', 'underscore', 'unicode_digit', 'prefix_lower', 'prefix_upper'])
+    def test_parse_invalid(self, line, message):
+        """Test parsing malformed lines raises ValueError."""
+        with pytest.raises(ValueError, match=message):
+            parse_hex_line(line)
 
 
 class TestValidateHexFile:
     """Test hex file validation."""
     
-    def test_validate_valid_file(self):
-        """Test validating a valid hex file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.hex', delete=False) as f:
-            f.write("00500093\n")
-            f.write("00A00113\n")
-            f.write("002081B3\n")
-            hex_file = f.name
-        
-        try:
-            assert validate_hex_file(hex_file) is True
-        finally:
-            os.unlink(hex_file)
+    def test_validate_valid_file(self, hex_file):
+        """Test validating a valid hex file on disk."""
+        assert validate_hex_file(str(hex_file)) is True
+    
+    def test_validate_valid_stream(self):
+        """Test validating a valid hex stream."""
+        stream = io.StringIO("00500093\n00A00113\n002081B3\n")
+        assert validate_hex_file(stream) is True
+    
+    def test_validate_binary_stream(self):
+        """Test validating a binary stream, including a bad line."""
+        assert validate_hex_file(io.BytesIO(b"00500093\r\n00A00113\n")) is True
+        with pytest.raises(ValueError, match="Line 2"):
+            validate_hex_file(io.BytesIO(b"00500093\n0050\xff093\n"))
     
     def test_validate_file_with_blank_lines(self):
         """Test validating file with blank lines."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.hex', delete=False) as f:
-            f.write("00500093\n")
-            f.write("\n")
-            f.write("00A00113\n")
-            hex_file = f.name
-        
-        try:
-            assert validate_hex_file(hex_file) is True
-        finally:
-            os.unlink(hex_file)
+        stream = io.StringIO("00500093\n\n00A00113\n")
+        assert validate_hex_file(stream) is True
     
     def test_validate_file_invalid_line(self):
         """Test validating file with invalid line."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.hex', delete=False) as f:
-            f.write("00500093\n")
-            f.write("INVALID!\n")  # Invalid line
-            hex_file = f.name
-        
-        try:
-            with pytest.raises(ValueError, match="Line 2"):
-                validate_hex_file(hex_file)
-        finally:
-            os.unlink(hex_file)
+        stream = io.StringIO("00500093\nINVALID!\n")  # Invalid line 2
+        with pytest.raises(ValueError, match="Line 2"):
+            validate_hex_file(stream)
+    
+    @pytest.mark.parametrize("text", [
+        "00500093\n" * 4096,                       # canonical layout
+        "00500093\r\n" * 4096,                     # CRLF line endings
+        "00500093\n" * 4095 + "00500093",          # no final newline
+        "  00500093\t\n\n" * 4096,                 # padding and blank lines
+    ], ids=['canonical', 'crlf', 'no_final_newline', 'padded'])
+    def test_validate_large_stream(self, text):
+        """Test bulk validation accepts every well-formed layout."""
+        assert validate_hex_file(io.StringIO(text)) is True
+    
+    @pytest.mark.parametrize("text, line", [
+        ("00500093\n" * 4095 + "0050009Z\n", 4096),  # canonical, bad digit
+        ("00500093\n" * 10 + "0050009\n\n", 11),     # canonical length, short word
+        ("00500093\n" * 10 + "0050 093\n", 11),      # canonical length, inner space
+    ], ids=['bad_digit', 'short_word', 'inner_space'])
+    def test_validate_large_stream_invalid(self, text, line):
+        """Test bulk validation falls back to report the first bad line."""
+        with pytest.raises(ValueError, match=f"Line {line}:"):
+            validate_hex_file(io.StringIO(text))
     
     def test_validate_nonexistent_file(self):
         """Test validating nonexistent file."""
@@ -130,147 +155,157 @@ class TestValidateHexFile:
 class TestLoadHexFile:
     """Test loading hex files."""
     
-    def test_load_simple_file(self):
-        """Test loading simple hex file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.hex', delete=False) as f:
-            f.write("00500093\n")
-            f.write("00A00113\n")
-            f.write("002081B3\n")
-            hex_file = f.name
-        
-        try:
-            words = load_hex_file(hex_file)
-            assert len(words) == 3
-            assert words[0] == 0x00500093
-            assert words[1] == 0x00A00113
-            assert words[2] == 0x002081B3
-        finally:
-            os.unlink(hex_file)
+    def test_load_simple_file(self, hex_file):
+        """Test loading simple hex file from disk."""
+        words = load_hex_file(str(hex_file))
+        assert words == [0x00500093, 0x00A00113, 0x002081B3]
+    
+    def test_load_path_object(self, hex_file):
+        """Test loading accepts a pathlib.Path."""
+        assert load_hex_file(hex_file) == [0x00500093, 0x00A00113, 0x002081B3]
+    
+    def test_load_binary_stream(self):
+        """Test loading from a binary stream (io.BytesIO)."""
+        stream = io.BytesIO(b"00500093\r\n\n00A00113\n002081B3")
+        assert load_hex_file(stream) == [0x00500093, 0x00A00113, 0x002081B3]
     
     def test_load_file_with_blank_lines(self):
         """Test loading file with blank lines (ignored)."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.hex', delete=False) as f:
-            f.write("00500093\n")
-            f.write("\n")
-            f.write("00A00113\n")
-            f.write("\n\n")
-            f.write("002081B3\n")
-            hex_file = f.name
-        
-        try:
-            words = load_hex_file(hex_file)
-            assert len(words) == 3  # Blank lines ignored
-            assert words[0] == 0x00500093
-            assert words[1] == 0x00A00113
-            assert words[2] == 0x002081B3
-        finally:
-            os.unlink(hex_file)
+        stream = io.StringIO("00500093\n\n00A00113\n\n\n002081B3\n")
+        words = load_hex_file(stream)
+        assert len(words) == 3  # Blank lines ignored
+        assert words[0] == 0x00500093
+        assert words[1] == 0x00A00113
+        assert words[2] == 0x002081B3
     
     def test_load_single_instruction(self):
         """Test loading file with single instruction."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.hex', delete=False) as f:
-            f.write("DEADBEEF\n")
-            hex_file = f.name
-        
-        try:
-            words = load_hex_file(hex_file)
-            assert len(words) == 1
-            assert words[0] == 0xDEADBEEF
-        finally:
-            os.unlink(hex_file)
+        words = load_hex_file(io.StringIO("DEADBEEF\n"))
+        assert len(words) == 1
+        assert words[0] == 0xDEADBEEF
     
     def test_load_uppercase_lowercase(self):
         """Test loading file with mixed case hex."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.hex', delete=False) as f:
-            f.write("ABCDEF01\n")
-            f.write("abcdef01\n")
-            f.write("AbCdEf01\n")
-            hex_file = f.name
-        
-        try:
-            words = load_hex_file(hex_file)
-            assert len(words) == 3
-            assert words[0] == 0xABCDEF01
-            assert words[1] == 0xABCDEF01
-            assert words[2] == 0xABCDEF01
-        finally:
-            os.unlink(hex_file)
+        words = load_hex_file(io.StringIO("ABCDEF01\nabcdef01\nAbCdEf01\n"))
+        assert len(words) == 3
+        assert words[0] == 0xABCDEF01
+        assert words[1] == 0xABCDEF01
+        assert words[2] == 0xABCDEF01
     
     def test_load_empty_file(self):
         """Test loading empty file raises error."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.hex', delete=False) as f:
-            # Write nothing
-            hex_file = f.name
-        
-        try:
-            with pytest.raises(ValueError, match="empty"):
-                load_hex_file(hex_file)
-        finally:
-            os.unlink(hex_file)
+        with pytest.raises(ValueError, match="empty"):
+            load_hex_file(io.StringIO(""))
     
     def test_load_file_only_blanks(self):
         """Test loading file with only blank lines."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.hex', delete=False) as f:
-            f.write("\n\n\n")
-            hex_file = f.name
-        
-        try:
-            with pytest.raises(ValueError, match="empty"):
-                load_hex_file(hex_file)
-        finally:
-            os.unlink(hex_file)
+        with pytest.raises(ValueError, match="empty"):
+            load_hex_file(io.StringIO("\n\n\n"))
     
     def test_load_invalid_line_length(self):
         """Test loading file with invalid line length."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.hex', delete=False) as f:
-            f.write("00500093\n")
-            f.write("123\n")  # Too short
-            hex_file = f.name
-        
-        try:
-            with pytest.raises(ValueError, match="Line 2"):
-                load_hex_file(hex_file)
-        finally:
-            os.unlink(hex_file)
+        stream = io.StringIO("00500093\n123\n")  # Line 2 too short
+        with pytest.raises(ValueError, match="Line 2"):
+            load_hex_file(stream)
     
     def test_load_nonexistent_file(self):
         """Test loading nonexistent file."""
         with pytest.raises(FileNotFoundError):
             load_hex_file("/nonexistent/file.hex")
+    
+    def test_load_large_program(self):
+        """Test the batch fast path on a large, well-formed image."""
+        count = 1 << 18
+        expected = [(i * 0x9E3779B1) & 0xFFFFFFFF for i in range(count)]
+        stream = io.StringIO("".join(f"{word:08x}\n" for word in expected))
+        assert load_hex_file(stream) == expected
+    
+    @pytest.mark.parametrize("newline", ["\n", "\r\n"], ids=['lf', 'crlf'])
+    def test_load_mapped_file(self, hex_path, newline):
+        """Test files past the mmap threshold load like small ones."""
+        count = MMAP_THRESHOLD // 8
+        expected = [(i * 0x9E3779B1) & 0xFFFFFFFF for i in range(count)]
+        hex_path.write_bytes("".join(f"{word:08X}{newline}" for word in expected).encode())
+        assert hex_path.stat().st_size >= MMAP_THRESHOLD
+        assert load_hex_file(str(hex_path)) == expected
+    
+    def test_load_mapped_file_bad_byte(self, hex_path):
+        """Test a non-ASCII byte in a mapped file is reported by line."""
+        hex_path.write_bytes(b"00500093\n" * (MMAP_THRESHOLD // 9) + b"0050009\xe9\n")
+        with pytest.raises(ValueError, match=f"Line {MMAP_THRESHOLD // 9 + 1}: Invalid hex"):
+            load_hex_file(str(hex_path))
+    
+    @pytest.mark.parametrize("text, line", [
+        ("00500093\n" * 1000 + "0050009G\n", 1001),   # bad digit, right length
+        ("00500093\n\n0050 0093\n", 3),               # split word
+        ("00500093\n002081B3 00A00113\n", 2),         # two words on a line
+    ], ids=['bad_digit', 'split_word', 'two_words'])
+    def test_load_reports_first_bad_line(self, text, line):
+        """Test a file the fast path rejects still reports the bad line."""
+        with pytest.raises(ValueError, match=f"Line {line}:"):
+            load_hex_file(io.StringIO(text))
+    
+    @pytest.mark.parametrize("text", [
+        "00500093\n00A00113\n002081B3\n",
+        "  00500093\n\n00a00113\r\n002081b3",
+    ], ids=['canonical', 'padded'])
+    def test_load_image_little_endian(self, text):
+        """Test load_hex_image returns the words packed little-endian."""
+        image = load_hex_image(io.StringIO(text))
+        assert image == struct.pack('<3I', 0x00500093, 0x00A00113, 0x002081B3)
+        assert image[:4] == bytes([0x93, 0x00, 0x50, 0x00])
+    
+    def test_load_image_errors(self):
+        """Test load_hex_image reports bad lines and empty files like load_hex_file."""
+        with pytest.raises(ValueError, match="Line 2"):
+            load_hex_image(io.StringIO("00500093\n123\n"))
+        with pytest.raises(ValueError, match="empty"):
+            load_hex_image(io.StringIO("\n\n"))
+    
+    def test_parse_stream_lines(self):
+        """Test the line parser works on any iterable of lines."""
+        assert _parse_stream(["00500093\n", "\n", "002081b3"]) == [0x00500093, 0x002081B3]
+        assert _parse_stream([]) == []
+        assert _parse_stream(io.BytesIO(b"00500093\r\n\n002081b3\n")) == [0x00500093, 0x002081B3]
+    
+    @pytest.mark.parametrize("content, expected", [
+        (b"00500093\r00A00113\r", [0x00500093, 0x00A00113]),       # CR only
+        (b"00500093\r\n00A00113\r\n", [0x00500093, 0x00A00113]),   # CRLF
+    ], ids=['cr', 'crlf'])
+    def test_load_small_file_line_endings(self, hex_path, content, expected):
+        """Test binary-mode reads still honour every newline convention."""
+        hex_path.write_bytes(content)
+        assert load_hex_file(str(hex_path)) == expected
+    
+    def test_load_file_non_ascii_reported(self, hex_path):
+        """Test a UTF-8 character in a file is reported as itself."""
+        hex_path.write_bytes("00500093\n0050009\u00e9\n".encode('utf-8'))
+        with pytest.raises(ValueError, match="Line 2: Invalid hex character '\u00e9'"):
+            load_hex_file(str(hex_path))
+
+
+@pytest.fixture(scope='module')
+def test_base_hex(hex_dir):
+    """test_base.hex written once per module from EXPECTED_TEST_BASE."""
+    path = hex_dir / 'test_base.hex'
+    path.write_text("\n".join(f"{instr:08X}" for instr in EXPECTED_TEST_BASE) + "\n")
+    return path
 
 
 class TestTestBaseHex:
     """Test loading the provided test_base.hex program."""
     
-    def test_load_test_base_program(self):
-        """Test loading test_base.hex if it exists."""
-        # Create test_base.hex with expected instructions
-        expected_instructions = [
-            0x00500093,  # addi x1, x0, 5
-            0x00A00113,  # addi x2, x0, 10
-            0x002081B3,  # add x3, x1, x2
-            0x40110233,  # sub x4, x2, x1
-            0x000102B7,  # lui x5, 0x00010
-            0x0032A023,  # sw x3, 0(x5)
-            0x0002A203,  # lw x4, 0(x5)
-            0x00418463,  # beq x3, x4, label1
-            0x00100313,  # addi x6, x0, 1 (skipped)
-            0x00200313,  # addi x6, x0, 2
-            0x0000006F,  # jal x0, 0 (infinite loop)
-        ]
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.hex', delete=False) as f:
-            for instr in expected_instructions:
-                f.write(f"{instr:08X}\n")
-            hex_file = f.name
-        
-        try:
-            words = load_hex_file(hex_file)
-            assert len(words) == len(expected_instructions)
-            for i, expected in enumerate(expected_instructions):
-                assert words[i] == expected
-        finally:
-            os.unlink(hex_file)
+    def test_load_test_base_program(self, test_base_hex):
+        """Test loading test_base.hex from disk."""
+        words = load_hex_file(str(test_base_hex))
+        assert len(words) == len(EXPECTED_TEST_BASE)
+        for i, expected in enumerate(EXPECTED_TEST_BASE):
+            assert words[i] == expected
+    
+    def test_shipped_test_base_matches(self):
+        """Test the checked-in programs/test_base.hex holds the same words."""
+        shipped = Path(__file__).parent / 'programs' / 'test_base.hex'
+        assert tuple(load_hex_file(shipped)) == EXPECTED_TEST_BASE
 
 
 # AI-END
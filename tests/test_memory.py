@@ -13,8 +13,13 @@ Date: November 2025
 import pytest
 from riscsim.cpu.memory import Memory
 from riscsim.utils.bit_utils import int_to_bits_unsigned, bits_to_int_unsigned, bits_to_hex_string
-import tempfile
-import os
+
+
+# Frequently used 32-bit addresses, built once
+ADDR_0 = int_to_bits_unsigned(0x00000000, 32)
+ADDR_4 = int_to_bits_unsigned(0x00000004, 32)
+ADDR_8 = int_to_bits_unsigned(0x00000008, 32)
+DATA_BASE = int_to_bits_unsigned(0x00010000, 32)
 
 
 class TestMemoryInitialization:
@@ -33,6 +38,20 @@ class TestMemoryInitialization:
         assert mem.size_bytes == 128 * 1024
         assert mem.base_addr == 0x00000000
     
+    def test_memory_clear(self):
+        """Test clear() zeroes contents and resets program bounds."""
+        mem = Memory(size_bytes=1024, base_addr=0x00000000)
+        addr = int_to_bits_unsigned(0x10, 32)
+        mem.write_word(addr, int_to_bits_unsigned(0xDEADBEEF, 32))
+        mem.program_start, mem.program_end = 0, 4
+        
+        mem.clear()
+        
+        assert bits_to_int_unsigned(mem.read_word(addr)) == 0
+        assert len(mem.memory) == 1024
+        assert mem.program_start is None
+        assert mem.program_end is None
+    
     def test_memory_regions(self):
         """Test instruction and data memory regions."""
         mem = Memory()
@@ -56,7 +75,7 @@ class TestWordReadWrite:
         mem = Memory()
         
         # Write word at address 0x00000000
-        addr = int_to_bits_unsigned(0x00000000, 32)
+        addr = ADDR_0
         data = int_to_bits_unsigned(0x12345678, 32)
         mem.write_word(addr, data)
         
@@ -91,7 +110,7 @@ class TestWordReadWrite:
         """Test overwriting existing word."""
         mem = Memory()
         
-        addr = int_to_bits_unsigned(0x00000000, 32)
+        addr = ADDR_0
         
         # Write first value
         data1 = int_to_bits_unsigned(0x11111111, 32)
@@ -104,6 +123,48 @@ class TestWordReadWrite:
         assert bits_to_int_unsigned(mem.read_word(addr)) == 0x22222222
 
 
+class TestIntegerWordAccess:
+    """Test integer-valued word read/write helpers."""
+    
+    def test_word_int_roundtrip(self):
+        """Test write_word_int/read_word_int agree with the bit-array API."""
+        mem = Memory(size_bytes=1024, base_addr=0x00000000)
+        mem.write_word_int(0x20, 0xDEADBEEF)
+        assert mem.read_word_int(0x20) == 0xDEADBEEF
+        assert bits_to_hex_string(mem.read_word(int_to_bits_unsigned(0x20, 32))) == "0xDEADBEEF"
+        
+        mem.write_word(int_to_bits_unsigned(0x24, 32), int_to_bits_unsigned(0x12345678, 32))
+        assert mem.read_word_int(0x24) == 0x12345678
+    
+    def test_word_int_checks(self):
+        """Test integer word access enforces bounds and alignment."""
+        mem = Memory(size_bytes=1024, base_addr=0x00000000)
+        with pytest.raises(ValueError, match="out of bounds"):
+            mem.write_word_int(1024, 0)
+        with pytest.raises(ValueError, match="not word-aligned"):
+            mem.read_word_int(0x22)
+    
+    def test_word_straddling_end_rejected(self):
+        """Test a word that would run past the end of memory is out of bounds."""
+        mem = Memory(size_bytes=1022, base_addr=0x00000000)
+        with pytest.raises(ValueError, match="out of bounds"):
+            mem.write_word_int(1020, 0xFFFFFFFF)
+        with pytest.raises(ValueError, match="out of bounds"):
+            mem.read_word(int_to_bits_unsigned(1020, 32))
+        assert len(mem.memory) == 1022
+    
+    @pytest.mark.parametrize("size_bytes", [1024, 1022], ids=['word_view', 'byte_fallback'])
+    def test_word_int_little_endian_layout(self, size_bytes):
+        """Test word writes land little-endian in the byte store either way."""
+        mem = Memory(size_bytes=size_bytes, base_addr=0x00000000)
+        mem.write_word_int(0x10, 0x11223344)
+        mem.write_word(int_to_bits_unsigned(0x14, 32), int_to_bits_unsigned(0xA1B2C3D4, 32))
+        
+        assert bytes(mem.memory[0x10:0x18]) == bytes([0x44, 0x33, 0x22, 0x11,
+                                                      0xD4, 0xC3, 0xB2, 0xA1])
+        assert mem.read_word_int(0x14) == 0xA1B2C3D4
+
+
 class TestByteReadWrite:
     """Test byte-level read/write operations."""
     
@@ -112,7 +173,7 @@ class TestByteReadWrite:
         mem = Memory()
         
         # Write byte at address 0x00000000
-        addr = int_to_bits_unsigned(0x00000000, 32)
+        addr = ADDR_0
         data = int_to_bits_unsigned(0xAB, 8)
         mem.write_byte(addr, data)
         
@@ -153,7 +214,7 @@ class TestLittleEndianOrdering:
         mem = Memory()
         
         # Write word 0x12345678 at address 0
-        addr = int_to_bits_unsigned(0x00000000, 32)
+        addr = ADDR_0
         word = int_to_bits_unsigned(0x12345678, 32)
         mem.write_word(addr, word)
         
@@ -164,7 +225,7 @@ class TestLittleEndianOrdering:
         # Address 0x02: 0x34
         # Address 0x03: 0x12 (MSB)
         
-        byte0 = mem.read_byte(int_to_bits_unsigned(0x00000000, 32))
+        byte0 = mem.read_byte(ADDR_0)
         byte1 = mem.read_byte(int_to_bits_unsigned(0x00000001, 32))
         byte2 = mem.read_byte(int_to_bits_unsigned(0x00000002, 32))
         byte3 = mem.read_byte(int_to_bits_unsigned(0x00000003, 32))
@@ -179,13 +240,13 @@ class TestLittleEndianOrdering:
         mem = Memory()
         
         # Write bytes individually
-        mem.write_byte(int_to_bits_unsigned(0x00000000, 32), int_to_bits_unsigned(0x78, 8))
+        mem.write_byte(ADDR_0, int_to_bits_unsigned(0x78, 8))
         mem.write_byte(int_to_bits_unsigned(0x00000001, 32), int_to_bits_unsigned(0x56, 8))
         mem.write_byte(int_to_bits_unsigned(0x00000002, 32), int_to_bits_unsigned(0x34, 8))
         mem.write_byte(int_to_bits_unsigned(0x00000003, 32), int_to_bits_unsigned(0x12, 8))
         
         # Read as word
-        word = mem.read_word(int_to_bits_unsigned(0x00000000, 32))
+        word = mem.read_word(ADDR_0)
         assert bits_to_int_unsigned(word) == 0x12345678
 
 
@@ -240,7 +301,7 @@ class TestAddressRangeChecking:
         mem = Memory(size_bytes=1024, base_addr=0x00000000)
         
         # First word
-        addr = int_to_bits_unsigned(0x00000000, 32)
+        addr = ADDR_0
         data = int_to_bits_unsigned(0x12345678, 32)
         mem.write_word(addr, data)
         assert bits_to_int_unsigned(mem.read_word(addr)) == 0x12345678
@@ -288,61 +349,80 @@ class TestAddressRangeChecking:
 class TestLoadProgramFromHex:
     """Test loading programs from .hex files."""
     
-    def test_load_simple_program(self):
+    def test_load_simple_program(self, tmp_path):
         """Test loading a simple program."""
-        # Create temporary hex file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.hex', delete=False) as f:
-            f.write("00500093\n")  # addi x1, x0, 5
-            f.write("00A00113\n")  # addi x2, x0, 10
-            f.write("002081B3\n")  # add x3, x1, x2
-            hex_file = f.name
-        
-        try:
-            mem = Memory()
-            mem.load_program(hex_file)
-            
-            # Verify instructions loaded
-            instr0 = mem.read_word(int_to_bits_unsigned(0x00000000, 32))
-            instr1 = mem.read_word(int_to_bits_unsigned(0x00000004, 32))
-            instr2 = mem.read_word(int_to_bits_unsigned(0x00000008, 32))
-            
-            assert bits_to_int_unsigned(instr0) == 0x00500093
-            assert bits_to_int_unsigned(instr1) == 0x00A00113
-            assert bits_to_int_unsigned(instr2) == 0x002081B3
-            
-            # Check program bounds
-            assert mem.program_start == 0x00000000
-            assert mem.program_end == 0x0000000C  # 3 words * 4 bytes
-        
-        finally:
-            os.unlink(hex_file)
-    
-    def test_load_program_with_blank_lines(self):
+        hex_file = tmp_path / "prog.hex"
+        hex_file.write_text(
+            "00500093\n"  # addi x1, x0, 5
+            "00A00113\n"  # addi x2, x0, 10
+            "002081B3\n"  # add x3, x1, x2
+        )
+        
+        mem = Memory()
+        mem.load_program(str(hex_file))
+        
+        # Verify instructions loaded
+        instr0 = mem.read_word(ADDR_0)
+        instr1 = mem.read_word(ADDR_4)
+        instr2 = mem.read_word(ADDR_8)
+        
+        assert bits_to_int_unsigned(instr0) == 0x00500093
+        assert bits_to_int_unsigned(instr1) == 0x00A00113
+        assert bits_to_int_unsigned(instr2) == 0x002081B3
+        
+        # Check program bounds
+        assert mem.program_start == 0x00000000
+        assert mem.program_end == 0x0000000C  # 3 words * 4 bytes
+    
+    def test_load_program_with_blank_lines(self, tmp_path):
         """Test loading program with blank lines."""
-        # Create temporary hex file with blank lines
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.hex', delete=False) as f:
-            f.write("00500093\n")
-            f.write("\n")  # Blank line
-            f.write("00A00113\n")
-            f.write("\n")
-            f.write("002081B3\n")
-            hex_file = f.name
-        
-        try:
-            mem = Memory()
-            mem.load_program(hex_file)
-            
-            # Verify instructions loaded (blank lines ignored)
-            instr0 = mem.read_word(int_to_bits_unsigned(0x00000000, 32))
-            instr1 = mem.read_word(int_to_bits_unsigned(0x00000004, 32))
-            instr2 = mem.read_word(int_to_bits_unsigned(0x00000008, 32))
-            
-            assert bits_to_int_unsigned(instr0) == 0x00500093
-            assert bits_to_int_unsigned(instr1) == 0x00A00113
-            assert bits_to_int_unsigned(instr2) == 0x002081B3
-        
-        finally:
-            os.unlink(hex_file)
+        hex_file = tmp_path / "prog.hex"
+        hex_file.write_text("00500093\n\n00A00113\n\n002081B3\n")  # Blank lines
+        
+        mem = Memory()
+        mem.load_program(str(hex_file))
+        
+        # Verify instructions loaded (blank lines ignored)
+        instr0 = mem.read_word(ADDR_0)
+        instr1 = mem.read_word(ADDR_4)
+        instr2 = mem.read_word(ADDR_8)
+        
+        assert bits_to_int_unsigned(instr0) == 0x00500093
+        assert bits_to_int_unsigned(instr1) == 0x00A00113
+        assert bits_to_int_unsigned(instr2) == 0x002081B3
+    
+    def test_load_program_from_bytes(self):
+        """Test loading a raw little-endian image."""
+        mem = Memory(size_bytes=1024, base_addr=0x00000000)
+        mem.load_program(bytes.fromhex('93005000' '1301a000'))
+        
+        assert mem.read_word_int(0x0) == 0x00500093
+        assert mem.read_word_int(0x4) == 0x00A00113
+        assert mem.program_start == 0x00000000
+        assert mem.program_end == 0x00000008
+    
+    def test_load_program_bytes_at_base(self):
+        """Test a raw image can be placed at another word-aligned base."""
+        mem = Memory(size_bytes=1024, base_addr=0x00000000)
+        mem.load_program(b'\x13\x00\x00\x00', base=0x100)
+        assert mem.read_word_int(0x100) == 0x00000013
+        
+        with pytest.raises(ValueError, match="does not fit"):
+            mem.load_program(bytes(8), base=1020)
+        with pytest.raises(ValueError, match="not word-aligned"):
+            mem.load_program(bytes(4), base=0x102)
+    
+    def test_load_program_from_words(self):
+        """Test loading a sequence of integer instruction words."""
+        mem = Memory(size_bytes=1024, base_addr=0x00000000)
+        mem.load_program((0x00500093, 0x00A00113, 0x002081B3), base=0x10)
+        
+        assert [mem.read_word_int(a) for a in (0x10, 0x14, 0x18)] == \
+            [0x00500093, 0x00A00113, 0x002081B3]
+        assert (mem.program_start, mem.program_end) == (0x10, 0x1C)
+        
+        with pytest.raises(ValueError, match="Invalid program word"):
+            mem.load_program([0x1_0000_0000])
 
 
 class TestInstructionDataSeparation:
@@ -353,7 +433,7 @@ class TestInstructionDataSeparation:
         mem = Memory()
         
         # Write to instruction region
-        addr = int_to_bits_unsigned(0x00000000, 32)
+        addr = ADDR_0
         data = int_to_bits_unsigned(0x12345678, 32)
         mem.write_word(addr, data)
         
@@ -365,7 +445,7 @@ class TestInstructionDataSeparation:
         mem = Memory()
         
         # Write to data region
-        addr = int_to_bits_unsigned(0x00010000, 32)
+        addr = DATA_BASE
         data = int_to_bits_unsigned(0xABCDEF00, 32)
         mem.write_word(addr, data)
         
@@ -377,12 +457,12 @@ class TestInstructionDataSeparation:
         mem = Memory()
         
         # Write to instruction region
-        i_addr = int_to_bits_unsigned(0x00000000, 32)
+        i_addr = ADDR_0
         i_data = int_to_bits_unsigned(0x11111111, 32)
         mem.write_word(i_addr, i_data)
         
         # Write to data region
-        d_addr = int_to_bits_unsigned(0x00010000, 32)
+        d_addr = DATA_BASE
         d_data = int_to_bits_unsigned(0x22222222, 32)
         mem.write_word(d_addr, d_data)
         
@@ -398,7 +478,7 @@ class TestBoundaryAddresses:
         """Test accessing first memory address."""
         mem = Memory()
         
-        addr = int_to_bits_unsigned(0x00000000, 32)
+        addr = ADDR_0
         data = int_to_bits_unsigned(0xFFFFFFFF, 32)
         mem.write_word(addr, data)
         
@@ -427,7 +507,7 @@ class TestBoundaryAddresses:
         mem.write_word(addr1, data1)
         
         # Start of data region
-        addr2 = int_to_bits_unsigned(0x00010000, 32)
+        addr2 = DATA_BASE
         data2 = int_to_bits_unsigned(0x22222222, 32)
         mem.write_word(addr2, data2)
         
@@ -444,8 +524,8 @@ class TestMemoryDump:
         mem = Memory()
         
         # Write some data
-        mem.write_word(int_to_bits_unsigned(0x00000000, 32), int_to_bits_unsigned(0x12345678, 32))
-        mem.write_word(int_to_bits_unsigned(0x00000004, 32), int_to_bits_unsigned(0xABCDEF00, 32))
+        mem.write_word(ADDR_0, int_to_bits_unsigned(0x12345678, 32))
+        mem.write_word(ADDR_4, int_to_bits_unsigned(0xABCDEF00, 32))
         
         # Dump memory
         dump = mem.dump_memory(0x00000000, 0x00000008)
@@ -81,9 +81,7 @@ class TestPhase1Integration:
         ]
         
         for addr_int, instr_int in instructions:
-            addr = int_to_bits_unsigned(addr_int, 32)
-            instr = int_to_bits_unsigned(instr_int, 32)
-            mem.write_word(addr, instr)
+            mem.write_word_int(addr_int, instr_int)
         
         # Create fetch unit and fetch instructions
         fetch = FetchUnit(mem, initial_pc=0x00000000)
@@ -104,9 +102,7 @@ class TestPhase1Integration:
         mem = Memory()
         
         # Write word to data region
-        data_addr = int_to_bits_unsigned(0x00010000, 32)
-        data_word = int_to_bits_unsigned(0xCAFEBABE, 32)
-        mem.write_word(data_addr, data_word)
+        mem.write_word_int(0x00010000, 0xCAFEBABE)
         
         # Create fetch unit starting at data region
         fetch = FetchUnit(mem, initial_pc=0x00010000)
@@ -120,14 +116,8 @@ class TestPhase1Integration:
         mem = Memory()
         
         # Write instructions at different locations
-        mem.write_word(
-            int_to_bits_unsigned(0x00000000, 32),
-            int_to_bits_unsigned(0x11111111, 32)
-        )
-        mem.write_word(
-            int_to_bits_unsigned(0x00000100, 32),
-            int_to_bits_unsigned(0x22222222, 32)
-        )
+        mem.write_word_int(0x00000000, 0x11111111)
+        mem.write_word_int(0x00000100, 0x22222222)
         
         # Start at 0x00000000
         fetch = FetchUnit(mem, initial_pc=0x00000000)
@@ -152,10 +142,8 @@ class TestPhase1Integration:
         num_instructions = 10
         
         for i in range(num_instructions):
-            addr = int_to_bits_unsigned(base_addr + i * 4, 32)
             # Use i as the instruction value for easy verification
-            instr = int_to_bits_unsigned(i * 0x01010101, 32)
-            mem.write_word(addr, instr)
+            mem.write_word_int(base_addr + i * 4, i * 0x01010101)
         
         # Fetch all instructions sequentially
         fetch = FetchUnit(mem, initial_pc=base_addr)
@@ -64,6 +64,38 @@ def test_register_file_initialization():
     assert rf.read_fcsr() == [0] * 8, "FCSR not initialized to zero"
 
 
+def test_clear_resets_all_state():
+    """Test clear() zeroes every register and the FCSR in place."""
+    rf = RegisterFile()
+    for i in range(32):
+        rf.write_int_reg(i, [1] * 32)
+        rf.write_fp_reg(i, [1] * 32)
+    rf.write_fcsr([1] * 8)
+
+    rf.clear()
+
+    assert rf.read_int_regs() == [[0] * 32] * 32
+    assert rf.read_fp_regs() == [[0] * 32] * 32
+    assert rf.read_fcsr() == [0] * 8
+
+
+def test_int_reg_int_access():
+    """Test integer-valued register read/write helpers."""
+    rf = RegisterFile()
+    rf.write_int_reg_int(5, 0xDEADBEEF)
+    assert rf.read_int_reg_int(5) == 0xDEADBEEF
+    assert rf.read_int_reg(5) == int_to_bin32(0xDEADBEEF)
+
+    rf.write_int_reg_int(6, -1)
+    assert rf.read_int_reg_int(6) == 0xFFFFFFFF
+
+    rf.write_int_reg_int(0, 42)
+    assert rf.read_int_reg_int(0) == 0
+
+    with pytest.raises(ValueError):
+        rf.read_int_reg_int(32)
+
+
 def test_x0_hardwired_to_zero():
     """Test that x0 always reads zero and writes are ignored."""
     rf = RegisterFile()
@@ -235,6 +267,20 @@ def test_invalid_bit_width_fp_reg():
         rf.write_fp_reg(10, [1] * 48)
 
 
+def test_invalid_bit_values():
+    """Test that elements other than 0/1 are rejected and leave state intact."""
+    rf = RegisterFile()
+    rf.write_int_reg(3, int_to_bin32(7))
+
+    with pytest.raises(ValueError, match="only 0/1 bits"):
+        rf.write_int_reg(3, [2] + [0] * 31)
+    with pytest.raises(ValueError, match="only 0/1 bits"):
+        rf.write_fp_reg(3, [0] * 31 + [-1])
+
+    assert bin32_to_int(rf.read_int_reg(3)) == 7
+    assert rf.read_fp_reg(3) == [0] * 32
+
+
 def test_invalid_fcsr_width():
     """Test that wrong bit width for FCSR raises ValueError."""
     rf = RegisterFile()
@@ -410,6 +456,47 @@ def test_bulk_operations_all_fp_registers():
         assert actual == expected, f"f{i} has wrong value"
 
 
+def test_bulk_int_regs_roundtrip():
+    """Test write_int_regs/read_int_regs move a run of registers at once."""
+    rf = RegisterFile()
+    values = [int_to_bin32(i * 1000) for i in range(32)]
+
+    rf.write_int_regs(0, values)
+
+    # x0 stays zero; every other register holds its value
+    assert rf.read_int_regs() == [[0] * 32] + values[1:]
+    assert rf.read_int_regs(5, 3) == values[5:8]
+    assert rf.read_int_reg(31) == values[31]
+
+
+def test_bulk_fp_regs_roundtrip():
+    """Test write_fp_regs/read_fp_regs move a run of registers at once."""
+    rf = RegisterFile()
+    values = [int_to_bin32(i * 2000) for i in range(4)]
+
+    rf.write_fp_regs(28, values)
+
+    assert rf.read_fp_regs(28) == values
+    assert rf.read_fp_reg(30) == values[2]
+
+
+def test_bulk_regs_validation():
+    """Test bulk register access rejects bad ranges and widths."""
+    rf = RegisterFile()
+
+    with pytest.raises(ValueError):
+        rf.write_int_regs(31, [[0] * 32, [0] * 32])
+    with pytest.raises(ValueError):
+        rf.read_fp_regs(30, 5)
+    with pytest.raises(ValueError):
+        rf.write_fp_regs(0, [[0] * 31])
+
+    # A failed bulk write leaves the registers untouched
+    with pytest.raises(ValueError):
+        rf.write_int_regs(1, [[1] * 32, [0] * 16])
+    assert rf.read_int_reg(1) == [0] * 32
+
+
 def test_stress_repeated_operations():
     """Stress test with many repeated operations."""
     rf = RegisterFile()